@@ -24,9 +24,23 @@ int seuilFumee = 0;
 // Configuration du capteur SI1145
 Adafruit_SI1145 si1145;
 
+// Protocole d'envoi : 1 = trames binaires compactes (24 octets par mesure), 0 = lignes de texte
+// Les deux formats sont reconnus par l'application (voir src/services/binary_frame.py)
+#define PROTOCOLE_BINAIRE 0
+#define ID_APPAREIL 0        // 0 : seul appareil de la liaison ; 1 à 255 pour plusieurs appareils sur un même XBee
+#define VERSION_TRAME 1
+#define TAILLE_TRAME 24
+#define VALEUR_ABSENTE 0xFFFF
+#define VALEUR_ABSENTE_SIGNEE -32768
+
 // Variables pour le timer non bloquant
 unsigned long previousMillis = 0;
+#if PROTOCOLE_BINAIRE
+const long interval = 250;  // Intervalle de lecture : une trame ne prend que 25 ms à 9600 bauds
+#else
 const long interval = 2000; // Intervalle de lecture : 2 secondes
+#endif
+uint16_t sequence = 0;      // Numéro de séquence des trames (reboucle à 0)
 
 void setup() {
   // Initialisation de la communication série avec l'XBee
@@ -70,6 +84,11 @@ void loop() {
   if (currentMillis - previousMillis >= interval) {
     previousMillis = currentMillis;
 
+#if PROTOCOLE_BINAIRE
+    envoyerTrame();
+    return;
+#endif
+
     // Lecture du BME680
     if (!bme.performReading()) {
       envoyerDonnees("Erreur: Lecture BME680 échouée !");
@@ -117,6 +136,51 @@ long lireDistance() {
   return sommeDistance / nombreLectures;
 }
 
+// Écrit un entier 16 bits en little-endian
+void ecrireU16(uint8_t *trame, uint8_t &position, uint16_t valeur) {
+  trame[position++] = valeur & 0xFF;
+  trame[position++] = valeur >> 8;
+}
+
+// CRC16-CCITT (polynôme 0x1021, valeur initiale 0xFFFF)
+uint16_t crc16(const uint8_t *donnees, uint8_t longueur) {
+  uint16_t crc = 0xFFFF;
+  for (uint8_t i = 0; i < longueur; i++) {
+    crc ^= (uint16_t)donnees[i] << 8;
+    for (uint8_t bit = 0; bit < 8; bit++) {
+      crc = (crc & 0x8000) ? (crc << 1) ^ 0x1021 : crc << 1;
+    }
+  }
+  return crc;
+}
+
+// Lit tous les capteurs et envoie une trame binaire :
+// synchro A5 5A, version, appareil, séquence, 8 mesures à largeur fixe, CRC16
+void envoyerTrame() {
+  uint8_t trame[TAILLE_TRAME];
+  uint8_t position = 0;
+  trame[position++] = 0xA5;
+  trame[position++] = 0x5A;
+  trame[position++] = VERSION_TRAME;
+  trame[position++] = ID_APPAREIL;
+  ecrireU16(trame, position, sequence++);
+
+  bool bmeOk = bme.performReading();
+
+  ecrireU16(trame, position, analogRead(pinMQ135));            // Qualité de l'air (valeur brute du MQ135)
+  ecrireU16(trame, position, lireDistance());                  // Distance en cm
+  ecrireU16(trame, position, si1145.readVisible());            // Luminosité visible
+  ecrireU16(trame, position, si1145.readUV());                 // Indice UV x 100
+  ecrireU16(trame, position, si1145.readIR());                 // Infrarouge
+  ecrireU16(trame, position, bmeOk ? (int16_t)(bme.temperature * 100) : VALEUR_ABSENTE_SIGNEE);  // °C x 100
+  ecrireU16(trame, position, bmeOk ? (uint16_t)(bme.pressure / 10) : VALEUR_ABSENTE);            // hPa x 10
+  ecrireU16(trame, position, bmeOk ? (uint16_t)(bme.humidity * 100) : VALEUR_ABSENTE);           // % x 100
+
+  // Le CRC couvre les octets entre la synchro et le CRC
+  ecrireU16(trame, position, crc16(trame + 2, TAILLE_TRAME - 4));
+  Serial.write(trame, TAILLE_TRAME);
+}
+
 void envoyerDonnees(String message) {
   Serial.println(message);
   delay(1500);
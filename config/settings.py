@@ -1,3 +1,4 @@
+import os;
 from urllib.parse import urlparse;
 
 
@@ -25,12 +26,135 @@ DB_CONFIG = {
 };
 
 
+# Paramètres du pool de connexions à la base de données
+DB_POOL_CONFIG = {
+    'pool_size': 4,                 # Nombre maximum de connexions ouvertes simultanément
+    'checkout_timeout': 5.0,        # Délai maximum (s) d'attente d'une connexion libre
+    'health_check_idle': 30.0,      # Inactivité (s) au-delà de laquelle une connexion est vérifiée avant usage
+    'probe_interval': 10.0,         # Période (s) de vérification de la connexion en arrière-plan
+    'statement_cache_size': 32,     # Nombre de requêtes préparées conservées par connexion
+    'reconnect_delay': 0.5,         # Premier délai (s) avant une nouvelle tentative de connexion
+    'reconnect_max_delay': 30.0     # Délai (s) maximum entre deux tentatives (croissance exponentielle)
+};
+
+
+# Paramètres de l'écriture groupée en base de données
+DB_WRITER_CONFIG = {
+    'batch_size': 50,       # Nombre de lignes déclenchant l'écriture d'un lot
+    'max_delay': 1.0,       # Délai maximum (s) avant l'écriture d'un lot incomplet
+    'queue_size': 10000     # Nombre maximum de lignes en attente
+};
+
+
+# Détection de changement : une lecture n'est enregistrée et affichée que si une métrique
+# a varié de plus que sa bande morte, ou si le battement de cœur est échu
+CHANGE_FILTER_CONFIG = {
+    'enabled': True,
+    'heartbeat': 60.0,      # Délai (s) après lequel une lecture inchangée est tout de même publiée
+    'deadbands': {          # Par métrique : 'absolute' (unité de la métrique) et/ou 'relative' (fraction de la dernière valeur publiée)
+        'air_quality': {'relative': 0.02},
+        'distance': {'absolute': 0.01},
+        'luminosity': {'relative': 0.02},
+        'uv_index': {'absolute': 0.05},
+        'ir_value': {'relative': 0.02},
+        'temperature': {'absolute': 0.1},
+        'pressure': {'absolute': 1},
+        'humidity': {'absolute': 1}
+    }
+};
+
+
+# Paramètres des tables de rollup (agrégats par minute, heure et jour)
+ROLLUP_CONFIG = {
+    'enabled': True,                # Mise à jour des rollups à chaque insertion
+    'timeframe_rollups': ('week', 'month'),  # Périodes lues depuis un rollup ('hour' et 'day' restent en lignes brutes)
+    'timeframe_min_buckets': 100,   # Buckets minimum pour lire une série depuis un rollup plutôt que les lignes brutes
+    'aggregate_min_buckets': 24     # Buckets minimum pour calculer une moyenne depuis un rollup
+};
+
+
+# Paramètres du sous-échantillonnage des séries
+DOWNSAMPLING_CONFIG = {
+    'lttb_oversampling': 8          # Points candidats lus par point retenu par LTTB
+};
+
+
+# Paramètres des lectures en flux (curseur non mis en mémoire tampon)
+STREAM_CONFIG = {
+    'chunk_size': 1000              # Nombre de lignes lues par paquet
+};
+
+
+# Paramètres de la consultation des tables
+TABLE_BROWSER_CONFIG = {
+    'page_size': 100,               # Nombre de lignes par page
+    'max_rows': 10000               # Lignes conservées sur la première page lorsque le rafraîchissement y ajoute les nouvelles
+};
+
+
+# Paramètres du spool local (lectures en attente lorsque MySQL est injoignable)
+SPOOL_CONFIG = {
+    'path': os.path.join('data', 'spool.sqlite3'),  # Fichier SQLite (journal WAL)
+    'replay_batch_size': 500                        # Nombre de lignes réécrites dans MySQL par lot
+};
+
+
+# Paramètres de lecture des ports série
+SERIAL_CONFIG = {
+    'read_size': 4096,          # Nombre maximum d'octets lus par appel à read()
+    'read_timeout': 0.2,        # Délai (s) après lequel read() rend la main sans données
+    'max_frame_size': 8192,     # Taille maximale d'une ligne avant abandon du tampon
+    'binary_frames': True       # Reconnaître les trames binaires (voir binary_frame.py) en plus des lignes de texte
+};
+
+
+# Statistiques de réception des liaisons série (affichées dans les paramètres)
+LINK_STATS_CONFIG = {
+    'histogram_bounds': (10, 50, 100, 250, 500, 1000, 2000, 5000),  # Bornes (ms) des classes d'intervalles entre deux lectures
+    'max_sequence_gap': 1000,   # Saut de séquence (avant ou arrière) au-delà duquel l'appareil est considéré redémarré
+    'resync_after': 3,          # Trames en retard consécutives après lesquelles la séquence est resynchronisée
+    'refresh_interval': 1000    # ms, période de rafraîchissement de l'affichage
+};
+
+
+# Paramètres de la boucle d'acquisition asyncio
+INGEST_CONFIG = {
+    'executor_workers': 4,      # Threads pour les appels bloquants (base de données, ouverture de ports)
+    'port_init_delay': 2.0,     # Délai (s) laissé à l'Arduino/XBee pour s'initialiser à l'ouverture
+    'read_interval': 1.0,       # Période (s) de lecture du tableau de bord
+    'command_timeout': 1.0      # Délai (s) d'attente d'une réponse après une commande
+};
+
+
+# Paramètres des journaux (niveaux : 'DEBUG', 'INFO', 'WARNING', 'ERROR')
+LOGGING_CONFIG = {
+    'level': 'INFO',                # Niveau par défaut
+    'levels': {                     # Niveau par module (préfixe du nom de module)
+        'src.services': 'INFO',
+        'src.database': 'INFO',
+        'src.controllers': 'INFO'
+    },
+    'format': '%(asctime)s %(levelname)s %(name)s: %(message)s',
+    'stream': True,                 # Écrire sur la sortie d'erreur
+    'file': os.path.join('data', 'app.log'),  # Fichier texte à rotation (None pour désactiver)
+    'json_file': None,              # Fichier JSON lines à rotation (None pour désactiver)
+    'file_max_bytes': 1000000,      # Taille (octets) déclenchant la rotation
+    'file_backups': 3,              # Nombre d'anciens fichiers conservés
+    'console_level': 'INFO'         # Niveau minimum affiché dans la console de l'application
+};
+
+
 # Paramètres de l'interface
 UI_CONFIG = {
     'window_title': 'Tableau de bord des capteurs',
     'window_size': '900x700',  # Taille augmentée pour une meilleure lisibilité
     'update_interval': 500,    # ms
     'demo_interval': 2000,     # ms
+    'bridge_interval': 50,     # ms, période de vidage des mises à jour venant des threads
+    'frame_rate': 10,          # Rafraîchissements par seconde maximum des valeurs du tableau de bord
+    'console_max_lines': 1000, # Lignes conservées dans la console
+    'console_flush_interval': 200,  # ms, période d'écriture des messages dans la console
+    'table_margin_rows': 5,    # Lignes créées en plus de celles visibles dans les tableaux
     'appearance_mode': 'dark',  # Mode d'apparence (light ou dark)
     'color_theme': 'blue',      # Thème de couleur
     'padding': {
@@ -1,7 +1,8 @@
 import customtkinter as ctk
+import logging
 import sys
 from src.app import SensorDashboardApp
-from src.database.connection import DatabaseConnection
+from src.utils.log_setup import configureLogging
 
 # Vérifier la disponibilité des modules
 try:
@@ -10,17 +11,15 @@ except Exception as e:
     serialAvailable = False
     serialErrorMessage = str(e)
 
-# Tentative de connexion à MySQL
-db = DatabaseConnection()
-mysqlAvailable = db.isConnected()
-mysqlErrorMessage = db.errorMessage if not mysqlAvailable else ''
-
 # Configuration de CustomTkinter
 ctk.set_appearance_mode("light")  # Mode clair
 ctk.set_default_color_theme("blue")  # Thème bleu
 
 # Fonction principale de l'application.
 def main():
+    # Configurer les journaux avant de créer les services
+    configureLogging()
+    
     # Créer la fenêtre racine
     root = ctk.CTk()
     
@@ -35,7 +34,7 @@ def main():
         app.stop()
     except Exception as e:
         # Afficher les erreurs
-        print(f"Erreur: {str(e)}")
+        logging.getLogger(__name__).exception("Erreur: %s", e)
         app.stop()
     
     return 0
@@ -4,6 +4,7 @@ CREATE DATABASE serv-projet;
 CREATE TABLE `serv-projet`.sensor_data (
     id INT AUTO_INCREMENT PRIMARY KEY,
     timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    device_id VARCHAR(64) NULL,      -- Identifiant de l'appareil source (port série / XBee)
     -- Données des capteurs
     air_quality INT NULL,            -- Qualité de l'air (valeur agrégée) en PPM
     distance DECIMAL(5,2) NULL,      -- Distance (HC-SR04) en mètres
@@ -20,6 +21,33 @@ CREATE TABLE `serv-projet`.sensor_data (
 -- Index pour accélérer les requêtes par date
 CREATE INDEX idx_sensor_data_timestamp ON sensor_data (timestamp);
 
+-- Index pour les requêtes par appareil en mode multi-ports
+CREATE INDEX idx_sensor_data_device ON sensor_data (device_id, timestamp);
+
+-- Tables de rollup : agrégats par minute, heure et jour, mis à jour à chaque insertion
+-- (une ligne par bucket, appareil et métrique ; moyenne = sum_value / cnt,
+--  écart-type = SQRT(sumsq_value / cnt - POW(sum_value / cnt, 2)))
+CREATE TABLE `serv-projet`.sensor_rollup_minute (
+    bucket_start DATETIME NOT NULL,           -- Début du bucket
+    device_id VARCHAR(64) NOT NULL DEFAULT '', -- Appareil source ('' si inconnu)
+    metric VARCHAR(32) NOT NULL,              -- Nom de la colonne de sensor_data
+    cnt INT NOT NULL,                         -- Nombre de valeurs
+    sum_value DOUBLE NOT NULL,                -- Somme des valeurs
+    min_value DOUBLE NOT NULL,                -- Valeur minimale
+    max_value DOUBLE NOT NULL,                -- Valeur maximale
+    sumsq_value DOUBLE NOT NULL,              -- Somme des carrés des valeurs
+    PRIMARY KEY (bucket_start, device_id, metric)
+);
+
+CREATE TABLE `serv-projet`.sensor_rollup_hour LIKE `serv-projet`.sensor_rollup_minute;
+CREATE TABLE `serv-projet`.sensor_rollup_day LIKE `serv-projet`.sensor_rollup_minute;
+
+-- Migration d'une base existante
+-- ALTER TABLE sensor_data ADD COLUMN device_id VARCHAR(64) NULL AFTER timestamp;
+-- CREATE INDEX idx_sensor_data_device ON sensor_data (device_id, timestamp);
+-- Les tables de rollup vides sont remplies depuis sensor_data au démarrage de l'application
+-- (QueryManager.backfillRollups) ; QueryManager.rebuildRollups() force un recalcul complet
+
 -- Exemples d'insertion de données
 -- INSERT INTO sensor_data (air_quality,  distance, luminosity, uv_index, ir_value, temperature, pressure, humidity, raw_data)
 -- VALUES (800, 8.34, 16.75, 2.5, 800, 0.34, 348, 24.5, 1010, 65, 'AQ:800,DIST:2.5,LUM:800,UV:0.34,IR:348,TEMP:24.5,PRESS:1010,HUM:65');
@@ -52,4 +80,16 @@ CREATE INDEX idx_sensor_data_timestamp ON sensor_data (timestamp);
 --     AVG(humidity) as avg_humidity
 -- FROM sensor_data
 -- GROUP BY DATE(timestamp)
+-- ORDER BY date DESC;
+
+-- 4. Même résultat depuis le rollup journalier (une ligne par jour et par métrique, sans parcourir sensor_data)
+-- SELECT 
+--     bucket_start as date,
+--     metric,
+--     MIN(min_value) as min_value,
+--     MAX(max_value) as max_value,
+--     SUM(sum_value) / SUM(cnt) as avg_value
+-- FROM sensor_rollup_day
+-- WHERE metric IN ('temperature', 'uv_index', 'humidity')
+-- GROUP BY bucket_start, metric
 -- ORDER BY date DESC; 
\ No newline at end of file
@@ -1,5 +1,8 @@
+import logging
 import customtkinter as ctk
 import os
+import sys
+import threading
 
 from config.settings import COLOR_PALETTE
 from src.views.dashboard_view import DashboardView
@@ -11,7 +14,9 @@ from src.controllers.settings_controller import SettingsController
 from src.services.sensor_service import SensorService
 from src.database.connection import DatabaseConnection
 from src.database.query_manager import QueryManager
-from src.utils.helpers import ConsoleRedirector
+from src.utils.log_setup import attachConsole
+
+log = logging.getLogger(__name__)
 
 # Classe principale de l'application de tableau de bord des capteurs.
 class SensorDashboardApp:
@@ -26,6 +31,10 @@ class SensorDashboardApp:
         self.root.geometry("1200x800")
         self.root.minsize(800, 600)
         
+        # Arrêter proprement l'application (écriture des lectures en attente) à la fermeture de la fenêtre
+        self.stopped = False
+        self.root.protocol("WM_DELETE_WINDOW", self.stop)
+        
         # Configurer la grille principale
         self.root.grid_columnconfigure(0, weight=1)
         self.root.grid_rowconfigure(0, weight=1)
@@ -33,17 +42,16 @@ class SensorDashboardApp:
         # Charger les polices Museo
         self.museoFonts = self.loadMuseoFonts()
         
-        # Initialiser les services
+        # Initialiser les services (un seul pool de connexions partagé par toute l'application)
         self.dbConnection = DatabaseConnection()
         
         # Vérifier si la connexion à la base de données est établie
-        if self.dbConnection.isConnected():
-            self.queryManager = QueryManager(self.dbConnection)
-        else:
-            self.queryManager = QueryManager(None)
-            print("Attention: Connexion à la base de données non établie. Certaines fonctionnalités seront limitées.")
+        if not self.dbConnection.isConnected():
+            log.warning("Attention: Connexion à la base de données non établie. Certaines fonctionnalités seront limitées.")
+        self.queryManager = QueryManager(self.dbConnection)
+        self.backfillRollups()
             
-        self.sensorService = SensorService()
+        self.sensorService = SensorService(self.dbConnection)
         
         # Variables pour le mode démo
         self.demoActive = False
@@ -64,7 +72,7 @@ class SensorDashboardApp:
         
         # Vérifier si le dossier existe
         if not os.path.exists(museoDir):
-            print(f"Attention: Le dossier {museoDir} n'existe pas.")
+            log.warning("Attention: Le dossier %s n'existe pas.", museoDir)
             return museoFonts
             
         # Charger les polices Museo
@@ -97,9 +105,9 @@ class SensorDashboardApp:
                 self.root.tk.call('font', 'create', 'MuseoSans_900', '-family', 'MuseoSans', '-weight', 'bold')
                 museoFonts['black'] = 'MuseoSans_900'
                 
-            print("Polices Museo chargées avec succès.")
+            log.info("Polices Museo chargées avec succès.")
         except Exception as e:
-            print(f"Erreur lors du chargement des polices Museo: {e}")
+            log.error("Erreur lors du chargement des polices Museo: %s", e)
             
         return museoFonts
     
@@ -230,7 +238,10 @@ class SensorDashboardApp:
             self.tablesFrame, 
             self.museoFonts, 
             onTableSelect=self.onTableSelect, 
-            onRefreshTables=self.refreshTablesList
+            onRefreshTables=self.refreshTablesList,
+            onPreviousPage=self.previousTablePage,
+            onNextPage=self.nextTablePage,
+            onJumpToTime=self.jumpToTableTime
         )
         self.settingsView = SettingsView(
             self.settingsFrame,
@@ -238,7 +249,8 @@ class SensorDashboardApp:
             onConnectPort=self.connectToPort,
             onRefreshPorts=self.refreshPorts,
             onConnectDb=self.connectToDb,
-            onDisconnectDb=self.disconnectFromDb
+            onDisconnectDb=self.disconnectFromDb,
+            onConnectAllPorts=self.connectToAllPorts
         )
         
         # Créer les contrôleurs
@@ -257,8 +269,12 @@ class SensorDashboardApp:
             self.sensorService
         )
         
-        # Rediriger la sortie console vers la console de l'application
-        self.consoleRedirector = ConsoleRedirector(self.dashboardView.console)
+        # Afficher les journaux dans la console de l'application et y rediriger
+        # la sortie standard (les messages restent aussi écrits sur la sortie d'origine)
+        self.consoleHandler = attachConsole(self.dashboardView.consoleSink)
+        self.stdout = sys.stdout
+        self.dashboardView.consoleSink.passthrough = self.stdout
+        sys.stdout = self.dashboardView.consoleSink
         
         # Initialiser les données des tables si la connexion est établie
         if self.dbConnection.isConnected():
@@ -362,10 +378,22 @@ class SensorDashboardApp:
     def onTableSelect(self, tableName):
         self.tableController.loadTableData(tableName)
     
+    # Affiche les lignes plus récentes de la table sélectionnée.
+    def previousTablePage(self):
+        self.tableController.previousPage()
+    
+    # Affiche les lignes plus anciennes de la table sélectionnée.
+    def nextTablePage(self):
+        self.tableController.nextPage()
+    
+    # Positionne la table sélectionnée à une date.
+    def jumpToTableTime(self, text):
+        self.tableController.jumpToTime(text)
+    
     # Rafraîchit la liste des tables.
     def refreshTablesList(self):
         if not self.dbConnection.isConnected():
-            print("Impossible de rafraîchir la liste des tables : connexion à la base de données non établie")
+            log.warning("Impossible de rafraîchir la liste des tables : connexion à la base de données non établie")
             return
             
         self.tableController.refreshTablesList()
@@ -374,6 +402,10 @@ class SensorDashboardApp:
     def connectToPort(self):
         self.settingsController.connectToPort()
     
+    # Connecte ou déconnecte tous les ports série disponibles.
+    def connectToAllPorts(self):
+        self.settingsController.connectAllPorts()
+    
     # Rafraîchit la liste des ports série disponibles.
     def refreshPorts(self):
         self.settingsController.refreshPorts()
@@ -385,6 +417,12 @@ class SensorDashboardApp:
         # Rafraîchir la liste des tables si la connexion est établie
         if self.dbConnection.isConnected():
             self.refreshTablesList()
+            self.backfillRollups()
+    
+    # Remplit en arrière-plan les tables de rollup encore vides (base créée ou migrée)
+    def backfillRollups(self):
+        if self.dbConnection.isConnected():
+            threading.Thread(target=self.queryManager.backfillRollups, daemon=True).start()
     
     # Se déconnecte de la base de données.
     def disconnectFromDb(self):
@@ -414,24 +452,36 @@ class SensorDashboardApp:
     
     # Arrête l'application proprement.
     def stop(self):
+        # Ne pas arrêter deux fois (fermeture de la fenêtre puis interruption)
+        if self.stopped:
+            return
+        self.stopped = True
+        
         # Arrêter la lecture des données
         self.dashboardController.stopDataReading()
         
-        # Arrêter le rafraîchissement automatique des tables
+        # Arrêter le rafraîchissement automatique des tables et du diagnostic
         self.tableController.stopAutoRefresh()
+        self.settingsController.stopStatsRefresh()
+        
+        # Fermer les liaisons, écrire les lectures en attente et arrêter la boucle d'acquisition
+        self.sensorService.shutdown()
         
         # Fermer la connexion à la base de données
         self.dbConnection.disconnect()
         
+        # Rendre la sortie standard et retirer la console des journaux avant de la détruire
+        sys.stdout = self.stdout
+        logging.getLogger().removeHandler(self.consoleHandler)
+        self.dashboardView.consoleSink.close()
+        
         # Fermer la fenêtre
         self.root.destroy()
     
     # Démarre la lecture des données des capteurs.
     def startDataReading(self):
         self.dashboardController.startDataReading()
-        self.dashboardView.logToConsole("Lecture des données démarrée")
     
     # Arrête la lecture des données des capteurs.
     def stopDataReading(self):
-        self.dashboardController.stopDataReading()
-        self.dashboardView.logToConsole("Lecture des données arrêtée") 
\ No newline at end of file
+        self.dashboardController.stopDataReading() 
\ No newline at end of file
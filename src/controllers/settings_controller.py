@@ -1,4 +1,8 @@
+import logging
 import serial.tools.list_ports
+from config.settings import LINK_STATS_CONFIG
+
+log = logging.getLogger(__name__)
 
 # Contrôleur pour la gestion des paramètres de l'application
 class SettingsController:
@@ -19,6 +23,24 @@ class SettingsController:
         
         # Rafraîchir la liste des ports
         self.refreshPorts()
+        
+        # Rafraîchir périodiquement le diagnostic de réception
+        self.statsJob = None
+        self.refreshStats()
+    
+    # Affiche les statistiques de réception et replanifie le rafraîchissement
+    def refreshStats(self):
+        try:
+            self.view.updateStats(self.sensorService.getStats())
+        except Exception as e:
+            log.error("Erreur lors de la lecture des statistiques: %s", e)
+        self.statsJob = self.view.parent.after(LINK_STATS_CONFIG['refresh_interval'], self.refreshStats)
+    
+    # Arrête le rafraîchissement du diagnostic
+    def stopStatsRefresh(self):
+        if self.statsJob is not None:
+            self.view.parent.after_cancel(self.statsJob)
+            self.statsJob = None
     
     # Met à jour le statut des connexions
     def updateConnectionStatus(self):
@@ -50,7 +72,7 @@ class SettingsController:
             # Utiliser pyserial pour lister les ports
             ports = [port.device for port in serial.tools.list_ports.comports()]
         except Exception as e:
-            print(f"Erreur lors de la récupération des ports: {str(e)}")
+            log.error("Erreur lors de la récupération des ports: %s", e)
         
         return ports
     
@@ -67,12 +89,27 @@ class SettingsController:
                 success = self.sensorService.connect(port)
                 self.view.updateSerialStatus(success, port if success else None)
             else:
-                print("Aucun port sélectionné")
+                log.warning("Aucun port sélectionné")
+    
+    # Connecte ou déconnecte tous les ports disponibles (mode multi-liaisons)
+    def connectAllPorts(self):
+        if self.sensorService.links:
+            # Déconnexion de toutes les liaisons
+            self.sensorService.disconnectAll()
+        else:
+            # Une liaison par port disponible, chacune avec son lecteur
+            ports = self.getAvailablePorts()
+            if ports:
+                self.sensorService.connectAll(ports)
+            else:
+                log.warning("Aucun port disponible")
+        
+        self.view.updateLinksStatus(self.sensorService.getLinks())
     
     # Se connecte à la base de données avec les paramètres fournis
     def connectToDb(self):
         if self.dbConnection.isConnected():
-            print("Déjà connecté à la base de données")
+            log.warning("Déjà connecté à la base de données")
             return
         
         # Récupérer la configuration de la base de données
@@ -92,7 +129,7 @@ class SettingsController:
     # Se déconnecte de la base de données
     def disconnectFromDb(self):
         if not self.dbConnection.isConnected():
-            print("Pas de connexion à la base de données")
+            log.warning("Pas de connexion à la base de données")
             return
         
         # Se déconnecter de la base de données
@@ -1,5 +1,10 @@
+import logging
 import threading
-import time
+from datetime import datetime
+from config.settings import TABLE_BROWSER_CONFIG
+from src.utils.tk_bridge import TkBridge
+
+log = logging.getLogger(__name__)
 
 # Contrôleur pour la gestion des tables de la base de données
 class TableController:
@@ -13,25 +18,154 @@ class TableController:
         self.view = view
         self.queryManager = queryManager
         
+        # Les mises à jour de la vue venant du thread de rafraîchissement passent par le thread Tk
+        self.ui = TkBridge(view.parent)
+        
         # Variables pour le rafraîchissement automatique
         self.refreshActive = False
         self.refreshInterval = 5000  # 5 secondes par défaut
         self.refreshJob = None
         self.stopRefresh = threading.Event()
+        
+        # Pagination sur la clé primaire de la table affichée
+        self.pageSize = TABLE_BROWSER_CONFIG['page_size']
+        self.currentTable = None
+        self.keyPositions = []  # Positions des colonnes de la clé primaire dans les lignes
+        self.firstKey = None    # Clé de la première ligne affichée (la plus récente)
+        self.lastKey = None     # Clé de la dernière ligne affichée (la plus ancienne)
+        self.atNewest = True    # La page affichée est celle des lignes les plus récentes
+        self.rows = []          # Lignes affichées, les plus récentes en premier
     
     # Rafraîchit la liste des tables
     def refreshTablesList(self):
         tables = self.queryManager.getTablesList()
         self.view.updateTablesList(tables)
 
-    # Charge les données d'une table
+    # Charge les données d'une table (page des lignes les plus récentes)
     def loadTableData(self, tableName):
         """   
         Args:
             tableName: Nom de la table à charger
         """
-        columns, rows = self.queryManager.getTableData(tableName)
-        self.view.updateTableData(tableName, columns, rows)
+        self.currentTable = tableName
+        try:
+            columns, keyColumns, timeColumn = self.queryManager.getTableSchema(tableName)
+            self.keyPositions = [columns.index(col) for col in keyColumns]
+        except Exception as e:
+            log.error("Erreur lors de la lecture du schéma de la table: %s", e)
+            self.keyPositions = []
+        
+        columns, rows = self.queryManager.getTablePage(tableName, limit=self.pageSize)
+        self._showPage(columns, rows, atNewest=True)
+    
+    # Affiche la page suivante (lignes plus anciennes)
+    def nextPage(self):
+        if self.currentTable is None or self.lastKey is None:
+            return
+        
+        columns, rows = self.queryManager.getTablePage(self.currentTable, self.lastKey, 'older', limit=self.pageSize)
+        if not rows:
+            self.view.updatePageStatus(not self.atNewest, False, "Fin de la table")
+            return
+        self._showPage(columns, rows, atNewest=False)
+    
+    # Affiche la page précédente (lignes plus récentes)
+    def previousPage(self):
+        if self.currentTable is None or self.atNewest or self.firstKey is None:
+            return
+        
+        # Une ligne de plus que la page pour savoir s'il en reste de plus récentes
+        columns, rows = self.queryManager.getTablePage(self.currentTable, self.firstKey, 'newer', limit=self.pageSize + 1)
+        if len(rows) <= self.pageSize:
+            # Pas plus d'une page plus récente : revenir à la première page, complète
+            self.loadTableData(self.currentTable)
+            return
+        self._showPage(columns, rows[1:], atNewest=False)
+    
+    # Affiche la page commençant à une date donnée
+    def jumpToTime(self, text):
+        """
+        Args:
+            text: Date saisie ('AAAA-MM-JJ', 'AAAA-MM-JJ HH:MM' ou 'AAAA-MM-JJ HH:MM:SS')
+        """
+        if self.currentTable is None:
+            return
+        
+        try:
+            timestamp = datetime.fromisoformat(text.strip())
+        except ValueError:
+            log.warning("Date invalide: %s (format attendu: AAAA-MM-JJ HH:MM:SS)", text)
+            return
+        
+        columns, rows = self.queryManager.getTablePageAt(self.currentTable, timestamp, limit=self.pageSize)
+        if not rows:
+            self.view.updatePageStatus(not self.atNewest, self.lastKey is not None, f"Aucune ligne avant le {timestamp}")
+            return
+        self._showPage(columns, rows, atNewest=False)
+    
+    # Recharge la page affichée (la première page suit les nouvelles lignes)
+    def refreshCurrentPage(self):
+        if self.currentTable is None:
+            return
+        if self.atNewest or self.firstKey is None:
+            self.loadTableData(self.currentTable)
+            return
+        
+        columns, rows = self.queryManager.getTablePage(self.currentTable, self.firstKey, 'older', inclusive=True, limit=self.pageSize)
+        self._showPage(columns, rows, atNewest=False)
+    
+    # Affiche une page et retient ses bornes
+    def _showPage(self, columns, rows, atNewest):
+        self.atNewest = atNewest
+        self.rows = list(rows)
+        if rows and self.keyPositions:
+            self.firstKey = self._keyOf(rows[0])
+            self.lastKey = self._keyOf(rows[-1])
+        else:
+            self.firstKey = self.lastKey = None
+        
+        self.view.updateTableData(self.currentTable, columns, self.rows)
+        self.view.updatePageStatus(not atNewest, len(rows) >= self.pageSize)
+    
+    # Retourne la clé primaire d'une ligne
+    def _keyOf(self, row):
+        return tuple(row[i] for i in self.keyPositions)
+    
+    # Lit les lignes plus récentes qu'une clé (les plus récentes en premier)
+    def _fetchNewRows(self, tableName, sinceKey):
+        """
+        Args:
+            tableName: Nom de la table
+            sinceKey: Clé de la ligne la plus récente déjà affichée
+            
+        Returns:
+            Un tuple (colonnes, lignes), au plus max_rows lignes
+        """
+        columns, newRows = [], []
+        key = sinceKey
+        while len(newRows) < TABLE_BROWSER_CONFIG['max_rows']:
+            columns, rows = self.queryManager.getTablePage(tableName, key, 'newer', limit=self.pageSize)
+            if not rows:
+                break
+            newRows = rows + newRows
+            key = self._keyOf(rows[0])
+            if len(rows) < self.pageSize:
+                break
+        return columns, newRows
+    
+    # Ajoute en tête de la première page les lignes lues par le rafraîchissement (thread Tk)
+    def _prependRows(self, tableName, sinceKey, columns, newRows):
+        # La page a changé depuis la lecture : les lignes ne la concernent plus
+        if tableName != self.currentTable or sinceKey != self.firstKey or not self.atNewest:
+            return
+        
+        self.rows[:0] = newRows
+        if len(self.rows) > TABLE_BROWSER_CONFIG['max_rows']:
+            del self.rows[TABLE_BROWSER_CONFIG['max_rows']:]
+            self.lastKey = self._keyOf(self.rows[-1])
+        self.firstKey = self._keyOf(self.rows[0])
+        
+        self.view.prependTableRows(columns, self.rows, len(newRows))
     
     # Démarre le rafraîchissement automatique
     def startAutoRefresh(self, interval=5000):
@@ -67,14 +201,26 @@ class TableController:
     
     # Boucle de rafraîchissement automatique des données
     def _refreshLoop(self):
-        while not self.stopRefresh.is_set() and self.refreshActive:
-            # Vérifier si une table est sélectionnée
-            if self.view.currentTableName:
-                # Charger les données de la table
-                self.loadTableData(self.view.currentTableName)
+        """
+        Seules les lignes dont la clé dépasse la plus récente déjà affichée
+        sont lues : le coût d'un rafraîchissement dépend du nombre de nouvelles
+        lignes, pas de la taille de la table, et la vue n'est pas touchée s'il
+        n'y en a aucune. Les pages plus anciennes ne changent pas et ne sont
+        pas relues.
+        """
+        while self.refreshActive and not self.stopRefresh.wait(self.refreshInterval / 1000):
+            tableName, sinceKey = self.currentTable, self.firstKey
+            if not tableName or not self.atNewest:
+                continue
+            
+            if sinceKey is None:
+                # Table vide ou sans clé exploitable : recharger la première page
+                self.ui.post(self.refreshCurrentPage)
+                continue
             
-            # Attendre l'intervalle de rafraîchissement
-            time.sleep(self.refreshInterval / 1000)
+            columns, newRows = self._fetchNewRows(tableName, sinceKey)
+            if newRows:
+                self.ui.post(self._prependRows, tableName, sinceKey, columns, newRows)
     
     # Exécute une requête SQL personnalisée
     def executeCustomQuery(self, query, params=None):
@@ -0,0 +1,243 @@
+import logging
+import queue
+import threading
+import time
+from config.settings import DB_WRITER_CONFIG
+from src.models.reading import Reading
+
+log = logging.getLogger(__name__)
+
+# Écriture différée et groupée des données capteurs dans la base de données
+class BatchWriter:
+    # Initialise le tampon d'écriture
+    def __init__(self, queryManager=None, batchSize=None, maxDelay=None, queueSize=None, spool=None):
+        """
+        Args:
+            queryManager: Le gestionnaire de requêtes utilisé pour les insertions
+            batchSize: Nombre de lignes déclenchant l'écriture d'un lot
+            maxDelay: Délai maximum (en secondes) avant l'écriture d'un lot incomplet
+            queueSize: Nombre maximum de lignes en attente dans la file
+            spool: Spool local (LocalSpool) recevant les lots lorsque MySQL est injoignable
+        """
+        self.queryManager = queryManager
+        self.spool = spool
+        self.batchSize = batchSize or DB_WRITER_CONFIG['batch_size']
+        self.maxDelay = maxDelay if maxDelay is not None else DB_WRITER_CONFIG['max_delay']
+        self.queue = queue.Queue(maxsize=queueSize or DB_WRITER_CONFIG['queue_size'])
+
+        # Compteurs
+        self.rowsQueued = 0
+        self.rowsFlushed = 0
+        self.rowsDropped = 0
+        self.batchesFlushed = 0
+        self.rowsSpooled = 0
+        self.rowsReplayed = 0
+        self.rowsRejected = 0
+        self._statsLock = threading.Lock()
+
+        # Signaux d'arrêt et de vidage lus par runOnce()
+        self.stopWriter = threading.Event()
+        self._flushRequested = threading.Event()
+
+        # Lot en cours de constitution
+        self._batch = []
+        self._deadline = None
+
+    # Demande l'arrêt de l'écriture ; runOnce() écrit les lignes restantes puis retourne False
+    def stop(self):
+        self.stopWriter.set()
+
+    # Ajoute une lecture à la file d'écriture sans bloquer
+    def enqueue(self, data):
+        """
+        Args:
+            data: Une Reading (ou un dictionnaire de données capteurs, converti une seule fois ici)
+
+        Returns:
+            True si la lecture a été mise en file, False si elle a été abandonnée
+        """
+        if isinstance(data, dict):
+            data = Reading.fromDict(data) if data else None
+        if not isinstance(data, Reading):
+            return False
+
+        try:
+            self.queue.put_nowait(data)
+        except queue.Full:
+            with self._statsLock:
+                self.rowsDropped += 1
+            return False
+
+        with self._statsLock:
+            self.rowsQueued += 1
+        return True
+
+    # Demande l'écriture immédiate du lot en cours
+    def flush(self):
+        self._flushRequested.set()
+
+    # Retourne les compteurs du tampon d'écriture
+    def getStats(self):
+        """
+        Returns:
+            Un dictionnaire contenant les compteurs de lignes et la taille de la file
+        """
+        with self._statsLock:
+            return {
+                'queued': self.rowsQueued,
+                'flushed': self.rowsFlushed,
+                'dropped': self.rowsDropped,
+                'batches': self.batchesFlushed,
+                'pending': self.queue.qsize(),
+                'spooled': self.rowsSpooled,
+                'replayed': self.rowsReplayed,
+                'rejected': self.rowsRejected,
+                'spool_pending': self.spool.pending if self.spool else 0
+            }
+
+    # Collecte et écrit au plus un lot
+    def runOnce(self):
+        """
+        Attend au plus jusqu'à l'échéance du lot en cours (ou maxDelay), puis
+        écrit le lot s'il est plein, échu, ou si un vidage/arrêt est demandé.
+        Appelée en boucle depuis l'exécuteur de la boucle d'acquisition (appel bloquant).
+        
+        Returns:
+            False lorsque l'arrêt est demandé et que toutes les lignes ont été écrites
+        """
+        if self._deadline is None:
+            timeout = self.maxDelay
+        else:
+            timeout = max(0.0, self._deadline - time.monotonic())
+
+        try:
+            self._batch.append(self.queue.get(timeout=timeout))
+            if self._deadline is None:
+                self._deadline = time.monotonic() + self.maxDelay
+        except queue.Empty:
+            pass
+
+        # Récupérer sans attendre les lignes déjà présentes
+        while len(self._batch) < self.batchSize:
+            try:
+                self._batch.append(self.queue.get_nowait())
+            except queue.Empty:
+                break
+
+        stopping = self.stopWriter.is_set()
+        due = self._deadline is not None and time.monotonic() >= self._deadline
+        if self._batch and (len(self._batch) >= self.batchSize or due or stopping or self._flushRequested.is_set()):
+            batch = self._batch
+            self._batch = []
+            self._deadline = None
+            self._flushRequested.clear()
+            self._flushBatch(batch)
+
+        # Réécrire les lectures du spool dès que la base de données est de nouveau joignable
+        if self.spool is not None and self.spool.pending and self._databaseReachable():
+            self._replaySpool()
+
+        return not (stopping and not self._batch and self.queue.empty())
+
+    # Indique si la base de données est joignable (état suivi, sans échange avec le serveur)
+    def _databaseReachable(self):
+        return self.queryManager is not None and self.queryManager.isReachable()
+
+    # Écrit un lot dans la base de données, ou dans le spool local si elle est injoignable
+    def _flushBatch(self, batch):
+        """
+        Args:
+            batch: Liste de Reading
+        """
+        # Tant que le spool n'est pas vide, les nouveaux lots y sont ajoutés pour conserver l'ordre
+        inserted = None
+        if self._databaseReachable() and not (self.spool is not None and self.spool.pending):
+            inserted = self.queryManager.insertSensorDataBatch(batch)
+
+        if inserted:
+            with self._statsLock:
+                self.rowsFlushed += inserted
+                self.batchesFlushed += 1
+            return
+
+        # Lot refusé par le serveur : n'écarter que les lignes fautives
+        if inserted == 0:
+            batch = self._insertEach(batch)
+            if not batch:
+                return
+
+        # Base de données injoignable : conserver le lot pour le réécrire plus tard
+        spooled = self._spoolBatch(batch)
+        with self._statsLock:
+            self.rowsSpooled += spooled
+            self.rowsDropped += len(batch) - spooled
+
+    # Ajoute un lot au spool local
+    def _spoolBatch(self, batch):
+        """
+        Returns:
+            Le nombre de lignes ajoutées au spool
+        """
+        if self.spool is None:
+            return 0
+        try:
+            return self.spool.append(batch)
+        except Exception as e:
+            log.error("Erreur lors de l'écriture dans le spool local: %s", e)
+            return 0
+
+    # Insère une à une les lignes d'un lot refusé et écarte celles que le serveur refuse
+    def _insertEach(self, batch):
+        """
+        Returns:
+            Les lignes non écrites parce que la base de données est devenue injoignable
+        """
+        for index, row in enumerate(batch):
+            inserted = self.queryManager.insertSensorDataBatch([row])
+            if inserted is None:
+                return batch[index:]
+            if not inserted:
+                self._rejectBatch([row])
+                continue
+            with self._statsLock:
+                self.rowsFlushed += inserted
+        return []
+
+    # Écarte un lot refusé par la base de données (erreur de données), en journalisant ses lignes
+    def _rejectBatch(self, batch):
+        log.error("%d lignes écartées après refus de la base de données: %s", len(batch), batch)
+        with self._statsLock:
+            self.rowsRejected += len(batch)
+
+    # Réécrit dans la base de données les lectures du spool, par lots, jusqu'à ce qu'elle soit injoignable
+    def _replaySpool(self):
+        isolate = 0  # Lignes restant à rejouer une par une après le refus d'un lot
+        while self.spool.pending:
+            lastId, rows = self.spool.peek(1 if isolate else None)
+            if not rows:
+                break
+
+            inserted = self.queryManager.insertSensorDataBatch(rows)
+            if inserted is None:
+                break
+
+            # Lot refusé : rejouer ses lignes une par une pour n'écarter que les lignes fautives
+            if not inserted and len(rows) > 1:
+                isolate = len(rows)
+                continue
+
+            # Une ligne refusée est retirée du spool pour ne pas bloquer les suivantes
+            self.spool.remove(lastId)
+            isolate = max(0, isolate - 1)
+            if not inserted:
+                self._rejectBatch(rows)
+                continue
+
+            with self._statsLock:
+                self.rowsReplayed += inserted
+                self.rowsFlushed += inserted
+                self.batchesFlushed += 1
+
+            # Laisser la file courante être traitée entre deux lots de rattrapage
+            if not self.queue.empty():
+                break
@@ -1,21 +1,52 @@
+import logging;
+import threading;
+import time;
+from collections import OrderedDict;
+from contextlib import contextmanager;
 import mysql.connector;
-from config.settings import DB_CONFIG;
+from config.settings import DB_CONFIG, DB_POOL_CONFIG;
 
-# Connexion à la base de données
+log = logging.getLogger(__name__);
+
+# Pool de connexions à la base de données, partagé par tous les threads de l'application
 class DatabaseConnection:
-    def __init__(self):
-        self.connection = None;
-        self.cursor = None;
+    def __init__(self, poolSize=None):
+        """
+        Args:
+            poolSize: Nombre maximum de connexions ouvertes simultanément
+        """
+        self.poolSize = poolSize or DB_POOL_CONFIG['pool_size'];
         self._isConnected = False;
+        self._enabled = False;  # Faux après disconnect() : plus aucune connexion n'est ouverte
         self.errorMessage = '';
         self.dbConfig = DB_CONFIG.copy();
-        
+
+        # Connexions libres (dernière utilisée en fin de liste) et nombre de connexions ouvertes
+        self._idle = [];
+        self._opened = 0;
+        self._generation = 0;
+        self._generations = {};  # id(connexion) -> génération du pool à son ouverture
+        self._statements = {};  # id(connexion) -> {requête: curseur préparé}, du moins au plus récent
+        self.statementHits = 0;
+        self.statementMisses = 0;
+        self._condition = threading.Condition();
+
+        # Reconnexion avec attente exponentielle
+        self._retryDelay = 0;
+        self._nextAttempt = 0;
+
+        # Suivi de l'état : la connexion est supposée active jusqu'à l'échec d'une opération,
+        # un thread de surveillance la vérifie en arrière-plan et reconnecte si nécessaire
+        self._lastSuccess = 0;
+        self.monitorThread = None;
+        self.stopMonitor = threading.Event();
+
         # Tenter une connexion initiale avec les paramètres par défaut
         try:
             self.connect();
         except Exception as e:
             self.errorMessage = str(e);
-            print(f"Erreur lors de la connexion initiale à la base de données: {str(e)}");
+            log.error("Erreur lors de la connexion initiale à la base de données: %s", e);
             self._isConnected = False;
 
     # Établit la connexion à la base de données
@@ -30,56 +61,302 @@ class DatabaseConnection:
                 self.dbConfig['password'] = password;
             if database:
                 self.dbConfig['database'] = database;
-                
-            self.connection = mysql.connector.connect(**self.dbConfig);
-            self.cursor = self.connection.cursor();
-            self._isConnected = True;
-            self.errorMessage = '';
-            print(f"Connexion établie à la base de données {self.dbConfig.get('database')} sur {self.dbConfig.get('host')}");
+
+            # Repartir d'un pool vide avec la nouvelle configuration
+            self._closePool();
+            self._enabled = True;
+            self._retryDelay = 0;
+            self._nextAttempt = 0;
+            self._startMonitor();
+
+            # Ouvrir une première connexion pour valider les paramètres
+            self.release(self.acquire());
+            log.info("Connexion établie à la base de données %s sur %s", self.dbConfig.get('database'), self.dbConfig.get('host'), extra={'tag': 'success'});
             return True;
         except Exception as e:
             self._isConnected = False;
             self.errorMessage = str(e);
-            print(f"Erreur de connexion à la base de données: {str(e)}");
+            log.error("Erreur de connexion à la base de données: %s", e);
             return False;
-    
-    # Ferme la connexion à la base de données
+
+    # Ferme toutes les connexions du pool
     def disconnect(self):
-        if self.cursor:
-            self.cursor.close();
-        if self.connection:
-            self.connection.close();
+        self._enabled = False;
+        self.stopMonitor.set();
+        self._closePool();
         self._isConnected = False;
-        
+
+    # Emprunte une connexion au pool
+    def acquire(self, timeout=None):
+        """
+        Une connexion restée inactive plus de health_check_idle secondes est
+        vérifiée (ping) avant d'être rendue ; une connexion morte est remplacée.
+
+        Args:
+            timeout: Délai maximum d'attente d'une connexion libre (checkout_timeout par défaut)
+
+        Returns:
+            Une connexion mysql.connector, à rendre avec release()
+        """
+        if not self._enabled:
+            raise ConnectionError("Connexion à la base de données non établie");
+
+        if timeout is None:
+            timeout = DB_POOL_CONFIG['checkout_timeout'];
+        deadline = time.monotonic() + timeout;
+
+        with self._condition:
+            while True:
+                if self._idle:
+                    connection, lastUsed = self._idle.pop();
+                    break;
+                if self._opened < self.poolSize:
+                    # Réserver une place avant d'ouvrir la connexion hors du verrou
+                    self._opened += 1;
+                    connection, lastUsed = None, None;
+                    break;
+                remaining = deadline - time.monotonic();
+                if remaining <= 0:
+                    raise ConnectionError("Aucune connexion libre dans le pool de la base de données");
+                self._condition.wait(remaining);
+
+        if connection is not None:
+            if time.monotonic() - lastUsed < DB_POOL_CONFIG['health_check_idle'] or self._ping(connection):
+                return connection;
+            self._close(connection);
+
+        try:
+            return self._open();
+        except Exception:
+            with self._condition:
+                self._opened -= 1;
+                self._condition.notify();
+            raise;
+
+    # Rend une connexion au pool
+    def release(self, connection, error=None):
+        """
+        Args:
+            connection: La connexion empruntée avec acquire()
+            error: L'exception levée pendant l'utilisation, le cas échéant
+        """
+        if error is not None:
+            # Le curseur en échec peut être dans un état incohérent : repréparer les requêtes
+            self._dropStatements(connection);
+        if error is not None and not self._ping(connection):
+            # L'opération a échoué sur une connexion morte : le serveur est considéré injoignable
+            self._isConnected = False;
+            self._discard(connection);
+            return;
+        if self._generations.get(id(connection)) != self._generation:
+            self._discard(connection);
+            return;
+        if error is not None and not self._rollback(connection):
+            # Transaction impossible à annuler : ne pas la laisser au prochain emprunteur
+            self._discard(connection);
+            return;
+
+        now = time.monotonic();
+        if error is None:
+            self._lastSuccess = now;
+        with self._condition:
+            self._idle.append((connection, now));
+            self._condition.notify();
+
+    # Emprunte une connexion le temps d'un bloc with
+    @contextmanager
+    def pooled(self):
+        connection = self.acquire();
+        try:
+            yield connection;
+        except GeneratorExit:
+            # Flux abandonné en cours de lecture : le résultat non lu rend la connexion inutilisable
+            self._discard(connection);
+            raise;
+        except Exception as e:
+            self.release(connection, e);
+            raise;
+        self.release(connection);
+
+    # Retourne un curseur préparé côté serveur pour une requête, mis en cache par connexion
+    def prepared(self, connection, query):
+        """
+        La requête n'est analysée par le serveur qu'à sa première exécution sur
+        cette connexion ; les exécutions suivantes n'envoient que les paramètres.
+        Le curseur retourné appartient au cache : il ne doit pas être fermé et
+        son résultat doit être entièrement lu.
+
+        Args:
+            connection: Une connexion empruntée avec acquire()
+            query: La requête paramétrée (%s)
+
+        Returns:
+            Un curseur préparé pour cette requête
+        """
+        cache = self._statements.get(id(connection));
+        if cache is None:
+            cache = self._statements[id(connection)] = OrderedDict();
+
+        cursor = cache.get(query);
+        if cursor is not None:
+            cache.move_to_end(query);
+            self.statementHits += 1;
+            return cursor;
+
+        self.statementMisses += 1;
+        cursor = connection.cursor(prepared=True);
+        cache[query] = cursor;
+        if len(cache) > DB_POOL_CONFIG['statement_cache_size']:
+            # Libérer côté serveur la requête la moins récemment utilisée
+            oldQuery, oldCursor = cache.popitem(last=False);
+            self._closeCursor(oldCursor);
+        return cursor;
+
+    # Indique si le pool accepte des emprunts (reconnexion automatique), sans échange avec le serveur
+    def isOpen(self):
+        return self._enabled;
+
     # Vérifie si la connexion à la base de données est établie
     def isConnected(self):
-        if self.connection is None:
-            self._isConnected = False;
+        """
+        Retourne l'état suivi (mis à jour par les opérations et la surveillance
+        en arrière-plan) sans échange avec le serveur.
+
+        Returns:
+            True si la base de données est joignable, False sinon
+        """
+        return self._enabled and self._isConnected;
+
+    # Vérifie la connexion auprès du serveur et reconnecte si nécessaire
+    def probe(self):
+        """
+        Returns:
+            True si le serveur a répondu, False sinon
+        """
+        if not self._enabled:
             return False;
-            
+
         try:
-            # Vérifier si la connexion est toujours active en utilisant la méthode appropriée
-            # MySQLConnection utilise is_connected() et non isConnected()
-            if hasattr(self.connection, 'is_connected'):
-                is_connected = self.connection.is_connected()
-            else:
-                # Utilisation de ping comme fallback
-                self.connection.ping(reconnect=False, attempts=1, delay=0);
-                is_connected = True
-                
-            self._isConnected = is_connected
-            return is_connected
-        except Exception as e:
-            print(f"Erreur lors de la vérification de la connexion: {str(e)}")
-            self._isConnected = False;
+            # Ouvre une nouvelle connexion (dans le respect du délai de reconnexion) si aucune n'est libre
+            connection = self.acquire();
+        except Exception:
             return False;
-    
+
+        isConnected = self._ping(connection);
+        self._isConnected = isConnected;
+        if isConnected:
+            self.release(connection);
+        else:
+            self._discard(connection);
+        return isConnected;
+
     # Retourne le nom de la base de données connectée
     def getDatabaseName(self):
         if self.isConnected():
             return self.dbConfig.get('database', 'Unknown');
         return None;
-    
-    # Insère les données des capteurs dans la base de données
-    # NOTE: Cette méthode a été déplacée vers QueryManager
-    # Veuillez utiliser QueryManager.insertSensorData à la place 
\ No newline at end of file
+
+    # Ouvre une nouvelle connexion en respectant le délai de reconnexion
+    def _open(self):
+        now = time.monotonic();
+        if now < self._nextAttempt:
+            raise ConnectionError(f"Nouvelle tentative de connexion dans {self._nextAttempt - now:.1f}s: {self.errorMessage}");
+
+        try:
+            connection = mysql.connector.connect(**self.dbConfig);
+        except Exception as e:
+            # Doubler le délai avant la prochaine tentative, dans la limite configurée
+            self._retryDelay = min(max(self._retryDelay * 2, DB_POOL_CONFIG['reconnect_delay']), DB_POOL_CONFIG['reconnect_max_delay']);
+            self._nextAttempt = time.monotonic() + self._retryDelay;
+            self._isConnected = False;
+            self.errorMessage = str(e);
+            raise;
+
+        self._retryDelay = 0;
+        self._nextAttempt = 0;
+        self._isConnected = True;
+        self.errorMessage = '';
+        self._generations[id(connection)] = self._generation;
+        return connection;
+
+    # Vérifie qu'une connexion répond
+    def _ping(self, connection):
+        try:
+            # MySQLConnection utilise is_connected() et non isConnected()
+            if hasattr(connection, 'is_connected'):
+                return connection.is_connected();
+            connection.ping(reconnect=False, attempts=1, delay=0);
+            return True;
+        except Exception as e:
+            self.errorMessage = str(e);
+            return False;
+
+    # Annule la transaction en cours d'une connexion (False si l'annulation échoue)
+    def _rollback(self, connection):
+        try:
+            connection.rollback();
+            return True;
+        except Exception as e:
+            log.warning("Annulation impossible, connexion fermée: %s", e);
+            return False;
+
+    # Ferme une connexion empruntée et libère sa place dans le pool
+    def _discard(self, connection):
+        stale = self._generations.get(id(connection)) != self._generation;
+        self._close(connection);
+        with self._condition:
+            if not stale:
+                self._opened -= 1;
+            self._condition.notify();
+
+    # Démarre le thread de surveillance de la connexion
+    def _startMonitor(self):
+        self.stopMonitor.clear();
+        if self.monitorThread and self.monitorThread.is_alive():
+            return;
+
+        self.monitorThread = threading.Thread(target=self._monitorLoop, name='db-monitor');
+        self.monitorThread.daemon = True;
+        self.monitorThread.start();
+
+    # Boucle de surveillance : vérifie la connexion si aucune opération n'a réussi récemment
+    def _monitorLoop(self):
+        interval = DB_POOL_CONFIG['probe_interval'];
+        while not self.stopMonitor.wait(interval):
+            if self._isConnected and time.monotonic() - self._lastSuccess < interval:
+                continue;
+            self.probe();
+
+    # Ferme les curseurs préparés d'une connexion
+    def _dropStatements(self, connection):
+        cache = self._statements.pop(id(connection), None);
+        if cache:
+            for cursor in cache.values():
+                self._closeCursor(cursor);
+
+    # Ferme un curseur sans propager d'erreur
+    def _closeCursor(self, cursor):
+        try:
+            cursor.close();
+        except Exception:
+            pass
+
+    # Ferme une connexion sans propager d'erreur
+    def _close(self, connection):
+        self._dropStatements(connection);
+        self._generations.pop(id(connection), None);
+        try:
+            connection.close();
+        except Exception:
+            pass
+
+    # Ferme les connexions libres ; celles empruntées seront fermées à leur retour
+    def _closePool(self):
+        with self._condition:
+            idle = self._idle;
+            self._idle = [];
+            self._opened = 0;
+            self._generation += 1;
+            self._condition.notify_all();
+        for connection, lastUsed in idle:
+            self._close(connection);
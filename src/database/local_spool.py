@@ -0,0 +1,90 @@
+import json
+import os
+import sqlite3
+import threading
+from config.settings import SPOOL_CONFIG
+from src.models.reading import Reading
+
+# File d'attente locale et durable des lectures non encore écrites dans MySQL
+class LocalSpool:
+    # Ouvre (ou crée) le fichier de spool
+    def __init__(self, path=None):
+        """
+        Args:
+            path: Chemin du fichier SQLite du spool
+        """
+        self.path = path or SPOOL_CONFIG['path']
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # Journal WAL : les ajouts ne réécrivent pas le fichier principal ;
+        # synchronous=FULL synchronise le journal sur disque à chaque transaction,
+        # donc une fois par lot ajouté
+        self.connection = sqlite3.connect(self.path, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=FULL")
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS spool (id INTEGER PRIMARY KEY AUTOINCREMENT, payload TEXT NOT NULL)"
+        )
+        self.connection.commit()
+        self._lock = threading.Lock()
+
+        # Nombre de lignes en attente, tenu en mémoire pour éviter un COUNT(*) à chaque vérification
+        self.pending = self.connection.execute("SELECT COUNT(*) FROM spool").fetchone()[0]
+
+    # Ajoute un lot de lectures dans une seule transaction
+    def append(self, rows):
+        """
+        Args:
+            rows: Liste de Reading
+
+        Returns:
+            Le nombre de lignes ajoutées
+        """
+        # Chaque lecture est stockée comme un tableau JSON [horodatage_ns, appareil, métriques...]
+        payloads = [(json.dumps(row.toRow()),) for row in rows]
+        if not payloads:
+            return 0
+
+        with self._lock:
+            with self.connection:
+                self.connection.executemany("INSERT INTO spool (payload) VALUES (?)", payloads)
+            self.pending += len(payloads)
+        return len(payloads)
+
+    # Lit les plus anciennes lectures en attente sans les retirer
+    def peek(self, limit=None):
+        """
+        Args:
+            limit: Nombre maximum de lignes à lire
+
+        Returns:
+            Un tuple (dernier identifiant lu, liste de Reading), (None, []) si le spool est vide
+        """
+        with self._lock:
+            rows = self.connection.execute(
+                "SELECT id, payload FROM spool ORDER BY id LIMIT ?",
+                (limit or SPOOL_CONFIG['replay_batch_size'],)
+            ).fetchall()
+
+        if not rows:
+            return None, []
+        return rows[-1][0], [Reading.fromRow(json.loads(payload)) for _, payload in rows]
+
+    # Retire les lectures écrites dans MySQL
+    def remove(self, lastId):
+        """
+        Args:
+            lastId: Identifiant de la dernière ligne écrite (incluse)
+        """
+        with self._lock:
+            with self.connection:
+                removed = self.connection.execute("DELETE FROM spool WHERE id <= ?", (lastId,)).rowcount
+            self.pending = max(0, self.pending - removed)
+
+    # Ferme le fichier de spool
+    def close(self):
+        with self._lock:
+            self.connection.close()
+
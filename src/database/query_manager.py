@@ -1,5 +1,159 @@
+import logging
+from contextlib import contextmanager
+from itertools import chain
 from datetime import datetime, timedelta
+from functools import lru_cache
+from config.settings import ROLLUP_CONFIG, DOWNSAMPLING_CONFIG, STREAM_CONFIG, TABLE_BROWSER_CONFIG
+from src.models.metrics import METRIC_NAMES, METRICS
+from src.models.reading import READING_COLUMNS, Reading
 from src.models.sensor_data import SensorData
+from src.models.sensor_series import SensorSeries
+from src.database.rollups import ROLLUP_METRICS, ROLLUP_RESOLUTIONS, aggregateRows, bucketStart, rebuildQueries, resolutionFor, upsertQuery
+from src.utils.downsampling import lttb
+
+log = logging.getLogger(__name__)
+
+# Convertit une valeur SQL (DECIMAL, DOUBLE) en float
+def _toFloat(value):
+    return None if value is None else float(value)
+
+# Construit un SensorData depuis une ligne (date, métriques dans l'ordre du registre)
+def _rowToSensorData(row):
+    # Les premiers paramètres de SensorData suivent l'ordre de METRICS
+    return SensorData(*row[1:], timestamp=row[0])
+
+# Construit un SensorData agrégé depuis une ligne (date, moyennes, minimums, maximums dans l'ordre du registre)
+def _envelopeToSensorData(row):
+    count = len(METRIC_NAMES)
+    return SensorData(
+        *row[1:1 + count], timestamp=row[0],
+        minimum=dict(zip(METRIC_NAMES, row[1 + count:1 + 2 * count])),
+        maximum=dict(zip(METRIC_NAMES, row[1 + 2 * count:]))
+    )
+
+# Convertit une donnée à insérer en Reading (None si elle est invalide)
+def _toReading(data):
+    if isinstance(data, Reading):
+        return data
+    if data and isinstance(data, dict):
+        return Reading.fromDict(data)
+    return None
+
+# Codes d'erreur MySQL signalant un serveur injoignable ou une connexion perdue
+_CONNECTION_ERRNOS = frozenset((2002, 2003, 2005, 2006, 2013, 2055))
+
+# Colonnes des métriques, dans l'ordre du registre
+_METRIC_COLUMNS = ', '.join(metric.column for metric in METRICS)
+_METRIC_AVERAGES = ', '.join(f"AVG({metric.column}) as avg_{metric.column}" for metric in METRICS)
+
+# Protège un nom de table ou de colonne pour l'inclure dans une requête
+def _quoteIdentifier(name):
+    return '`' + str(name).replace('`', '``') + '`'
+
+# Colonnes d'une série agrégée par intervalles : moyennes, puis minimums et maximums de chaque métrique
+ENVELOPE_COLUMNS = ROLLUP_METRICS + tuple(f"{metric}_min" for metric in ROLLUP_METRICS) + tuple(f"{metric}_max" for metric in ROLLUP_METRICS)
+
+# Durée des périodes acceptées par getDataByTimeframe
+TIMEFRAMES = {
+    'hour': timedelta(hours=1),
+    'day': timedelta(days=1),
+    'week': timedelta(weeks=1),
+    'month': timedelta(days=30)
+}
+
+# Requête d'insertion pour un ensemble de colonnes (construite une seule fois par forme)
+@lru_cache(maxsize=64)
+def _insertQuery(columns):
+    """
+    Args:
+        columns: Tuple des colonnes renseignées
+        
+    Returns:
+        La requête INSERT paramétrée correspondante
+    """
+    return f"INSERT INTO sensor_data ({', '.join(columns)}) VALUES ({', '.join(['%s'] * len(columns))})"
+
+# Requêtes de lecture construites une seule fois : le curseur préparé mis en cache par le pool
+# n'est réutilisé que si le même objet requête lui est repassé à chaque appel
+
+# Dernières lectures (date, métriques dans l'ordre du registre)
+_LATEST_QUERY = f"""
+    SELECT timestamp, {_METRIC_COLUMNS}
+    FROM sensor_data
+    ORDER BY timestamp DESC
+    LIMIT %s
+"""
+
+# Dernières mesures avec leur identifiant
+_LAST_MEASUREMENTS_QUERY = f"""
+    SELECT id, {_METRIC_COLUMNS}, timestamp
+    FROM sensor_data
+    ORDER BY timestamp DESC
+    LIMIT %s
+"""
+
+# Moyennes des lignes brutes depuis une date
+_AVERAGES_QUERY = f"""
+    SELECT {_METRIC_AVERAGES}, COUNT(*) as count
+    FROM sensor_data
+    WHERE timestamp > %s
+"""
+
+# Lignes brutes d'une période, des plus récentes aux plus anciennes
+_TIMEFRAME_QUERY = f"""
+    SELECT timestamp, {', '.join(ROLLUP_METRICS)}
+    FROM sensor_data
+    WHERE timestamp >= %s
+    ORDER BY timestamp DESC
+"""
+
+# Présence de lignes dans le rollup le plus grossier et dans sensor_data
+_BACKFILL_CHECK_QUERY = f"SELECT EXISTS(SELECT 1 FROM {ROLLUP_RESOLUTIONS[-1][1]}), EXISTS(SELECT 1 FROM sensor_data)"
+
+# Moyenne par bucket et par métrique d'une table de rollup
+@lru_cache(maxsize=None)
+def _rollupSeriesQuery(table):
+    return f"""
+        SELECT bucket_start, metric, SUM(sum_value) / SUM(cnt)
+        FROM {table}
+        WHERE bucket_start >= %s
+        GROUP BY bucket_start, metric
+        ORDER BY bucket_start DESC
+    """
+
+# Moyenne et nombre de valeurs par métrique d'une table de rollup
+@lru_cache(maxsize=None)
+def _rollupAveragesQuery(table):
+    return f"""
+        SELECT metric, SUM(sum_value) / SUM(cnt), SUM(cnt)
+        FROM {table}
+        WHERE bucket_start >= %s
+        GROUP BY metric
+    """
+
+# Min/moyenne/max par intervalle et par métrique depuis une table de rollup
+@lru_cache(maxsize=64)
+def _bucketedRollupQuery(table, metricCount):
+    return f"""
+        SELECT FLOOR(UNIX_TIMESTAMP(bucket_start) / %s) AS bucket, metric,
+               MIN(min_value), SUM(sum_value) / SUM(cnt), MAX(max_value)
+        FROM {table}
+        WHERE bucket_start >= %s AND metric IN ({', '.join(['%s'] * metricCount)})
+        GROUP BY bucket, metric
+        ORDER BY bucket DESC
+    """
+
+# Min/moyenne/max par intervalle des métriques données depuis sensor_data
+@lru_cache(maxsize=64)
+def _bucketedRawQuery(metrics):
+    columns = ', '.join(f"MIN({metric}), AVG({metric}), MAX({metric})" for metric in metrics)
+    return f"""
+        SELECT FLOOR(UNIX_TIMESTAMP(timestamp) / %s) AS bucket, {columns}
+        FROM sensor_data
+        WHERE timestamp >= %s
+        GROUP BY bucket
+        ORDER BY bucket DESC
+    """
 
 # Gestionnaire de requêtes SQL pour la base de données
 class QueryManager:
@@ -10,11 +164,86 @@ class QueryManager:
             dbConnection: La connexion à la base de données
         """
         self.dbConnection = dbConnection
-        # Si dbConnection est une instance de DatabaseConnection, on utilise sa propriété connection
-        if dbConnection is not None and hasattr(dbConnection, 'connection'):
-            self.connection = dbConnection.connection
+        self._tableSchemas = {}  # nom de table -> (colonnes, colonnes de la clé primaire, colonne de date)
+        # Si dbConnection est une instance de DatabaseConnection, chaque requête emprunte une connexion à son pool
+        if dbConnection is not None and hasattr(dbConnection, 'pooled'):
+            self.pool = dbConnection
+            self.connection = None
         else:
+            self.pool = None
             self.connection = dbConnection
+        
+        # Tables de rollup (désactivées automatiquement si elles n'existent pas dans la base)
+        self.rollupsEnabled = ROLLUP_CONFIG['enabled']
+    
+    # Indique si une base de données est disponible (sans échange avec le serveur)
+    def isAvailable(self):
+        if self.pool is not None:
+            return self.pool.isOpen()
+        return self.connection is not None
+    
+    # Indique si la base de données est joignable d'après l'état suivi par le pool (sans échange avec le serveur)
+    def isReachable(self):
+        if self.pool is not None:
+            return self.pool.isConnected()
+        return self.connection is not None
+    
+    # Fournit une connexion le temps d'un bloc with (empruntée au pool si disponible)
+    @contextmanager
+    def _connection(self):
+        if self.pool is None:
+            yield self.connection
+            return
+        
+        with self.pool.pooled() as connection:
+            yield connection
+    
+    # Fournit un curseur pour une requête (préparé côté serveur et mis en cache par connexion si le pool est utilisé)
+    @contextmanager
+    def _statement(self, connection, query):
+        if self.pool is not None:
+            yield self.pool.prepared(connection, query)
+            return
+        
+        cursor = connection.cursor()
+        try:
+            yield cursor
+        finally:
+            cursor.close()
+    
+    # Exécute une requête et lit son résultat par paquets, au fil de sa réception
+    def _stream(self, query, params=None, chunkSize=None):
+        """
+        Le curseur n'est pas mis en mémoire tampon : les lignes sont lues sur la
+        connexion au fur et à mesure que le générateur est consommé, et celle-ci
+        reste empruntée jusqu'à la fin (ou l'abandon) du flux.
+        
+        Args:
+            query: Requête SQL
+            params: Paramètres de la requête
+            chunkSize: Nombre de lignes par paquet (chunk_size par défaut)
+            
+        Yields:
+            Des listes d'au plus chunkSize tuples
+        """
+        chunkSize = chunkSize or STREAM_CONFIG['chunk_size']
+        with self._connection() as connection:
+            cursor = connection.cursor(buffered=False)
+            try:
+                cursor.execute(query, params)
+                while True:
+                    rows = cursor.fetchmany(chunkSize)
+                    if not rows:
+                        break
+                    yield rows
+            finally:
+                try:
+                    if self.pool is None:
+                        # Connexion partagée : lire le reste du résultat pour qu'elle reste utilisable
+                        cursor.fetchall()
+                    cursor.close()
+                except Exception:
+                    pass
     
     # Insère les données des capteurs dans la base de données
     def insertSensorData(self, data):
@@ -22,80 +251,185 @@ class QueryManager:
         Insère des données de capteurs dans la base de données.
         
         Args:
-            data: Un dictionnaire contenant les données à insérer.
-                 Les clés devraient correspondre aux noms des colonnes de la table sensor_data.
+            data: Une Reading, ou un dictionnaire dont les clés correspondent
+                 aux colonnes de la table sensor_data (noms alternatifs acceptés)
         
         Returns:
             True si l'insertion a réussi, False sinon.
         """
         try:
-            # Vérifier qu'un dictionnaire valide est fourni
-            if not data or not isinstance(data, dict):
-                print("Données invalides pour l'insertion")
+            # Vérifier qu'une lecture valide est fournie
+            reading = _toReading(data)
+            if reading is None:
+                log.warning("Données invalides pour l'insertion")
                 return False
             
-            # Normaliser les clés et traiter les valeurs spéciales
-            normalized_data = {}
-            
-            # Mapper les différents formats de clés possibles
-            key_mapping = {
-                'air_quality': ['air_quality', 'airQuality', 'AQ'],
-                'distance': ['distance', 'dist', 'DIST'],
-                'luminosity': ['luminosity', 'lum', 'LUM'],
-                'uv_index': ['uv_index', 'uvIndex', 'UV'],
-                'ir_value': ['ir_value', 'irValue', 'IR'],
-                'temperature': ['temperature', 'temp', 'TEMP'],
-                'pressure': ['pressure', 'press', 'PRESS'],
-                'humidity': ['humidity', 'hum', 'HUM'],
-                'timestamp': ['timestamp', 'time', 'date'],
-                'raw_data': ['raw_data', 'rawData']
-            }
-            
-            # Normaliser les données
-            for db_key, possible_keys in key_mapping.items():
-                for key in possible_keys:
-                    if key in data and data[key] is not None:
-                        # Convertir 'N/A' en None
-                        if data[key] == 'N/A':
-                            normalized_data[db_key] = None
-                        else:
-                            normalized_data[db_key] = data[key]
-                        break
-            
-            # Construire la requête d'insertion
-            columns = []
-            placeholders = []
-            values = []
-            
-            # Ajouter chaque clé et valeur s'ils sont présents et pas None
-            for key, value in normalized_data.items():
-                if value is not None:
-                    columns.append(key)
-                    placeholders.append("%s")
-                    values.append(value)
-            
-            # S'il n'y a pas de colonnes, ne pas créer d'insertion
-            if not columns:
-                print("Aucune donnée valide à insérer")
-                return False
-            
-            # Construire la requête
-            query = f"INSERT INTO sensor_data ({', '.join(columns)}) VALUES ({', '.join(placeholders)})"
+            # Requête mise en cache : toutes les lectures ont les mêmes colonnes
+            query = _insertQuery(READING_COLUMNS)
+            
+            # Exécuter la requête et mettre à jour les rollups dans la même transaction
+            with self._connection() as connection, self._statement(connection, query) as cursor:
+                try:
+                    cursor.execute(query, reading.toColumns())
+                    self._updateRollups(connection, [reading])
+                    connection.commit()
+                except Exception:
+                    # Annuler l'insertion avant de rendre la connexion
+                    try:
+                        connection.rollback()
+                    except Exception:
+                        pass
+                    raise
+            
+            log.debug("Données capteurs insérées avec succès: %r", reading)
+            return True
             
-            # Exécuter la requête
-            cursor = self.connection.cursor()
-            cursor.execute(query, values)
-            self.connection.commit()
+        except Exception as e:
+            log.exception("Erreur lors de l'insertion des données capteurs: %s", e)
+            return False
+    
+    # Insère un lot de données capteurs avec une seule validation
+    def insertSensorDataBatch(self, rows):
+        """
+        Insère plusieurs lignes en une fois : toutes les lectures ont les mêmes
+        colonnes et sont envoyées avec un seul executemany (INSERT multi-lignes),
+        puis l'ensemble du lot est validé par un unique commit.
+        
+        Args:
+            rows: Une liste de Reading (ou de dictionnaires de données capteurs)
             
-            print(f"Données capteurs insérées avec succès, colonnes: {columns}")
+        Returns:
+            Le nombre de lignes insérées ; 0 si le lot est refusé par le serveur
+            (erreur de données, le lot est annulé) ; None si la base de données
+            est injoignable (le lot pourra être réessayé)
+        """
+        if not rows:
+            return 0
+        if not self.isAvailable():
+            return None
+        
+        readings = [reading for reading in map(_toReading, rows) if reading is not None]
+        if not readings:
+            return 0
+        
+        try:
+            with self._connection() as connection:
+                cursor = connection.cursor()
+                try:
+                    cursor.executemany(_insertQuery(READING_COLUMNS), [reading.toColumns() for reading in readings])
+                    self._updateRollups(connection, readings)
+                    connection.commit()
+                except Exception:
+                    # Annuler le lot avant de rendre la connexion
+                    try:
+                        connection.rollback()
+                    except Exception:
+                        pass
+                    raise
+                finally:
+                    cursor.close()
+            return len(readings)
+        except Exception as e:
+            if self._isConnectionError(e):
+                log.warning("Base de données injoignable, lot non inséré: %s", e)
+                return None
+            log.error("Lot de données capteurs refusé par la base de données: %s", e)
+            return 0
+    
+    # Indique si une erreur provient de la connexion (et non des données envoyées)
+    def _isConnectionError(self, error):
+        if isinstance(error, (ConnectionError, OSError)):
             return True
-            
+        if getattr(error, 'errno', None) in _CONNECTION_ERRNOS:
+            return True
+        # Le pool marque le serveur injoignable lorsqu'une connexion en échec ne répond plus
+        return not self.isReachable()
+        
+    # Fusionne les agrégats d'un lot dans les tables de rollup (dans la transaction en cours)
+    def _updateRollups(self, connection, rows):
+        """
+        Args:
+            connection: La connexion portant la transaction d'insertion
+            rows: Liste de Reading
+        """
+        if not self.rollupsEnabled or not rows:
+            return
+        
+        cursor = connection.cursor()
+        try:
+            for table, values in aggregateRows(rows).items():
+                cursor.executemany(upsertQuery(table), values)
+        except Exception as e:
+            # Table absente (base non migrée) : continuer sans rollups plutôt que de bloquer les insertions
+            if getattr(e, 'errno', None) != 1146:
+                raise
+            log.warning("Tables de rollup absentes, agrégats désactivés: %s", e)
+            self.rollupsEnabled = False
+        finally:
+            cursor.close()
+    
+    # Recalcule entièrement les tables de rollup depuis sensor_data
+    def rebuildRollups(self):
+        """
+        À utiliser après la création des tables sur une base existante.
+        
+        Returns:
+            True si le recalcul a réussi, False sinon
+        """
+        try:
+            with self._connection() as connection:
+                cursor = connection.cursor()
+                for name, table, duration, bucketFormat in ROLLUP_RESOLUTIONS:
+                    cursor.execute(f"DELETE FROM {table}")
+                    for query in rebuildQueries(table, bucketFormat):
+                        cursor.execute(query)
+                connection.commit()
+                cursor.close()
+            self.rollupsEnabled = True
+            return True
+        except Exception as e:
+            log.error("Erreur lors du recalcul des rollups: %s", e)
+            return False
+    
+    # Remplit les tables de rollup depuis sensor_data si elles sont vides alors que des données existent
+    def backfillRollups(self):
+        """
+        À appeler au démarrage et après chaque connexion : ne fait rien une fois
+        les tables remplies, les insertions les tenant ensuite à jour.
+        
+        Returns:
+            True si les tables ont été remplies, False sinon
+        """
+        if not self.rollupsEnabled or not self.isReachable():
+            return False
+        
+        # La table la plus grossière est vide si et seulement si toutes le sont
+        query = _BACKFILL_CHECK_QUERY
+        try:
+            with self._connection() as connection, self._statement(connection, query) as cursor:
+                cursor.execute(query)
+                rows = cursor.fetchall()
         except Exception as e:
-            print(f"Erreur lors de l'insertion des données capteurs: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            if getattr(e, 'errno', None) == 1146:
+                log.warning("Tables de rollup absentes, agrégats désactivés: %s", e)
+                self.rollupsEnabled = False
+            else:
+                log.error("Erreur lors de la vérification des rollups: %s", e)
             return False
         
+        hasRollups, hasData = rows[0]
+        if hasRollups or not hasData:
+            return False
+        
+        log.info("Tables de rollup vides : recalcul depuis sensor_data")
+        return self.rebuildRollups()
+    
+    # Choisit la table de rollup adaptée à une période, None pour lire les données brutes
+    def _rollupFor(self, window, minBuckets):
+        if not self.rollupsEnabled:
+            return None
+        return resolutionFor(window, minBuckets)
+    
     # Récupère les dernières données de capteurs
     def getLatestData(self, limit=1):
         """  
@@ -106,97 +440,249 @@ class QueryManager:
             Une liste d'objets SensorData
         """
         try:
-            query = """
-            SELECT timestamp, air_quality, distance, luminosity, uv_index, ir_value, temperature, pressure, humidity
-            FROM sensor_data
-            ORDER BY timestamp DESC
-            LIMIT %s
-            """
-            
-            cursor = self.connection.cursor()
-            cursor.execute(query, (limit,))
-            rows = cursor.fetchall()
-            cursor.close()
-            
-            # Convertir les résultats en objets SensorData
-            result = []
-            for row in rows:
-                data = {
-                    'timestamp': row[0],
-                    'airQuality': row[1],
-                    'distance': row[2],
-                    'luminosity': row[3],
-                    'uvIndex': row[4],
-                    'irValue': row[5],
-                    'temperature': row[6],
-                    'pressure': row[7],
-                    'humidity': row[8]
-                }
-                result.append(SensorData.fromDict(data))
+            query = _LATEST_QUERY
+            with self._connection() as connection, self._statement(connection, query) as cursor:
+                cursor.execute(query, (limit,))
+                rows = cursor.fetchall()
             
-            return result
+            return [_rowToSensorData(row) for row in rows]
         except Exception as e:
-            print(f"Erreur lors de la récupération des données: {str(e)}")
+            log.error("Erreur lors de la récupération des données: %s", e)
             return []
     
     # Récupère les données de capteurs pour une période donnée
-    def getDataByTimeframe(self, timeframe='day'):
+    def getDataByTimeframe(self, timeframe='day', points=None, columnar=False):
         """
+        Les périodes de timeframe_rollups ('week', 'month') sont lues depuis la
+        table de rollup la plus grossière qui contienne au moins
+        timeframe_min_buckets buckets : un point par bucket, avec la moyenne
+        de chaque métrique. Les autres périodes, ou un rollup sans ligne sur la
+        période, retournent les lignes brutes.
+        
         Args:
             timeframe: Période ('hour', 'day', 'week', 'month')
+            points: Nombre maximum de points à retourner ; la période est alors découpée
+                    en intervalles égaux dont le serveur calcule le minimum, la moyenne
+                    et le maximum, pour que les pics restent visibles
+            columnar: Retourner une SensorSeries (un vecteur par métrique) plutôt
+                      qu'un objet par ligne, à privilégier pour les longues périodes
             
         Returns:
-            Une liste d'objets SensorData
+            Une liste d'objets SensorData, ou une SensorSeries si columnar est vrai
+            (du plus récent au plus ancien dans les deux cas). Avec points, chaque
+            SensorData porte la moyenne et ses attributs minimum/maximum, et la
+            SensorSeries contient aussi les colonnes <métrique>_min et <métrique>_max
+            (voir ENVELOPE_COLUMNS)
         """
         try:
-            # Déterminer la date de début en fonction de la période
-            now = datetime.now()
-            if timeframe == 'hour':
-                startDate = now - timedelta(hours=1)
-            elif timeframe == 'day':
-                startDate = now - timedelta(days=1)
-            elif timeframe == 'week':
-                startDate = now - timedelta(weeks=1)
-            elif timeframe == 'month':
-                startDate = now - timedelta(days=30)
-            else:
-                startDate = now - timedelta(days=1)  # Par défaut: 1 jour
+            # Les lignes brutes sont lues par paquets et converties au fil de leur réception
+            rows, columns = self._getTimeframeRows(timeframe, points)
+            if columnar:
+                return SensorSeries.fromRows(rows, columns)
+            toSensorData = _envelopeToSensorData if columns is ENVELOPE_COLUMNS else _rowToSensorData
+            return [toSensorData(row) for row in rows]
+        except Exception as e:
+            log.error("Erreur lors de la récupération des données: %s", e)
+            return SensorSeries(ROLLUP_METRICS) if columnar else []
+    
+    # Calcule les statistiques de chaque métrique sur une période
+    def getStatsByTimeframe(self, timeframe='day', points=None):
+        """
+        Args:
+            timeframe: Période ('hour', 'day', 'week', 'month')
+            points: Nombre maximum de points sur lesquels calculer les statistiques
             
-            # Formater la date pour la requête SQL
-            startDateStr = startDate.strftime('%Y-%m-%d %H:%M:%S')
+        Returns:
+            Un dictionnaire {métrique: {'count', 'min', 'max', 'mean', 'std'}}
+        """
+        series = self.getDataByTimeframe(timeframe, points, columnar=True)
+        stats = {metric: series.stats(metric) for metric in ROLLUP_METRICS}
+        
+        # Série agrégée : les extrêmes viennent des minimums et maximums des intervalles, pas des moyennes
+        if f"{ROLLUP_METRICS[0]}_min" in series.columns:
+            for metric, values in stats.items():
+                values['min'] = series.stats(f"{metric}_min")['min']
+                values['max'] = series.stats(f"{metric}_max")['max']
+        return stats
+    
+    # Lit les données brutes d'une période par paquets, sans les charger entièrement en mémoire
+    def streamDataByTimeframe(self, timeframe='day', chunkSize=None, columnar=False):
+        """
+        Args:
+            timeframe: Période ('hour', 'day', 'week', 'month')
+            chunkSize: Nombre de lignes par paquet (chunk_size par défaut)
+            columnar: Produire une SensorSeries par paquet plutôt qu'une liste de SensorData
             
-            query = """
-            SELECT timestamp, air_quality, distance, luminosity, uv_index, ir_value, temperature, pressure, humidity
-            FROM sensor_data
-            WHERE timestamp >= %s
-            ORDER BY timestamp DESC
-            """
+        Yields:
+            Des listes de SensorData (ou des SensorSeries), du plus récent au plus ancien
+        """
+        window = TIMEFRAMES.get(timeframe, TIMEFRAMES['day'])
+        startDate = datetime.now() - window
+        try:
+            for rows in self._stream(_TIMEFRAME_QUERY, (startDate.strftime('%Y-%m-%d %H:%M:%S'),), chunkSize):
+                if columnar:
+                    yield SensorSeries.fromRows(rows, ROLLUP_METRICS)
+                else:
+                    yield [_rowToSensorData(row) for row in rows]
+        except Exception as e:
+            log.error("Erreur lors de la lecture des données: %s", e)
+    
+    # Lit les lignes d'une période (itérable consommé une seule fois) et le nom de leurs colonnes
+    def _getTimeframeRows(self, timeframe, points):
+        """
+        Returns:
+            Un tuple (lignes (date, valeurs...), colonnes) : ENVELOPE_COLUMNS pour
+            une période découpée en points intervalles, ROLLUP_METRICS sinon
+        """
+        # Déterminer la date de début en fonction de la période (par défaut: 1 jour)
+        window = TIMEFRAMES.get(timeframe, TIMEFRAMES['day'])
+        startDate = datetime.now() - window
+        
+        # Nombre de points borné quelle que soit la taille de la période
+        if points:
+            buckets = self._getBucketedData(startDate, window / points)
+            if buckets is not None:
+                return [
+                    (start,) + tuple(values[metric][1] for metric in ROLLUP_METRICS)
+                    + tuple(values[metric][0] for metric in ROLLUP_METRICS)
+                    + tuple(values[metric][2] for metric in ROLLUP_METRICS)
+                    for start, values in buckets
+                ], ENVELOPE_COLUMNS
+        
+        # Sur les longues périodes, lire une moyenne par bucket plutôt que chaque ligne brute
+        resolution = None
+        if timeframe in ROLLUP_CONFIG['timeframe_rollups']:
+            resolution = self._rollupFor(window, ROLLUP_CONFIG['timeframe_min_buckets'])
+        if resolution is not None:
+            rows = self._getRollupSeries(resolution, startDate)
+            if rows is not None:
+                return rows, ROLLUP_METRICS
+        
+        # Formater la date pour la requête SQL
+        startDateStr = startDate.strftime('%Y-%m-%d %H:%M:%S')
+        
+        return chain.from_iterable(self._stream(_TIMEFRAME_QUERY, (startDateStr,))), ROLLUP_METRICS
+    
+    # Lit une série de moyennes par bucket depuis une table de rollup
+    def _getRollupSeries(self, resolution, startDate):
+        """
+        Args:
+            resolution: Une entrée de ROLLUP_RESOLUTIONS
+            startDate: Début de la période
             
-            cursor = self.connection.cursor()
-            cursor.execute(query, (startDateStr,))
-            rows = cursor.fetchall()
-            cursor.close()
+        Returns:
+            Une liste de tuples (début du bucket, moyennes dans l'ordre de ROLLUP_METRICS),
+            du plus récent au plus ancien, None en cas d'erreur ou si le rollup n'a aucune
+            ligne sur la période (les données brutes sont alors lues)
+        """
+        name, table, duration, bucketFormat = resolution
+        query = _rollupSeriesQuery(table)
+        try:
+            with self._connection() as connection, self._statement(connection, query) as cursor:
+                cursor.execute(query, (bucketStart(startDate, name),))
+                rows = cursor.fetchall()
+        except Exception as e:
+            log.error("Erreur lors de la lecture du rollup %s: %s", table, e)
+            return None
+        if not rows:
+            return None
+        
+        # Pivoter les lignes (bucket, métrique, moyenne) en une ligne par bucket
+        positions = {metric: i + 1 for i, metric in enumerate(ROLLUP_METRICS)}
+        buckets = {}
+        for start, metric, average in rows:
+            data = buckets.get(start)
+            if data is None:
+                data = buckets[start] = [start] + [None] * len(ROLLUP_METRICS)
+            if metric in positions:
+                data[positions[metric]] = _toFloat(average)
+        
+        return [tuple(data) for data in buckets.values()]
+    
+    # Récupère une série sous-échantillonnée d'une métrique
+    def getSeriesByTimeframe(self, metric, timeframe='day', points=500, method='minmax'):
+        """
+        Args:
+            metric: Colonne de sensor_data ('temperature', 'humidity', ...)
+            timeframe: Période ('hour', 'day', 'week', 'month')
+            points: Nombre maximum de points à retourner
+            method: 'minmax' (min/moyenne/max par intervalle, calculés par le serveur),
+                    'avg' (idem, la moyenne seule) ou 'lttb' (points réels conservant la forme de la courbe)
             
-            # Convertir les résultats en objets SensorData
-            result = []
-            for row in rows:
-                data = {
-                    'timestamp': row[0],
-                    'airQuality': row[1],
-                    'distance': row[2],
-                    'luminosity': row[3],
-                    'uvIndex': row[4],
-                    'irValue': row[5],
-                    'temperature': row[6],
-                    'pressure': row[7],
-                    'humidity': row[8]
-                }
-                result.append(SensorData.fromDict(data))
+        Returns:
+            Une liste triée par date croissante de tuples (date, min, moyenne, max) pour 'minmax',
+            (date, valeur) sinon ; une liste vide en cas d'erreur
+        """
+        if metric not in ROLLUP_METRICS:
+            log.warning("Métrique inconnue: %s", metric)
+            return []
+        
+        window = TIMEFRAMES.get(timeframe, TIMEFRAMES['day'])
+        startDate = datetime.now() - window
+        
+        # LTTB choisit parmi des points plus nombreux que le résultat, eux-mêmes bornés
+        if method == 'lttb':
+            width = window / (points * DOWNSAMPLING_CONFIG['lttb_oversampling'])
+        else:
+            width = window / points
+        
+        buckets = self._getBucketedData(startDate, width, (metric,))
+        if buckets is None:
+            return []
+        
+        series = [(start, values[metric]) for start, values in reversed(buckets) if values[metric][1] is not None]
+        if method == 'minmax':
+            return [(start, minimum, average, maximum) for start, (minimum, average, maximum) in series]
+        
+        averages = [(start, average) for start, (minimum, average, maximum) in series]
+        if method == 'lttb':
+            sampled = lttb([(start.timestamp(), average) for start, average in averages], points)
+            return [(datetime.fromtimestamp(x), y) for x, y in sampled]
+        return averages
+    
+    # Agrège une période en intervalles de durée fixe (depuis un rollup si leur résolution le permet)
+    def _getBucketedData(self, startDate, width, metrics=ROLLUP_METRICS):
+        """
+        Args:
+            startDate: Début de la période
+            width: Durée (timedelta) d'un intervalle
+            metrics: Métriques à agréger
             
-            return result
+        Returns:
+            Une liste de tuples (début de l'intervalle, {métrique: (min, moyenne, max)})
+            du plus récent au plus ancien, None en cas d'erreur
+        """
+        seconds = max(1, int(width.total_seconds()))
+        
+        resolution = self._rollupFor(timedelta(seconds=seconds), 1)
+        if resolution is not None:
+            name, table, duration, bucketFormat = resolution
+            query = _bucketedRollupQuery(table, len(metrics))
+            params = (seconds, bucketStart(startDate, name)) + tuple(metrics)
+        else:
+            query = _bucketedRawQuery(tuple(metrics))
+            params = (seconds, startDate.strftime('%Y-%m-%d %H:%M:%S'))
+        
+        try:
+            with self._connection() as connection, self._statement(connection, query) as cursor:
+                cursor.execute(query, params)
+                rows = cursor.fetchall()
         except Exception as e:
-            print(f"Erreur lors de la récupération des données: {str(e)}")
-            return []
+            log.error("Erreur lors de l'agrégation par intervalles: %s", e)
+            return None
+        
+        buckets = {}
+        if resolution is not None:
+            for bucket, metric, minimum, average, maximum in rows:
+                values = buckets.get(bucket)
+                if values is None:
+                    values = buckets[bucket] = {m: (None, None, None) for m in metrics}
+                values[metric] = (_toFloat(minimum), _toFloat(average), _toFloat(maximum))
+        else:
+            for row in rows:
+                buckets[row[0]] = {metric: tuple(_toFloat(value) for value in row[1 + 3 * i:4 + 3 * i]) for i, metric in enumerate(metrics)}
+        
+        return [(datetime.fromtimestamp(int(bucket) * seconds), values) for bucket, values in buckets.items()]
     
     # Récupère la liste des tables de la base de données
     def getTablesList(self):
@@ -205,25 +691,38 @@ class QueryManager:
             Une liste des noms de tables
         """
         try:
-            if self.connection is None:
-                print("Erreur: Connexion à la base de données non établie")
+            if not self.isAvailable():
+                log.error("Erreur: Connexion à la base de données non établie")
                 return []
                 
             query = "SHOW TABLES"
             
-            cursor = self.connection.cursor()
-            cursor.execute(query)
-            rows = cursor.fetchall()
-            cursor.close()
+            with self._connection() as connection:
+                cursor = connection.cursor()
+                cursor.execute(query)
+                rows = cursor.fetchall()
+                cursor.close()
             
             # Extraire les noms de tables
             tables = [row[0] for row in rows]
+            self._tableSchemas.clear()
             
             return tables
         except Exception as e:
-            print(f"Erreur lors de la récupération des tables: {str(e)}")
+            log.error("Erreur lors de la récupération des tables: %s", e)
             return []
     
+    # Récupère les noms des colonnes d'une table
+    def getTableColumns(self, tableName):
+        """
+        Args:
+            tableName: Nom de la table
+            
+        Returns:
+            Une liste des noms de colonnes
+        """
+        return self.getTableSchema(tableName)[0]
+    
     # Récupère les données d'une table
     def getTableData(self, tableName, limit=100):
         """
@@ -232,87 +731,174 @@ class QueryManager:
             limit: Nombre maximum de lignes à récupérer
             
         Returns:
-            Un tuple (colonnes, lignes)
+            Un tuple (colonnes, lignes), les plus récentes en premier
         """
-        try:
-            # Récupérer les informations sur les colonnes
-            queryColumns = f"SHOW COLUMNS FROM {tableName}"
+        return self.getTablePage(tableName, limit=limit)
+    
+    # Décrit une table pour la pagination : colonnes, clé primaire et première colonne de date
+    def getTableSchema(self, tableName):
+        """
+        Args:
+            tableName: Nom de la table
             
-            cursor = self.connection.cursor()
-            cursor.execute(queryColumns)
+        Returns:
+            Un tuple (colonnes, colonnes de la clé primaire, colonne de date ou None)
+        """
+        schema = self._tableSchemas.get(tableName)
+        if schema is not None:
+            return schema
+        
+        with self._connection() as connection:
+            cursor = connection.cursor()
+            cursor.execute(f"SHOW COLUMNS FROM {_quoteIdentifier(tableName)}")
             columnsInfo = cursor.fetchall()
-            
-            # Extraire les noms de colonnes
-            columns = [col[0] for col in columnsInfo]
-            
-            # Récupérer les données
-            queryData = f"SELECT * FROM {tableName} ORDER BY id DESC LIMIT {limit}"
-            
-            cursor.execute(queryData)
-            rows = cursor.fetchall()
+            # Colonnes de la clé primaire dans l'ordre de l'index
+            cursor.execute(f"SHOW KEYS FROM {_quoteIdentifier(tableName)} WHERE Key_name = 'PRIMARY'")
+            keysInfo = cursor.fetchall()
             cursor.close()
+        
+        columns = [col[0] for col in columnsInfo]
+        keyColumns = [key[4] for key in keysInfo] or columns[:1]
+        timeColumn = next((col[0] for col in columnsInfo if str(col[1]).lower().startswith(('datetime', 'timestamp'))), None)
+        schema = self._tableSchemas[tableName] = (columns, keyColumns, timeColumn)
+        return schema
+    
+    # Lit une page d'une table par pagination sur la clé primaire (keyset)
+    def getTablePage(self, tableName, key=None, direction='older', inclusive=False, limit=None):
+        """
+        La page commence juste après la clé donnée, sans OFFSET : le serveur
+        descend directement dans l'index de la clé primaire, le coût d'une page
+        ne dépend donc pas de sa position dans la table.
+        
+        Args:
+            tableName: Nom de la table
+            key: Tuple des valeurs de la clé primaire servant de borne (None : lignes les plus récentes)
+            direction: 'older' (clés inférieures) ou 'newer' (clés supérieures)
+            inclusive: Inclure la ligne de la borne elle-même
+            limit: Nombre maximum de lignes (page_size par défaut)
             
+        Returns:
+            Un tuple (colonnes, lignes), lignes triées par clé décroissante
+        """
+        try:
+            columns, keyColumns, timeColumn = self.getTableSchema(tableName)
+            limit = limit or TABLE_BROWSER_CONFIG['page_size']
+            keyList = ', '.join(_quoteIdentifier(col) for col in keyColumns)
+            newer = direction == 'newer'
+            
+            query = f"SELECT * FROM {_quoteIdentifier(tableName)}"
+            params = ()
+            if key is not None:
+                operator = ('>' if newer else '<') + ('=' if inclusive else '')
+                query += f" WHERE ({keyList}) {operator} ({', '.join(['%s'] * len(keyColumns))})"
+                params = tuple(key)
+            order = 'ASC' if newer else 'DESC'
+            query += f" ORDER BY {', '.join(f'{_quoteIdentifier(col)} {order}' for col in keyColumns)} LIMIT %s"
+            
+            with self._connection() as connection:
+                cursor = connection.cursor()
+                cursor.execute(query, params + (limit,))
+                rows = cursor.fetchall()
+                cursor.close()
+            
+            if newer:
+                rows.reverse()
             return columns, rows
         except Exception as e:
-            print(f"Erreur lors de la récupération des données de la table: {str(e)}")
+            log.error("Erreur lors de la récupération des données de la table: %s", e)
             return [], []
     
-    def executeCustomQuery(self, query, params=None):
+    # Lit la page d'une table commençant à une date donnée
+    def getTablePageAt(self, tableName, timestamp, limit=None):
         """
         Args:
-            query: Requête SQL
-            params: Paramètres de la requête
+            tableName: Nom de la table
+            timestamp: Date (datetime ou chaîne 'AAAA-MM-JJ HH:MM:SS') de la première ligne
+            limit: Nombre maximum de lignes (page_size par défaut)
             
         Returns:
-            Un tuple (colonnes, lignes)
+            Un tuple (colonnes, lignes) commençant par la dernière ligne antérieure ou égale à la date,
+            (colonnes, []) si la table n'a pas de colonne de date ou aucune ligne antérieure
         """
         try:
-            cursor = self.connection.cursor()
-            
-            if params:
-                cursor.execute(query, params)
-            else:
-                cursor.execute(query)
-            
-            # Si c'est une requête SELECT, récupérer les résultats
-            if query.strip().upper().startswith('SELECT'):
-                columns = [col[0] for col in cursor.description]
+            columns, keyColumns, timeColumn = self.getTableSchema(tableName)
+            if timeColumn is None:
+                log.warning("La table %s n'a pas de colonne de date", tableName)
+                return columns, []
+            
+            # Clé de la ligne la plus proche (utilise l'index de la colonne de date)
+            keyList = ', '.join(_quoteIdentifier(col) for col in keyColumns)
+            query = f"""
+                SELECT {keyList} FROM {_quoteIdentifier(tableName)}
+                WHERE {_quoteIdentifier(timeColumn)} <= %s
+                ORDER BY {_quoteIdentifier(timeColumn)} DESC
+                LIMIT 1
+            """
+            with self._connection() as connection:
+                cursor = connection.cursor()
+                cursor.execute(query, (timestamp,))
                 rows = cursor.fetchall()
                 cursor.close()
-                return columns, rows
-            else:
-                # Pour les autres types de requêtes (INSERT, UPDATE, DELETE)
-                self.connection.commit()
-                affectedRows = cursor.rowcount
-                cursor.close()
-                return [], [(f"{affectedRows} lignes affectées",)]
         except Exception as e:
-            print(f"Erreur lors de l'exécution de la requête: {str(e)}")
-            return [], [(f"Erreur: {str(e)}",)]
-
-    # Méthode pour convertir une instance SensorData en format pour BDD
-    def _sensorDataToDbFormat(self, sensorData):
+            log.error("Erreur lors de la recherche par date: %s", e)
+            return [], []
+        
+        if not rows:
+            return columns, []
+        return self.getTablePage(tableName, rows[0], 'older', inclusive=True, limit=limit)
+    
+    # Lit toutes les lignes d'une table par paquets, des plus récentes aux plus anciennes
+    def streamTableData(self, tableName, chunkSize=None):
         """
-        Convertit une instance SensorData en format pour insertion dans la base de données.
+        Les colonnes sont données par getTableColumns().
         
         Args:
-            sensorData: L'instance SensorData à convertir
+            tableName: Nom de la table
+            chunkSize: Nombre de lignes par paquet (chunk_size par défaut)
+            
+        Yields:
+            Des listes de tuples
+        """
+        try:
+            keyColumns = self.getTableSchema(tableName)[1]
+            order = ', '.join(f"{_quoteIdentifier(col)} DESC" for col in keyColumns)
+            yield from self._stream(f"SELECT * FROM {_quoteIdentifier(tableName)} ORDER BY {order}", chunkSize=chunkSize)
+        except Exception as e:
+            log.error("Erreur lors de la lecture de la table: %s", e)
+    
+    def executeCustomQuery(self, query, params=None):
+        """
+        Args:
+            query: Requête SQL
+            params: Paramètres de la requête
             
         Returns:
-            Un tuple contenant les valeurs à insérer dans la base de données
-        """
-        return (
-            sensorData.air_quality if sensorData.air_quality and sensorData.air_quality > 0 else None,
-            sensorData.distance if sensorData.distance and sensorData.distance > 0 else None,
-            sensorData.luminosity if sensorData.luminosity and sensorData.luminosity > 0 else None,
-            sensorData.uvIndex if sensorData.uvIndex and sensorData.uvIndex > 0 else None,
-            sensorData.irValue if sensorData.irValue and sensorData.irValue > 0 else None,
-            sensorData.temperature if sensorData.temperature else None,
-            sensorData.pressure if sensorData.pressure and sensorData.pressure > 0 else None,
-            sensorData.humidity if sensorData.humidity and sensorData.humidity > 0 else None,
-            sensorData.timestamp,
-            sensorData.rawData
-        )
+            Un tuple (colonnes, lignes)
+        """
+        try:
+            with self._connection() as connection:
+                cursor = connection.cursor()
+            
+                if params:
+                    cursor.execute(query, params)
+                else:
+                    cursor.execute(query)
+            
+                # Si c'est une requête SELECT, récupérer les résultats
+                if query.strip().upper().startswith('SELECT'):
+                    columns = [col[0] for col in cursor.description]
+                    rows = cursor.fetchall()
+                    cursor.close()
+                    return columns, rows
+                else:
+                    # Pour les autres types de requêtes (INSERT, UPDATE, DELETE)
+                    connection.commit()
+                    affectedRows = cursor.rowcount
+                    cursor.close()
+                return [], [(f"{affectedRows} lignes affectées",)]
+        except Exception as e:
+            log.error("Erreur lors de l'exécution de la requête: %s", e)
+            return [], [(f"Erreur: {str(e)}",)]
 
     # Méthode pour récupérer les n dernières mesures
     def getLastMeasurements(self, limit=10):
@@ -326,45 +912,34 @@ class QueryManager:
             Une liste de dictionnaires contenant les mesures, ou None en cas d'erreur
         """
         try:
-            cursor = self.connection.cursor()
-            query = """
-                SELECT id, air_quality, distance, luminosity, uv_index, ir_value, 
-                       temperature, pressure, humidity, timestamp
-                FROM sensor_data
-                ORDER BY timestamp DESC
-                LIMIT %s
-            """
-            cursor.execute(query, (limit,))
-            rows = cursor.fetchall()
+            query = _LAST_MEASUREMENTS_QUERY
+            with self._connection() as connection, self._statement(connection, query) as cursor:
+                cursor.execute(query, (limit,))
+                rows = cursor.fetchall()
             
             if not rows:
                 return []
                 
             results = []
             for row in rows:
-                results.append({
-                    'id': row[0],
-                    'air_quality': row[1],
-                    'distance': row[2],
-                    'luminosity': row[3],
-                    'uv_index': row[4],
-                    'ir_value': row[5],
-                    'temperature': row[6],
-                    'pressure': row[7],
-                    'humidity': row[8],
-                    'timestamp': row[9]
-                })
+                data = dict(zip(METRIC_NAMES, row[1:-1]))
+                data['id'] = row[0]
+                data['timestamp'] = row[-1]
+                results.append(data)
             
             return results
             
         except Exception as e:
-            print(f"Erreur lors de la récupération des dernières mesures: {str(e)}")
+            log.error("Erreur lors de la récupération des dernières mesures: %s", e)
             return None
     
     # Méthode pour calculer la moyenne des valeurs sur une période
     def getAverages(self, hours=1):
         """
         Calcule la moyenne des valeurs des capteurs sur la période spécifiée.
+        Dès que la période couvre au moins aggregate_min_buckets buckets d'un
+        rollup, la moyenne est calculée depuis le rollup le plus grossier
+        (à un bucket près au début de la période).
         
         Args:
             hours: Le nombre d'heures à considérer pour la moyenne (par défaut 1)
@@ -373,39 +948,64 @@ class QueryManager:
             Un dictionnaire contenant les moyennes calculées, ou None en cas d'erreur
         """
         try:
-            cursor = self.connection.cursor()
-            query = """
-                SELECT 
-                    AVG(air_quality) as avg_air_quality,
-                    AVG(distance) as avg_distance,
-                    AVG(luminosity) as avg_luminosity,
-                    AVG(uv_index) as avg_uv,
-                    AVG(ir_value) as avg_ir,
-                    AVG(temperature) as avg_temperature,
-                    AVG(pressure) as avg_pressure,
-                    AVG(humidity) as avg_humidity,
-                    COUNT(*) as count
-                FROM sensor_data
-                WHERE timestamp > DATE_SUB(NOW(), INTERVAL %s HOUR)
-            """
-            cursor.execute(query, (hours,))
-            row = cursor.fetchone()
+            # Début de la période selon l'horloge de l'application, qui horodate aussi les lectures
+            startDate = datetime.now() - timedelta(hours=hours)
+            
+            # Agréger les rollups plutôt que parcourir les lignes brutes
+            resolution = self._rollupFor(timedelta(hours=hours), ROLLUP_CONFIG['aggregate_min_buckets'])
+            if resolution is not None:
+                result = self._getRollupAverages(resolution, startDate)
+                if result is not None:
+                    return result
+            
+            query = _AVERAGES_QUERY
+            with self._connection() as connection, self._statement(connection, query) as cursor:
+                cursor.execute(query, (startDate.strftime('%Y-%m-%d %H:%M:%S'),))
+                # Lire tout le résultat pour pouvoir réutiliser le curseur préparé
+                rows = cursor.fetchall()
+            row = rows[0] if rows else None
             
-            if not row or row[9] == 0:  # Vérifier si count est 0
+            if not row or row[-1] == 0:  # Vérifier si count est 0
                 return None
                 
-            return {
-                'air_quality': row[0],
-                'distance': row[1],
-                'luminosity': row[2],
-                'uv_index': row[3],
-                'ir_value': row[4],
-                'temperature': row[5],
-                'pressure': row[6],
-                'humidity': row[7],
-                'count': row[9]
-            }
+            result = dict(zip(METRIC_NAMES, row[:-1]))
+            result['count'] = row[-1]
+            return result
+            
+        except Exception as e:
+            log.error("Erreur lors du calcul des moyennes: %s", e)
+            return None
+    
+    # Calcule les moyennes d'une période depuis une table de rollup
+    def _getRollupAverages(self, resolution, startDate):
+        """
+        Args:
+            resolution: Une entrée de ROLLUP_RESOLUTIONS
+            startDate: Début de la période
             
+        Returns:
+            Un dictionnaire des moyennes (comme getAverages), None en cas d'erreur ou si le
+            rollup n'a aucune ligne sur la période (les données brutes sont alors lues)
+        """
+        name, table, duration, bucketFormat = resolution
+        query = _rollupAveragesQuery(table)
+        try:
+            with self._connection() as connection, self._statement(connection, query) as cursor:
+                cursor.execute(query, (bucketStart(startDate, name),))
+                rows = cursor.fetchall()
         except Exception as e:
-            print(f"Erreur lors du calcul des moyennes: {str(e)}")
-            return None 
\ No newline at end of file
+            log.error("Erreur lors de la lecture du rollup %s: %s", table, e)
+            return None
+        
+        if not rows:
+            return None
+        
+        result = {metric: None for metric in ROLLUP_METRICS}
+        count = 0
+        for metric, average, metricCount in rows:
+            if metric in result:
+                result[metric] = average
+                # Nombre de lectures : la métrique la plus souvent renseignée
+                count = max(count, int(metricCount))
+        result['count'] = count
+        return result 
\ No newline at end of file
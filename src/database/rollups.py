@@ -0,0 +1,115 @@
+from datetime import timedelta
+from src.models.metrics import METRIC_NAMES
+
+# Métriques agrégées (colonnes de sensor_data, dans l'ordre de Reading.values())
+ROLLUP_METRICS = METRIC_NAMES
+
+# Résolutions disponibles, de la plus fine à la plus grossière : (nom, table, durée d'un bucket, format MySQL du début de bucket)
+ROLLUP_RESOLUTIONS = (
+    ('minute', 'sensor_rollup_minute', timedelta(minutes=1), '%Y-%m-%d %H:%i:00'),
+    ('hour', 'sensor_rollup_hour', timedelta(hours=1), '%Y-%m-%d %H:00:00'),
+    ('day', 'sensor_rollup_day', timedelta(days=1), '%Y-%m-%d 00:00:00'),
+)
+
+# Fusion d'agrégats partiels dans une ligne de rollup existante
+_UPSERT_QUERY = """
+INSERT INTO {table} (bucket_start, device_id, metric, cnt, sum_value, min_value, max_value, sumsq_value)
+VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+ON DUPLICATE KEY UPDATE
+    cnt = cnt + VALUES(cnt),
+    sum_value = sum_value + VALUES(sum_value),
+    min_value = LEAST(min_value, VALUES(min_value)),
+    max_value = GREATEST(max_value, VALUES(max_value)),
+    sumsq_value = sumsq_value + VALUES(sumsq_value)
+"""
+
+# Recalcul complet d'un rollup depuis sensor_data pour une métrique
+_REBUILD_QUERY = """
+INSERT INTO {table} (bucket_start, device_id, metric, cnt, sum_value, min_value, max_value, sumsq_value)
+SELECT DATE_FORMAT(timestamp, '{bucketFormat}'), COALESCE(device_id, ''), '{metric}',
+       COUNT({metric}), SUM({metric}), MIN({metric}), MAX({metric}), SUM({metric} * {metric})
+FROM sensor_data
+WHERE {metric} IS NOT NULL
+GROUP BY DATE_FORMAT(timestamp, '{bucketFormat}'), COALESCE(device_id, '')
+"""
+
+# Retourne la requête de mise à jour incrémentale d'une table de rollup
+def upsertQuery(table):
+    return _UPSERT_QUERY.format(table=table)
+
+# Retourne les requêtes de recalcul complet d'une table de rollup (une par métrique)
+def rebuildQueries(table, bucketFormat):
+    return [_REBUILD_QUERY.format(table=table, bucketFormat=bucketFormat, metric=metric) for metric in ROLLUP_METRICS]
+
+# Tronque un horodatage au début de son bucket
+def bucketStart(timestamp, resolution):
+    """
+    Args:
+        timestamp: Un datetime
+        resolution: 'minute', 'hour' ou 'day'
+
+    Returns:
+        Le datetime du début du bucket
+    """
+    if resolution == 'minute':
+        return timestamp.replace(second=0, microsecond=0)
+    if resolution == 'hour':
+        return timestamp.replace(minute=0, second=0, microsecond=0)
+    return timestamp.replace(hour=0, minute=0, second=0, microsecond=0)
+
+# Choisit la résolution la plus grossière qui garde au moins minBuckets buckets sur la fenêtre
+def resolutionFor(window, minBuckets):
+    """
+    Args:
+        window: Durée (timedelta) de la période demandée
+        minBuckets: Nombre minimum de buckets attendus sur la période
+
+    Returns:
+        Un tuple (nom, table, durée, format) de ROLLUP_RESOLUTIONS, ou None si la période est trop courte
+    """
+    chosen = None
+    for resolution in ROLLUP_RESOLUTIONS:
+        if resolution[2] * minBuckets <= window:
+            chosen = resolution
+    return chosen
+
+# Agrège des lectures en lignes de rollup pour toutes les résolutions
+def aggregateRows(rows):
+    """
+    Args:
+        rows: Liste de Reading
+
+    Returns:
+        Un dictionnaire {table: [(bucket_start, device_id, metric, cnt, sum, min, max, sumsq), ...]}
+    """
+    buckets = {}
+    for row in rows:
+        timestamp = row.timestamp
+        deviceId = row.deviceId or ''
+
+        for metric, value in zip(ROLLUP_METRICS, row.values()):
+            if value is None:
+                continue
+            try:
+                value = float(value)
+            except (TypeError, ValueError):
+                continue
+
+            for name, table, duration, bucketFormat in ROLLUP_RESOLUTIONS:
+                key = (table, bucketStart(timestamp, name), deviceId, metric)
+                current = buckets.get(key)
+                if current is None:
+                    buckets[key] = [1, value, value, value, value * value]
+                else:
+                    current[0] += 1
+                    current[1] += value
+                    if value < current[2]:
+                        current[2] = value
+                    if value > current[3]:
+                        current[3] = value
+                    current[4] += value * value
+
+    result = {}
+    for (table, start, deviceId, metric), (count, total, minimum, maximum, squares) in buckets.items():
+        result.setdefault(table, []).append((start, deviceId, metric, count, total, minimum, maximum, squares))
+    return result
@@ -0,0 +1,105 @@
+from operator import attrgetter
+
+# Description d'une métrique mesurée par les capteurs
+class Metric:
+    __slots__ = ('name', 'attribute', 'aliases', 'type', 'unit', 'label', 'displayFormat', 'column', 'wireKey', 'parserLabels', 'icon')
+
+    def __init__(self, name, attribute, aliases, type, unit, label, displayFormat, wireKey, parserLabels, icon):
+        """
+        Args:
+            name: Nom canonique (identique à la colonne de sensor_data)
+            attribute: Attribut correspondant du modèle Sensor
+            aliases: Autres noms acceptés dans les dictionnaires reçus
+            type: float ou int
+            unit: Unité affichée (None si sans unité)
+            label: Libellé affiché dans l'interface
+            displayFormat: Spécification de format de la valeur affichée
+            wireKey: Clé du format standard "AQ:800,DIST:2.5,..."
+            parserLabels: Dictionnaire {libellé Arduino sans accent: type de la valeur}
+            icon: Chemin de l'icône du tableau de bord
+        """
+        self.name = name
+        self.attribute = attribute
+        self.aliases = aliases
+        self.type = type
+        self.unit = unit
+        self.label = label
+        self.displayFormat = displayFormat
+        self.column = name
+        self.wireKey = wireKey
+        self.parserLabels = parserLabels
+        self.icon = icon
+
+    # Convertit une valeur textuelle reçue de l'Arduino
+    def parse(self, text, type=None):
+        """
+        Args:
+            text: Valeur numérique sous forme de texte
+            type: Type à appliquer (celui de la métrique par défaut)
+
+        Returns:
+            La valeur convertie (les entiers sont tronqués comme sur l'Arduino)
+        """
+        if (type or self.type) is int:
+            return int(float(text))
+        return float(text)
+
+    # Formate une valeur pour l'affichage ('N/A' si absente)
+    def formatValue(self, value):
+        if value is None or value == 'N/A':
+            return "N/A"
+        try:
+            return format(value, self.displayFormat)
+        except (TypeError, ValueError):
+            return str(value)
+
+    def __repr__(self):
+        return f"Metric({self.name!r})"
+
+# Registre des métriques, dans l'ordre des colonnes de sensor_data
+# (air_quality reçoit la valeur brute du MQ135 ; la ligne "MQ135 - Air Quality" est ignorée
+#  pour ne pas mélanger deux unités dans la même colonne)
+METRICS = (
+    Metric('air_quality', 'air_quality', ('airQuality', 'AQ'), int, 'ppm', "Air Quality", '',
+           'AQ', {'Valeur lue': int}, "src/public/icons/air-quality.png"),
+    Metric('distance', 'distance', ('dist', 'DIST'), float, 'm', "Distance", '.2f',
+           'DIST', {'Distance': float}, "src/public/icons/ruler.png"),
+    Metric('luminosity', 'luminosity', ('lum', 'LUM'), int, 'lux', "Luminosité", '',
+           'LUM', {'Luminosite': int, 'Visible': int}, "src/public/icons/sun.png"),
+    Metric('uv_index', 'uvIndex', ('uvIndex', 'UV'), float, None, "UV Index", '.2f',
+           'UV', {'UV': float}, "src/public/icons/uv.png"),
+    Metric('ir_value', 'irValue', ('irValue', 'IR'), int, None, "Infrarouge", '',
+           'IR', {'IR': int}, "src/public/icons/ir.png"),
+    Metric('temperature', 'temperature', ('temp', 'TEMP'), float, '°C', "Température", '.1f',
+           'TEMP', {'Temperature': float}, "src/public/icons/thermometer.png"),
+    Metric('pressure', 'pressure', ('press', 'PRESS'), int, 'hPa', "Pression", '',
+           'PRESS', {'Pression': int}, "src/public/icons/barometer.png"),
+    Metric('humidity', 'humidity', ('hum', 'HUM'), int, '%', "Humidité", '',
+           'HUM', {'Humidite': int}, "src/public/icons/humidity.png"),
+)
+
+# Tables de correspondance calculées une seule fois au chargement du module
+
+# Noms canoniques, dans l'ordre des colonnes
+METRIC_NAMES = tuple(metric.name for metric in METRICS)
+
+# Attributs du modèle Sensor, dans le même ordre
+METRIC_ATTRIBUTES = tuple(metric.attribute for metric in METRICS)
+
+# Nom canonique -> Metric
+METRICS_BY_NAME = {metric.name: metric for metric in METRICS}
+
+# Clé du format standard (AQ, DIST, ...) -> Metric
+METRICS_BY_WIRE_KEY = {metric.wireKey: metric for metric in METRICS}
+
+# Tout nom accepté dans un dictionnaire (canonique, attribut, alias) -> nom canonique
+METRIC_ALIASES = {}
+for _metric in METRICS:
+    for _key in (_metric.name, _metric.attribute) + _metric.aliases:
+        METRIC_ALIASES.setdefault(_key, _metric.name)
+
+# Libellé Arduino sans accent -> (Metric, type de la valeur)
+METRICS_BY_LABEL = {label: (metric, type) for metric in METRICS for label, type in metric.parserLabels.items()}
+
+# Lit les valeurs des métriques d'un objet Sensor dans l'ordre des colonnes
+sensorValues = attrgetter(*METRIC_ATTRIBUTES)
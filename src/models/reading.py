@@ -0,0 +1,138 @@
+import time
+from datetime import datetime
+from src.models.metrics import METRIC_ALIASES, METRIC_NAMES, sensorValues
+
+# Métriques d'une lecture, dans l'ordre des colonnes de sensor_data
+READING_FIELDS = METRIC_NAMES
+
+# Colonnes de sensor_data renseignées par une lecture
+READING_COLUMNS = ('timestamp', 'device_id') + READING_FIELDS
+
+# Tout nom accepté dans un dictionnaire reçu de l'extérieur -> champ de la lecture
+_FIELD_ALIASES = dict(METRIC_ALIASES, deviceId='device_id', device_id='device_id', timestamp='timestamp', time='timestamp', date='timestamp')
+
+# Lecture horodatée des capteurs : champs fixes, sans dictionnaire par instance
+class Reading:
+    __slots__ = ('timestampNs', 'deviceId') + READING_FIELDS
+
+    # Initialise une lecture
+    def __init__(self, timestampNs=None, deviceId=None, air_quality=None, distance=None, luminosity=None,
+                 uv_index=None, ir_value=None, temperature=None, pressure=None, humidity=None):
+        """
+        Args:
+            timestampNs: Horodatage en nanosecondes depuis l'epoch (maintenant par défaut)
+            deviceId: Identifiant de l'appareil source (None pour la démo)
+            air_quality, ..., humidity: Valeurs des métriques (None si non mesurées)
+        """
+        self.timestampNs = time.time_ns() if timestampNs is None else timestampNs
+        self.deviceId = deviceId
+        self.air_quality = air_quality
+        self.distance = distance
+        self.luminosity = luminosity
+        self.uv_index = uv_index
+        self.ir_value = ir_value
+        self.temperature = temperature
+        self.pressure = pressure
+        self.humidity = humidity
+
+    # Crée une lecture à partir de l'état courant d'un capteur
+    @classmethod
+    def fromSensor(cls, sensor, deviceId=None, timestampNs=None):
+        """
+        Args:
+            sensor: Le modèle Sensor
+            deviceId: Identifiant de l'appareil source
+            timestampNs: Horodatage en nanosecondes (maintenant par défaut)
+
+        Returns:
+            Une nouvelle Reading
+        """
+        return cls(timestampNs, deviceId, *sensorValues(sensor))
+
+    # Crée une lecture à partir d'un dictionnaire (noms alternatifs acceptés, 'N/A' ignoré)
+    @classmethod
+    def fromDict(cls, data):
+        """
+        Normalisation faite une seule fois, à l'entrée du pipeline : les
+        étapes suivantes lisent directement les attributs de la lecture.
+
+        Args:
+            data: Un dictionnaire de données capteurs
+
+        Returns:
+            Une nouvelle Reading
+        """
+        # Une recherche par clé reçue ; pour un même champ, la première valeur trouvée est conservée
+        values = {}
+        for key, value in data.items():
+            field = _FIELD_ALIASES.get(key)
+            if field is None or value is None or value == 'N/A' or field in values:
+                continue
+            values[field] = value
+
+        reading = cls(_toNs(values.pop('timestamp', None)), values.pop('device_id', None))
+        for field, value in values.items():
+            setattr(reading, field, value)
+        return reading
+
+    # Crée une lecture à partir d'une ligne produite par toRow()
+    @classmethod
+    def fromRow(cls, row):
+        return cls(*row)
+
+    # Horodatage sous forme de datetime
+    @property
+    def timestamp(self):
+        return datetime.fromtimestamp(self.timestampNs / 1e9)
+
+    # Retourne la valeur d'un champ par son nom de colonne (comme dict.get)
+    def get(self, key, default=None):
+        if key == 'device_id':
+            return self.deviceId
+        if key == 'timestamp':
+            return self.timestamp
+        value = getattr(self, key, None) if key in READING_FIELDS else None
+        return default if value is None else value
+
+    # Retourne les valeurs des métriques dans l'ordre de READING_FIELDS
+    def values(self):
+        return (self.air_quality, self.distance, self.luminosity, self.uv_index,
+                self.ir_value, self.temperature, self.pressure, self.humidity)
+
+    # Retourne la lecture sous forme de ligne compacte (horodatage, appareil, métriques)
+    def toRow(self):
+        return (self.timestampNs, self.deviceId) + self.values()
+
+    # Retourne les valeurs à insérer dans les colonnes READING_COLUMNS
+    def toColumns(self):
+        """
+        Returns:
+            Un tuple (datetime à la seconde, appareil, métriques), TIMESTAMP n'ayant pas de fraction de seconde
+        """
+        return (datetime.fromtimestamp(self.timestampNs // 1_000_000_000), self.deviceId) + self.values()
+
+    # Convertit la lecture en dictionnaire {colonne: valeur}
+    def toDict(self):
+        data = dict(zip(READING_FIELDS, self.values()))
+        data['device_id'] = self.deviceId
+        data['timestamp'] = self.timestamp
+        return data
+
+    def __repr__(self):
+        fields = ', '.join(f"{field}={value!r}" for field, value in zip(READING_FIELDS, self.values()) if value is not None)
+        return f"Reading({self.timestamp:%Y-%m-%d %H:%M:%S}, device={self.deviceId!r}, {fields})"
+
+# Convertit un horodatage (datetime, texte ISO, secondes ou nanosecondes) en nanosecondes
+def _toNs(timestamp):
+    if timestamp is None:
+        return None
+    if isinstance(timestamp, datetime):
+        return int(timestamp.timestamp() * 1_000_000_000)
+    if isinstance(timestamp, str):
+        try:
+            return int(datetime.fromisoformat(timestamp).timestamp() * 1_000_000_000)
+        except ValueError:
+            return None
+    if isinstance(timestamp, int) and timestamp > 10**12:
+        return timestamp
+    return int(float(timestamp) * 1_000_000_000)
@@ -1,10 +1,18 @@
 from datetime import datetime
+from src.models.metrics import METRIC_ALIASES, METRICS_BY_NAME
+
+# Tout nom accepté dans un dictionnaire -> attribut de SensorData
+_KEY_TO_ATTRIBUTE = {key: METRICS_BY_NAME[name].attribute for key, name in METRIC_ALIASES.items()}
+_KEY_TO_ATTRIBUTE.update(timestamp='timestamp', time='timestamp', date='timestamp', rawData='rawData', raw_data='rawData', raw='rawData')
 
 # Classe pour représenter les données des capteurs
 class SensorData:
+    __slots__ = ('air_quality', 'distance', 'luminosity', 'uvIndex', 'irValue', 'temperature',
+                 'pressure', 'humidity', 'timestamp', 'rawData', 'minimum', 'maximum')
+
     def __init__(self, air_quality=None, distance=None, luminosity=None,
                  uvIndex=None, irValue=None, temperature=None, pressure=None, 
-                 humidity=None, timestamp=None, rawData=None):
+                 humidity=None, timestamp=None, rawData=None, minimum=None, maximum=None):
         """
         Initialise les données du capteur.
         
@@ -19,6 +27,8 @@ class SensorData:
             humidity: Humidité relative en %
             timestamp: Horodatage de la mesure
             rawData: Données brutes reçues
+            minimum: Pour un point agrégé, {métrique: minimum de l'intervalle} (None sinon)
+            maximum: Pour un point agrégé, {métrique: maximum de l'intervalle} (None sinon)
         """
         self.air_quality = air_quality
         self.distance = distance
@@ -30,6 +40,8 @@ class SensorData:
         self.humidity = humidity
         self.timestamp = timestamp or datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         self.rawData = rawData
+        self.minimum = minimum
+        self.maximum = maximum
 
     # Convertit un dictionnaire en objet SensorData
     @classmethod
@@ -46,57 +58,15 @@ class SensorData:
         if not data_dict:
             return None
         
-        # Définition des mappages de clés
-        key_mapping = {
-            'air_quality': ['air_quality', 'airQuality', 'AQ'],
-            'distance': ['distance', 'dist', 'DIST'],
-            'luminosity': ['luminosity', 'lum', 'LUM'],
-            'uvIndex': ['uvIndex', 'uv_index', 'UV'],
-            'irValue': ['irValue', 'ir_value', 'IR'],
-            'temperature': ['temperature', 'temp', 'TEMP'],
-            'pressure': ['pressure', 'press', 'PRESS'],
-            'humidity': ['humidity', 'hum', 'HUM'],
-            'timestamp': ['timestamp', 'time', 'date'],
-            'rawData': ['rawData', 'raw_data', 'raw']
-        }
-        
-        # Fonction pour obtenir la valeur d'une clé en vérifiant différentes alternatives
-        def get_value_from_dict(keys):
-            for key in keys:
-                if key in data_dict and data_dict[key] is not None:
-                    return data_dict[key]
-            return None
-        
-        # Extraire les valeurs
-        air_quality = get_value_from_dict(key_mapping['air_quality'])
-        distance = get_value_from_dict(key_mapping['distance'])
-        luminosity = get_value_from_dict(key_mapping['luminosity'])
-        uv_index = get_value_from_dict(key_mapping['uvIndex'])
-        ir_value = get_value_from_dict(key_mapping['irValue'])
-        temperature = get_value_from_dict(key_mapping['temperature'])
-        pressure = get_value_from_dict(key_mapping['pressure'])
-        humidity = get_value_from_dict(key_mapping['humidity'])
-        timestamp = get_value_from_dict(key_mapping['timestamp'])
-        raw_data = get_value_from_dict(key_mapping['rawData'])
-        
-        # Afficher les valeurs extraites pour le débogage
-        print(f"Valeurs extraites: air_quality={air_quality}, " +
-              f"distance={distance}, luminosity={luminosity}, uv_index={uv_index}, " +
-              f"ir_value={ir_value}, temperature={temperature}, pressure={pressure}, humidity={humidity}")
+        # Une recherche par clé reçue ; pour un même attribut, la première valeur non nulle est conservée
+        values = {}
+        for key, value in data_dict.items():
+            attribute = _KEY_TO_ATTRIBUTE.get(key)
+            if attribute is not None and value is not None and attribute not in values:
+                values[attribute] = value
         
         # Créer l'objet SensorData
-        return cls(
-            air_quality=air_quality,
-            distance=distance,
-            luminosity=luminosity,
-            uvIndex=uv_index,
-            irValue=ir_value,
-            temperature=temperature,
-            pressure=pressure,
-            humidity=humidity,
-            timestamp=timestamp,
-            rawData=raw_data
-        )
+        return cls(**values)
     
     # Convertit l'objet SensorData en dictionnaire
     def toDict(self):
@@ -0,0 +1,91 @@
+import re
+from src.models.metrics import METRICS, METRICS_BY_LABEL, METRICS_BY_WIRE_KEY
+
+# Motif unique couvrant tous les formats de lignes envoyés par l'Arduino/XBee :
+# - "SI1145 - UV: 0.35", "BME680 - Pression: 1010.01 hPa", "Temperature = 24.97 *C", ...
+# - "AQ:800,DIST:2.5,LUM:800,TEMP:24.5,PRESS:1010,HUM:65"
+# Compilé une seule fois au chargement du module.
+_LINE_PATTERN = re.compile(
+    r'(?:(?P<sensor>SI1145|MQ135|BME680|HC_SR04)\s*-\s*)?'
+    r'\b(?P<label>Temperature|Pression|Humidit(?:é|e|Ã©)|Luminosit(?:é|e|Ã©)|Distance|Visible|UV|IR|Valeur lue)'
+    r'\s*[:=]\s*(?P<value>-?\d+(?:\.\d+)?)'
+    r'|\b(?P<key>' + '|'.join(METRICS_BY_WIRE_KEY) + r'):(?P<keyValue>-?\d+(?:\.\d+)?)'
+)
+
+# Enregistrement des valeurs extraites d'une ligne de données
+class SensorUpdate:
+    __slots__ = ('values', 'sensor')
+
+    def __init__(self, values, sensor=None):
+        """
+        Args:
+            values: Dictionnaire {attribut du capteur: valeur convertie}
+            sensor: Nom du capteur source (SI1145, MQ135, BME680, HC_SR04) ou None
+        """
+        self.values = values
+        self.sensor = sensor
+
+    def __bool__(self):
+        return bool(self.values)
+
+    def __repr__(self):
+        return f"SensorUpdate(sensor={self.sensor!r}, values={self.values!r})"
+
+# Analyse une ligne de données en un seul passage
+def parseLine(dataStr):
+    """
+    Args:
+        dataStr: Ligne de données reçue (format standard ou format Arduino)
+
+    Returns:
+        Un SensorUpdate contenant les valeurs reconnues, ou None si aucune
+    """
+    if not dataStr:
+        return None
+
+    values = {}
+    sensor = None
+    for match in _LINE_PATTERN.finditer(dataStr):
+        key = match.group('key')
+        try:
+            if key is not None:
+                metric = METRICS_BY_WIRE_KEY[key]
+                values[metric.attribute] = metric.parse(match.group('keyValue'))
+                continue
+
+            label = match.group('label')
+            if label.startswith('Humidit'):
+                label = 'Humidite'
+            elif label.startswith('Luminosit'):
+                label = 'Luminosite'
+            metric, type = METRICS_BY_LABEL[label]
+            value = metric.parse(match.group('value'), type)
+
+            # Le HC-SR04 mesure en cm, le modèle stocke des mètres
+            if match.group('sensor') == 'HC_SR04' and metric.name == 'distance':
+                value = value / 100.0
+
+            values[metric.attribute] = value
+            sensor = match.group('sensor') or sensor
+        except ValueError:
+            continue
+
+    if not values:
+        return None
+    return SensorUpdate(values, sensor)
+
+# Formate des valeurs au format standard "AQ:800,DIST:2.50,..." (valeurs absentes omises)
+def formatLine(sensor):
+    """
+    Args:
+        sensor: Un objet ayant les attributs du modèle Sensor
+
+    Returns:
+        La ligne formatée (vide si aucune valeur n'est connue)
+    """
+    parts = []
+    for metric in METRICS:
+        value = getattr(sensor, metric.attribute)
+        if value is not None:
+            parts.append(f"{metric.wireKey}:{format(value, metric.displayFormat)}")
+    return ",".join(parts)
@@ -0,0 +1,131 @@
+import math
+from array import array
+from datetime import datetime
+from src.models.metrics import METRIC_NAMES
+
+# NumPy est optionnel : les statistiques sont vectorisées lorsqu'il est installé
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Métriques stockées dans une série (colonnes de sensor_data)
+SERIES_METRICS = METRIC_NAMES
+
+_NAN = float('nan')
+
+# Série de mesures stockée par colonnes : un vecteur de dates et un vecteur par métrique
+class SensorSeries:
+    __slots__ = ('timestamps', 'columns')
+
+    # Initialise une série vide
+    def __init__(self, metrics=SERIES_METRICS):
+        """
+        Args:
+            metrics: Noms des métriques stockées
+        """
+        # Dates en secondes depuis l'epoch ; valeurs absentes stockées comme NaN
+        self.timestamps = array('d')
+        self.columns = {metric: array('d') for metric in metrics}
+
+    # Construit une série à partir de lignes (date, valeur1, valeur2, ...)
+    @classmethod
+    def fromRows(cls, rows, metrics=SERIES_METRICS):
+        """
+        Args:
+            rows: Itérable de tuples (datetime, valeurs dans l'ordre de metrics)
+            metrics: Noms des métriques, dans l'ordre des colonnes des lignes
+
+        Returns:
+            Une nouvelle SensorSeries
+        """
+        series = cls(metrics)
+        appendTimestamp = series.timestamps.append
+        appenders = [series.columns[metric].append for metric in metrics]
+        for row in rows:
+            timestamp = row[0]
+            appendTimestamp(timestamp.timestamp() if isinstance(timestamp, datetime) else float(timestamp))
+            for append, value in zip(appenders, row[1:]):
+                append(_NAN if value is None else float(value))
+        return series
+
+    # Nombre de points de la série
+    def __len__(self):
+        return len(self.timestamps)
+
+    # Retourne le vecteur d'une métrique (tableau NumPy sans copie si disponible)
+    def column(self, metric):
+        values = self.columns[metric]
+        if numpy is not None:
+            return numpy.frombuffer(values, dtype=numpy.float64) if len(values) else numpy.empty(0)
+        return values
+
+    # Retourne la date d'un point
+    def datetimeAt(self, index):
+        return datetime.fromtimestamp(self.timestamps[index])
+
+    # Retourne un point sous forme de dictionnaire (valeurs absentes à None)
+    def record(self, index):
+        """
+        Args:
+            index: Position du point dans la série
+
+        Returns:
+            Un dictionnaire {métrique: valeur, 'timestamp': datetime}
+        """
+        data = {'timestamp': self.datetimeAt(index)}
+        for metric, values in self.columns.items():
+            value = values[index]
+            data[metric] = None if value != value else value
+        return data
+
+    # Calcule les statistiques d'une métrique en ignorant les valeurs absentes
+    def stats(self, metric):
+        """
+        Args:
+            metric: Nom de la métrique
+
+        Returns:
+            Un dictionnaire {'count', 'min', 'max', 'mean', 'std'} (None si aucune valeur)
+        """
+        values = self.columns[metric]
+        if numpy is not None:
+            vector = self.column(metric)
+            present = vector[~numpy.isnan(vector)]
+            if not present.size:
+                return {'count': 0, 'min': None, 'max': None, 'mean': None, 'std': None}
+            return {
+                'count': int(present.size),
+                'min': float(present.min()),
+                'max': float(present.max()),
+                'mean': float(present.mean()),
+                'std': float(present.std())
+            }
+
+        # Sans NumPy : un seul passage sur le vecteur
+        count = 0
+        total = 0.0
+        squares = 0.0
+        minimum = math.inf
+        maximum = -math.inf
+        for value in values:
+            if value != value:
+                continue
+            count += 1
+            total += value
+            squares += value * value
+            if value < minimum:
+                minimum = value
+            if value > maximum:
+                maximum = value
+
+        if not count:
+            return {'count': 0, 'min': None, 'max': None, 'mean': None, 'std': None}
+        mean = total / count
+        return {
+            'count': count,
+            'min': minimum,
+            'max': maximum,
+            'mean': mean,
+            'std': math.sqrt(max(0.0, squares / count - mean * mean))
+        }
@@ -0,0 +1,81 @@
+import struct
+from binascii import crc_hqx
+from src.models.metrics import METRICS
+
+# Trame binaire envoyée par l'Arduino (voir programme_arduino.ino), en little-endian :
+#   synchro (2 octets A5 5A) | version (u8) | appareil (u8) | séquence (u16)
+#   | air_quality (u16, valeur brute du MQ135) | distance (u16, cm) | luminosity (u16, lux)
+#   | uv_index (u16, indice x 100) | ir_value (u16) | temperature (i16, °C x 100)
+#   | pressure (u16, hPa x 10) | humidity (u16, % x 100) | CRC16-CCITT (u16)
+# Le CRC (polynôme 0x1021, valeur initiale 0xFFFF) couvre tous les octets entre la synchro et le CRC.
+FRAME_SYNC = b'\xA5\x5A'
+FRAME_VERSION = 1
+_FRAME = struct.Struct('<2sBBH' + 'HHHHHhHH' + 'H')
+FRAME_SIZE = _FRAME.size
+
+# Par champ, dans l'ordre du registre : diviseur de la valeur transmise et valeur signalant une mesure absente
+_SCALES = (1, 100, 1, 100, 1, 100, 10, 100)
+_MISSING = (0xFFFF, 0xFFFF, 0xFFFF, 0xFFFF, 0xFFFF, -0x8000, 0xFFFF, 0xFFFF)
+_FIELDS = tuple(zip(_SCALES, _MISSING, (metric.type for metric in METRICS)))
+
+# Trame binaire décodée
+class BinaryFrame:
+    __slots__ = ('deviceId', 'sequence', 'values')
+
+    def __init__(self, deviceId, sequence, values):
+        """
+        Args:
+            deviceId: Identifiant de l'appareil dans la trame (0 si un seul appareil sur la liaison)
+            sequence: Numéro de séquence (u16, reboucle à 0)
+            values: Valeurs des métriques dans l'ordre du registre (None si absentes)
+        """
+        self.deviceId = deviceId
+        self.sequence = sequence
+        self.values = values
+
+    def __repr__(self):
+        return f"BinaryFrame(device={self.deviceId}, seq={self.sequence}, values={self.values!r})"
+
+# Décode une trame lue directement dans le tampon de réception
+def decodeFrame(buffer, offset=0):
+    """
+    Args:
+        buffer: Tampon (bytes, bytearray ou memoryview) contenant la trame
+        offset: Position de la synchro dans le tampon
+
+    Returns:
+        Une BinaryFrame, ou None si la version ou le CRC ne correspondent pas
+    """
+    sync, version, deviceId, sequence, *raw, crc = _FRAME.unpack_from(buffer, offset)
+    if sync != FRAME_SYNC or version != FRAME_VERSION:
+        return None
+
+    # CRC calculé sur une vue du tampon, sans copie
+    view = memoryview(buffer)
+    try:
+        if crc_hqx(view[offset + 2:offset + FRAME_SIZE - 2], 0xFFFF) != crc:
+            return None
+    finally:
+        view.release()
+
+    values = tuple(
+        None if value == missing else (value // scale if type is int else value / scale)
+        for value, (scale, missing, type) in zip(raw, _FIELDS)
+    )
+    return BinaryFrame(deviceId, sequence, values)
+
+# Encode une trame (même format que l'Arduino, utile pour simuler un appareil)
+def encodeFrame(deviceId, sequence, values):
+    """
+    Args:
+        deviceId: Identifiant de l'appareil (0 à 255)
+        sequence: Numéro de séquence (tronqué à 16 bits)
+        values: Valeurs des métriques dans l'ordre du registre (None si absentes)
+
+    Returns:
+        Les octets de la trame
+    """
+    raw = [missing if value is None else int(round(value * scale)) for value, scale, missing in zip(values, _SCALES, _MISSING)]
+    frame = bytearray(_FRAME.pack(FRAME_SYNC, FRAME_VERSION, deviceId, sequence & 0xFFFF, *raw, 0))
+    struct.pack_into('<H', frame, FRAME_SIZE - 2, crc_hqx(bytes(frame[2:-2]), 0xFFFF))
+    return bytes(frame)
@@ -0,0 +1,112 @@
+import threading
+from config.settings import CHANGE_FILTER_CONFIG
+from src.models.metrics import METRIC_NAMES
+
+# Filtre placé devant le bus de données : ne publie une lecture que si elle apporte un changement
+class ChangeFilter:
+    # Initialise le filtre
+    def __init__(self, bus, deadbands=None, heartbeat=None, enabled=None):
+        """
+        Chaque appareil a sa lecture de référence (la dernière publiée). Une
+        nouvelle lecture est publiée si au moins une métrique s'en écarte de
+        plus que sa bande morte, si une métrique apparaît ou disparaît, ou si
+        la référence date d'au moins heartbeat secondes ; sinon elle est
+        écartée et la référence est conservée, pour qu'une dérive lente finisse
+        par être publiée.
+
+        Args:
+            bus: Le DataBus recevant les lectures retenues
+            deadbands: Dictionnaire {métrique: {'absolute': seuil, 'relative': fraction}} (deadbands par défaut)
+            heartbeat: Délai (s) après lequel une lecture inchangée est publiée (0 pour désactiver)
+            enabled: Activer le filtrage (sinon toutes les lectures sont publiées)
+        """
+        self.bus = bus
+        deadbands = CHANGE_FILTER_CONFIG['deadbands'] if deadbands is None else deadbands
+        heartbeat = CHANGE_FILTER_CONFIG['heartbeat'] if heartbeat is None else heartbeat
+        self.enabled = CHANGE_FILTER_CONFIG['enabled'] if enabled is None else enabled
+
+        # Seuils alignés sur l'ordre de Reading.values()
+        self.absolute = tuple(float(deadbands.get(name, {}).get('absolute', 0.0)) for name in METRIC_NAMES)
+        self.relative = tuple(float(deadbands.get(name, {}).get('relative', 0.0)) for name in METRIC_NAMES)
+        self.heartbeatNs = int(heartbeat * 1_000_000_000)
+
+        # Dernière lecture publiée par appareil : deviceId -> (horodatage ns, valeurs)
+        self.references = {}
+        self._lock = threading.Lock()
+
+        # Compteurs
+        self.published = 0
+        self.suppressed = 0
+        self.heartbeats = 0
+
+    # Publie la lecture sur le bus si elle doit être conservée
+    def publish(self, reading):
+        """
+        Args:
+            reading: La Reading produite par une liaison ou par la démo
+
+        Returns:
+            True si la lecture a été publiée, False si elle a été écartée
+        """
+        if not self.accept(reading):
+            return False
+        self.bus.publish(reading)
+        return True
+
+    # Indique si une lecture doit être conservée et, le cas échéant, en fait la nouvelle référence
+    def accept(self, reading):
+        values = reading.values()
+        with self._lock:
+            reference = self.references.get(reading.deviceId)
+            if self.enabled and reference is not None:
+                referenceNs, referenceValues = reference
+                if not self._changed(referenceValues, values):
+                    if self.heartbeatNs <= 0 or reading.timestampNs - referenceNs < self.heartbeatNs:
+                        self.suppressed += 1
+                        return False
+                    self.heartbeats += 1
+
+            self.references[reading.deviceId] = (reading.timestampNs, values)
+            self.published += 1
+            return True
+
+    # Oublie la référence des appareils donnés (de tous sans argument) : leur prochaine lecture sera publiée
+    def reset(self, *deviceIds):
+        """
+        Args:
+            deviceIds: Identifiants des appareils (None pour la démo)
+        """
+        with self._lock:
+            if not deviceIds:
+                self.references.clear()
+            for deviceId in deviceIds:
+                self.references.pop(deviceId, None)
+
+    # Retourne les compteurs du filtre
+    def getStats(self):
+        """
+        Returns:
+            Un dictionnaire {'published', 'suppressed', 'heartbeats'}
+        """
+        with self._lock:
+            return {
+                'published': self.published,
+                'suppressed': self.suppressed,
+                'heartbeats': self.heartbeats
+            }
+
+    # Compare des valeurs à celles de la référence, métrique par métrique
+    def _changed(self, referenceValues, values):
+        for old, new, absolute, relative in zip(referenceValues, values, self.absolute, self.relative):
+            if old is None or new is None:
+                if old is not new:
+                    return True
+                continue
+            try:
+                delta = abs(new - old)
+                if delta > absolute and delta > relative * abs(old):
+                    return True
+            except TypeError:
+                if new != old:
+                    return True
+        return False
@@ -0,0 +1,53 @@
+import logging
+import threading
+
+log = logging.getLogger(__name__)
+
+# Bus de données : un producteur publie chaque lecture une seule fois, plusieurs consommateurs la reçoivent
+class DataBus:
+    # Initialise le bus
+    def __init__(self):
+        # Liste des abonnés remplacée (jamais modifiée sur place) à chaque abonnement,
+        # pour que publish() la parcoure sans verrou
+        self.subscribers = ()
+        self._lock = threading.Lock()
+
+        # Compteurs
+        self.published = 0
+        self.errors = 0
+
+    # Abonne un consommateur aux lectures publiées
+    def subscribe(self, callback):
+        """
+        Le callback est appelé dans le thread du producteur (la boucle d'acquisition) :
+        il doit retourner rapidement (mise en file, post vers l'interface, ...).
+        L'enregistrement reçu est partagé entre les abonnés et ne doit pas être modifié.
+
+        Args:
+            callback: Fonction appelée avec la lecture (Reading) publiée
+
+        Returns:
+            Le callback, à passer à unsubscribe()
+        """
+        with self._lock:
+            self.subscribers = self.subscribers + (callback,)
+        return callback
+
+    # Désabonne un consommateur
+    def unsubscribe(self, callback):
+        with self._lock:
+            self.subscribers = tuple(s for s in self.subscribers if s != callback)
+
+    # Publie une lecture à tous les abonnés
+    def publish(self, record):
+        """
+        Args:
+            record: La Reading publiée
+        """
+        self.published += 1
+        for callback in self.subscribers:
+            try:
+                callback(record)
+            except Exception as e:
+                self.errors += 1
+                log.error("Erreur dans un consommateur du bus de données: %s", e)
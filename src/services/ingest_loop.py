@@ -0,0 +1,125 @@
+import logging
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from config.settings import INGEST_CONFIG
+
+log = logging.getLogger(__name__)
+
+# Boucle asyncio qui exécute toutes les entrées/sorties d'acquisition
+class IngestLoop:
+    # Initialise la boucle (elle tourne dans un unique thread dédié)
+    def __init__(self, executorWorkers=None):
+        """
+        Args:
+            executorWorkers: Nombre de threads pour les appels bloquants (base de données, ouverture de ports)
+        """
+        self.loop = None
+        self.loopThread = None
+        self.executor = ThreadPoolExecutor(
+            max_workers=executorWorkers or INGEST_CONFIG['executor_workers'],
+            thread_name_prefix='ingest'
+        )
+        self._ready = threading.Event()
+
+    # Démarre la boucle dans son thread
+    def start(self):
+        if self.loopThread and self.loopThread.is_alive():
+            return
+
+        self._ready.clear()
+        self.loopThread = threading.Thread(target=self._run, name='ingest-loop')
+        self.loopThread.daemon = True
+        self.loopThread.start()
+        self._ready.wait()
+
+    # Arrête la boucle après avoir annulé les tâches en cours
+    def stop(self, timeout=2.0):
+        if not self.isRunning():
+            return
+
+        future = asyncio.run_coroutine_threadsafe(self._cancelAll(), self.loop)
+        try:
+            future.result(timeout=timeout)
+        except Exception:
+            pass
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.loopThread.join(timeout=timeout)
+        self.loopThread = None
+
+    # Vérifie si la boucle tourne
+    def isRunning(self):
+        return self.loopThread is not None and self.loopThread.is_alive()
+
+    # Vérifie si l'appel courant provient du thread de la boucle
+    def inLoopThread(self):
+        return threading.current_thread() is self.loopThread
+
+    # Soumet une coroutine depuis n'importe quel thread
+    def submit(self, coro):
+        """
+        Args:
+            coro: La coroutine à exécuter dans la boucle
+
+        Returns:
+            Un concurrent.futures.Future (annulable depuis un autre thread)
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    # Planifie un appel de fonction dans la boucle depuis n'importe quel thread
+    def callSoon(self, callback, *args):
+        self.loop.call_soon_threadsafe(callback, *args)
+
+    # Exécute une fonction bloquante dans l'exécuteur sans bloquer la boucle
+    async def runBlocking(self, func, *args):
+        return await self.loop.run_in_executor(self.executor, func, *args)
+
+    # Exécute une fonction à intervalle régulier
+    def schedulePeriodic(self, interval, func, *args, blocking=True):
+        """
+        Args:
+            interval: Période en secondes
+            func: Fonction (ou coroutine) à appeler
+            blocking: True si la fonction est bloquante et doit passer par l'exécuteur
+
+        Returns:
+            Un Future à annuler (cancel()) pour arrêter l'exécution périodique
+        """
+        return self.submit(self._periodic(interval, func, args, blocking))
+
+    # Boucle d'exécution périodique cadencée sur l'horloge de la boucle
+    async def _periodic(self, interval, func, args, blocking):
+        nextRun = self.loop.time()
+        while True:
+            try:
+                if blocking:
+                    await self.runBlocking(func, *args)
+                else:
+                    result = func(*args)
+                    if asyncio.iscoroutine(result):
+                        await result
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                log.error("Erreur dans la tâche périodique %s: %s", getattr(func, '__name__', func), e)
+
+            # Se recaler sur la grille pour ne pas dériver, sans rattraper les retards
+            nextRun = max(nextRun + interval, self.loop.time())
+            await asyncio.sleep(nextRun - self.loop.time())
+
+    # Annule toutes les tâches de la boucle
+    async def _cancelAll(self):
+        tasks = [task for task in asyncio.all_tasks(self.loop) if task is not asyncio.current_task()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    # Point d'entrée du thread de la boucle
+    def _run(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.loop.call_soon(self._ready.set)
+        try:
+            self.loop.run_forever()
+        finally:
+            self.loop.close()
@@ -0,0 +1,92 @@
+from config.settings import SERIAL_CONFIG
+from src.services.binary_frame import FRAME_SIZE, FRAME_SYNC, decodeFrame
+
+# Découpe un flux d'octets série en lignes complètes et en trames binaires
+class LineFramer:
+    # Initialise le découpeur
+    def __init__(self, onLine, maxFrameSize=None, onFrame=None):
+        """
+        Les trames binaires sont reconnues à leur synchro et validées par leur
+        CRC ; une synchro dont la trame est invalide est traitée comme du texte.
+
+        Args:
+            onLine: Fonction appelée avec (horodatage d'arrivée, ligne) pour chaque ligne complète
+            maxFrameSize: Taille maximale d'une ligne avant abandon du tampon
+            onFrame: Fonction appelée avec (horodatage d'arrivée, BinaryFrame) pour chaque trame
+                     binaire valide (None pour ne reconnaître que les lignes)
+        """
+        self.onLine = onLine
+        self.onFrame = onFrame
+        self.maxFrameSize = maxFrameSize or SERIAL_CONFIG['max_frame_size']
+
+        # Tampon de réception : les octets consommés sont retirés une fois par appel à feed()
+        self.buffer = bytearray()
+
+        # Compteurs
+        self.bytesReceived = 0
+        self.linesReceived = 0
+        self.framesReceived = 0
+        self.badFrames = 0
+        self.overflows = 0
+
+    # Ajoute des octets reçus et émet les lignes complètes
+    def feed(self, data, arrival):
+        """
+        Args:
+            data: Octets reçus du port série
+            arrival: Horodatage de réception des octets
+        """
+        if not data:
+            return
+
+        self.bytesReceived += len(data)
+        buffer = self.buffer
+        buffer += data
+
+        view = memoryview(buffer)
+        start = 0
+        syncFrom = 0  # Début de la recherche de synchro (après une synchro invalide)
+        try:
+            while True:
+                end = buffer.find(b'\n', start)
+
+                # Une trame binaire commence avant la fin de la ligne courante
+                sync = buffer.find(FRAME_SYNC, max(start, syncFrom)) if self.onFrame else -1
+                if sync != -1 and (end == -1 or sync < end):
+                    if len(buffer) - sync < FRAME_SIZE:
+                        break  # Trame incomplète : attendre la suite
+                    frame = decodeFrame(view, sync)
+                    if frame is None:
+                        self.badFrames += 1
+                        syncFrom = sync + 1
+                        continue
+                    self.framesReceived += 1
+                    self.onFrame(arrival, frame)
+                    start = syncFrom = sync + FRAME_SIZE
+                    continue
+
+                if end == -1:
+                    break
+
+                # Décoder directement depuis la vue, sans copie intermédiaire
+                stop = end
+                if stop > start and buffer[stop - 1] == 0x0D:
+                    stop -= 1
+                if stop > start:
+                    self.linesReceived += 1
+                    self.onLine(arrival, str(view[start:stop], 'utf-8', 'replace'))
+                start = end + 1
+        finally:
+            view.release()
+
+        if start:
+            del buffer[:start]
+
+        # Protéger contre un flux sans fin de ligne
+        if len(buffer) > self.maxFrameSize:
+            self.overflows += 1
+            del buffer[:]
+
+    # Retourne le nombre d'octets en attente d'une fin de ligne
+    def pending(self):
+        return len(self.buffer)
@@ -0,0 +1,173 @@
+from config.settings import LINK_STATS_CONFIG
+
+# Suivi des numéros de séquence (16 bits) d'un appareil : pertes, doublons, désordre
+class SequenceTracker:
+    __slots__ = ('last', 'received', 'lost', 'duplicates', 'outOfOrder', 'resets', 'maxGap', 'resyncAfter', 'stale')
+
+    def __init__(self, maxGap=None, resyncAfter=None):
+        """
+        Args:
+            maxGap: Saut (avant ou arrière) au-delà duquel l'appareil est considéré redémarré (max_sequence_gap par défaut)
+            resyncAfter: Trames en retard consécutives provoquant une resynchronisation (resync_after par défaut)
+        """
+        self.last = None
+        self.received = 0
+        self.lost = 0
+        self.duplicates = 0
+        self.outOfOrder = 0
+        self.resets = 0
+        self.maxGap = maxGap or LINK_STATS_CONFIG['max_sequence_gap']
+        self.resyncAfter = resyncAfter or LINK_STATS_CONFIG['resync_after']
+        self.stale = 0  # Trames en retard reçues d'affilée
+
+    # Prend en compte un numéro de séquence reçu
+    def update(self, sequence):
+        """
+        Args:
+            sequence: Numéro de séquence de la trame (reboucle à 0 après 65535)
+        """
+        self.received += 1
+        if self.last is None:
+            self.last = sequence
+            return
+
+        delta = (sequence - self.last) & 0xFFFF
+        if delta == 0:
+            self.duplicates += 1
+            return
+        if sequence == 0 and delta != 1:
+            # Numérotation reprise à 0 ailleurs qu'au rebouclage : redémarrage de l'appareil
+            self._resync(sequence)
+            return
+        if delta < 0x8000:
+            if delta > self.maxGap:
+                # Reprise loin devant (redémarrage dont la trame 0 est perdue) : pas de pertes comptées
+                self._resync(sequence)
+                return
+            # En avance : les numéros sautés sont des trames perdues
+            self.lost += delta - 1
+            self.stale = 0
+            self.last = sequence
+            return
+
+        # En retard : trame arrivée dans le désordre, ou nouvelle numérotation après un redémarrage
+        self.stale += 1
+        if 0x10000 - delta > self.maxGap or self.stale >= self.resyncAfter:
+            # Les trames en retard précédentes appartenaient déjà à la nouvelle numérotation
+            self.outOfOrder -= self.stale - 1
+            self._resync(sequence)
+            return
+        self.outOfOrder += 1
+
+    # Repart d'un numéro de séquence sans compter l'écart comme des pertes
+    def _resync(self, sequence):
+        self.resets += 1
+        self.stale = 0
+        self.last = sequence
+
+    # Taux de perte parmi les trames attendues
+    def lossRate(self):
+        expected = self.received - self.duplicates - self.outOfOrder + self.lost
+        return self.lost / expected if expected > 0 else 0.0
+
+    # Retourne les compteurs
+    def snapshot(self):
+        return {
+            'last': self.last,
+            'received': self.received,
+            'lost': self.lost,
+            'duplicates': self.duplicates,
+            'out_of_order': self.outOfOrder,
+            'resets': self.resets,
+            'loss_rate': self.lossRate()
+        }
+
+# Histogramme des intervalles entre deux arrivées successives
+class ArrivalHistogram:
+    __slots__ = ('bounds', 'counts', 'lastArrival', 'count', 'total', 'minimum', 'maximum')
+
+    def __init__(self, bounds=None):
+        """
+        Args:
+            bounds: Bornes supérieures des classes en millisecondes (histogram_bounds par défaut) ;
+                    une dernière classe reçoit les intervalles au-delà
+        """
+        self.bounds = tuple(bounds or LINK_STATS_CONFIG['histogram_bounds'])
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.lastArrival = None
+        self.count = 0
+        self.total = 0.0
+        self.minimum = None
+        self.maximum = None
+
+    # Enregistre une arrivée
+    def add(self, arrival):
+        """
+        Args:
+            arrival: Horodatage d'arrivée en secondes
+        """
+        last, self.lastArrival = self.lastArrival, arrival
+        if last is None:
+            return
+
+        interval = (arrival - last) * 1000.0
+        index = 0
+        for bound in self.bounds:
+            if interval < bound:
+                break
+            index += 1
+        self.counts[index] += 1
+
+        self.count += 1
+        self.total += interval
+        if self.minimum is None or interval < self.minimum:
+            self.minimum = interval
+        if self.maximum is None or interval > self.maximum:
+            self.maximum = interval
+
+    # Retourne l'histogramme et les statistiques des intervalles (en ms)
+    def snapshot(self):
+        labels = [f"<{bound}" for bound in self.bounds] + [f">={self.bounds[-1]}"]
+        return {
+            'buckets': list(zip(labels, self.counts)),
+            'count': self.count,
+            'mean': self.total / self.count if self.count else None,
+            'min': self.minimum,
+            'max': self.maximum
+        }
+
+# Statistiques de réception d'une liaison série
+class LinkStats:
+    # Initialise les statistiques
+    def __init__(self, bounds=None):
+        """
+        Mises à jour par la boucle d'acquisition, lues depuis l'interface :
+        snapshot() ne retourne que des copies.
+
+        Args:
+            bounds: Bornes de l'histogramme des intervalles en millisecondes
+        """
+        self.arrivals = ArrivalHistogram(bounds)
+        self.sequences = {}  # Identifiant d'appareil dans la trame -> SequenceTracker
+
+    # Enregistre l'arrivée d'une lecture
+    def onRecord(self, arrival):
+        self.arrivals.add(arrival)
+
+    # Enregistre le numéro de séquence d'une trame binaire
+    def onFrame(self, frame):
+        tracker = self.sequences.get(frame.deviceId)
+        if tracker is None:
+            tracker = self.sequences[frame.deviceId] = SequenceTracker()
+        tracker.update(frame.sequence)
+
+    # Retourne une copie des statistiques
+    def snapshot(self):
+        """
+        Returns:
+            Un dictionnaire {'arrivals': histogramme, 'sequences': {appareil: compteurs}}
+        """
+        return {
+            'arrivals': self.arrivals.snapshot(),
+            'sequences': {deviceId: tracker.snapshot() for deviceId, tracker in list(self.sequences.items())}
+        }
@@ -0,0 +1,315 @@
+import logging
+import asyncio
+import time
+import serial
+from config.settings import SERIAL_CONFIG, INGEST_CONFIG
+from src.models.metrics import METRIC_ATTRIBUTES
+from src.models.reading import Reading
+from src.models.sensor import Sensor
+from src.models.sensor_parser import parseLine
+from src.services.line_framer import LineFramer
+from src.services.link_stats import LinkStats
+
+log = logging.getLogger(__name__)
+
+# Ligne envoyée par l'Arduino après la dernière mesure d'un échantillon (mode texte)
+SAMPLE_END = "Fin des lectures"
+
+# Nettoie une ligne reçue et écarte les lignes de contrôle
+def cleanLine(line):
+    """
+    Args:
+        line: Ligne décodée reçue du port série
+
+    Returns:
+        La ligne nettoyée, ou None si elle ne contient pas de données
+    """
+    line = line.strip()
+
+    # Ignorer les lignes vides et les séparateurs
+    if not line or line.strip('-') == '':
+        return None
+
+    # Ignorer les lignes spéciales comme "Fin des lectures" ou "Réactualisation dans X secondes"
+    if SAMPLE_END in line or "Réactualisation" in line or "👾" in line:
+        return None
+
+    # Supprimer le préfixe "Message envoyé :" si présent
+    if "Message envoy" in line:
+        for prefix in ["Message envoyé :", "Message envoyÃ© :", "Message envoy :"]:
+            line = line.replace(prefix, "").strip()
+
+    return line or None
+
+# Liaison série (Arduino/XBee) avec son propre découpeur et son propre état de capteur.
+# Toutes les liaisons sont pilotées par la même boucle asyncio (IngestLoop).
+class SensorLink:
+    # Initialise la liaison
+    def __init__(self, portName, ingestLoop, bus=None, baudrate=9600, deviceId=None,
+                 sensor=None, serialPort=None):
+        """
+        Args:
+            portName: Nom du port série
+            ingestLoop: La boucle d'acquisition qui pilote la liaison
+            bus: Bus de données (ou ChangeFilter) sur lequel chaque lecture est publiée une seule fois
+            baudrate: Vitesse du port série
+            deviceId: Identifiant de l'appareil (par défaut le nom du port)
+            sensor: État de capteur à mettre à jour (un nouveau Sensor par défaut)
+            serialPort: Port série déjà ouvert à utiliser au lieu d'ouvrir portName
+        """
+        self.portName = portName
+        self.deviceId = deviceId or portName
+        self.baudrate = baudrate
+        self.ingestLoop = ingestLoop
+        self.bus = bus
+
+        # État propre à la liaison
+        self.sensor = sensor or Sensor()
+        self.framer = LineFramer(self._onLine, onFrame=self._onFrame if SERIAL_CONFIG['binary_frames'] else None)
+        self.serialPort = serialPort
+        self.recordsProduced = 0
+        self.lastUpdate = None
+        self.stats = LinkStats()
+        self.errorMessage = ''
+        self._sampleFields = set()  # Attributs reçus depuis la dernière lecture publiée (mode texte)
+        self._sampleArrival = None  # Réception de la première ligne de l'échantillon en cours
+
+        self.task = None
+        self._opening = None
+        self._closed = None
+
+    # Ouvre le port et démarre la lecture dans la boucle
+    def start(self):
+        """
+        Returns:
+            Un Future résolu à True une fois le port ouvert, False en cas d'échec
+        """
+        self._opening = self.ingestLoop.submit(self._open())
+        self.task = self.ingestLoop.submit(self._run(self._opening))
+        return self._opening
+
+    # Arrête la lecture et ferme le port
+    def stop(self, timeout=2.0):
+        if self._opening:
+            self._opening.cancel()
+            self._opening = None
+        if self.task:
+            self.task.cancel()
+            self.task = None
+        if self.serialPort is not None:
+            self.ingestLoop.submit(self._closeAsync()).result(timeout=timeout)
+
+    # Vérifie si la liaison est ouverte
+    def isConnected(self):
+        return self.serialPort is not None
+
+    # Retourne les compteurs de réception, les séquences et l'arriéré de la liaison
+    def getStats(self):
+        """
+        Returns:
+            Un dictionnaire : compteurs du découpeur, octets en attente (tampon
+            du découpeur et du port), histogramme des intervalles entre lectures
+            et suivi des séquences par appareil (trames binaires seulement)
+        """
+        stats = {
+            'device_id': self.deviceId,
+            'port': self.portName,
+            'connected': self.isConnected(),
+            'records': self.recordsProduced,
+            'bytes': self.framer.bytesReceived,
+            'lines': self.framer.linesReceived,
+            'frames': self.framer.framesReceived,
+            'bad_frames': self.framer.badFrames,
+            'overflows': self.framer.overflows,
+            'pending_bytes': self.framer.pending(),
+            'port_backlog': self._portBacklog()
+        }
+        stats.update(self.stats.snapshot())
+        return stats
+
+    # Octets reçus par le système et pas encore lus (None si inconnu)
+    def _portBacklog(self):
+        serialPort = self.serialPort
+        if serialPort is None:
+            return None
+        try:
+            return serialPort.in_waiting
+        except Exception:
+            return None
+
+    # Envoie une commande sur le port sans bloquer la boucle
+    def sendCommand(self, command):
+        """
+        Args:
+            command: Octets à écrire sur le port
+
+        Returns:
+            Un Future résolu une fois la commande écrite
+        """
+        return self.ingestLoop.submit(self._write(command))
+
+    # Ouvre le port série (appel bloquant exécuté hors de la boucle)
+    async def _open(self):
+        if self.serialPort is not None:
+            return True
+        try:
+            self.serialPort = await self.ingestLoop.runBlocking(serial.Serial, self.portName, self.baudrate)
+            # Donner du temps à Arduino/Xbee pour s'initialiser
+            await asyncio.sleep(INGEST_CONFIG['port_init_delay'])
+            self.serialPort.reset_input_buffer()
+            return True
+        except asyncio.CancelledError:
+            await self._closeAsync()
+            raise
+        except Exception as e:
+            self.errorMessage = str(e)
+            log.error("Erreur lors de la connexion au port %s: %s", self.portName, e)
+            await self._closeAsync()
+            return False
+
+    # Lit le port tant que la liaison est ouverte
+    async def _run(self, opened):
+        if not await asyncio.wrap_future(opened):
+            return
+
+        loop = asyncio.get_running_loop()
+        self._closed = loop.create_future()
+        try:
+            fileno = self.serialPort.fileno()
+        except Exception:
+            fileno = None
+
+        try:
+            if fileno is not None:
+                # POSIX : la boucle surveille le descripteur, aucun thread par port
+                self.serialPort.timeout = 0
+                loop.add_reader(fileno, self._onReadable)
+                try:
+                    await self._closed
+                finally:
+                    loop.remove_reader(fileno)
+            else:
+                # Windows : lectures bloquantes déléguées à l'exécuteur
+                self.serialPort.timeout = SERIAL_CONFIG['read_timeout']
+                while not self._closed.done():
+                    data = await self.ingestLoop.runBlocking(self._blockingRead)
+                    self._onData(data)
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            self.errorMessage = str(e)
+            log.error("Erreur lors de la lecture du port %s: %s", self.portName, e)
+        finally:
+            await self._closeAsync()
+
+    # Lit les octets disponibles lorsque le descripteur est prêt
+    def _onReadable(self):
+        try:
+            data = self.serialPort.read(self.serialPort.in_waiting or 1)
+        except Exception as e:
+            self.errorMessage = str(e)
+            log.error("Erreur lors de la lecture du port %s: %s", self.portName, e)
+            if self._closed and not self._closed.done():
+                self._closed.set_result(None)
+            return
+        self._onData(data)
+
+    # Lit les octets disponibles ou attend au plus le délai du port
+    def _blockingRead(self):
+        available = self.serialPort.in_waiting
+        return self.serialPort.read(min(available, SERIAL_CONFIG['read_size']) if available else 1)
+
+    # Traite un bloc d'octets reçus
+    def _onData(self, data):
+        if not data:
+            return
+        self.framer.feed(data, time.time())
+
+    # Applique une ligne complète au capteur de la liaison et publie chaque échantillon complet une seule fois
+    def _onLine(self, arrival, line):
+        """
+        En mode texte, un échantillon s'étend sur plusieurs lignes : il est
+        publié à la ligne de fin d'échantillon, dès que toutes les métriques
+        sont reçues, ou lorsqu'une métrique déjà reçue revient (l'échantillon
+        suivant a commencé sans ligne de fin). La lecture est horodatée à la
+        réception de la première ligne de l'échantillon.
+        """
+        if SAMPLE_END in line:
+            self._completeSample()
+            return
+
+        line = cleanLine(line)
+        update = parseLine(line) if line is not None else None
+        if not update:
+            return
+
+        if not self._sampleFields.isdisjoint(update.values):
+            self._completeSample()
+        if not self._sampleFields:
+            self._sampleArrival = arrival
+        self.sensor.applyUpdate(update)
+        self._sampleFields.update(update.values)
+        if len(self._sampleFields) == len(METRIC_ATTRIBUTES):
+            self._completeSample()
+
+    # Publie l'échantillon en cours s'il contient au moins une mesure
+    def _completeSample(self):
+        if self._sampleFields:
+            self._sampleFields.clear()
+            self._produceRecord(self._sampleArrival)
+
+    # Publie la mesure portée par une trame binaire (sans passer par le texte ni les expressions régulières)
+    def _onFrame(self, arrival, frame):
+        """
+        Args:
+            arrival: Horodatage de réception des octets
+            frame: La BinaryFrame décodée
+        """
+        self.stats.onFrame(frame)
+
+        # Plusieurs appareils peuvent partager une liaison XBee : l'identifiant 0 désigne l'appareil de la liaison
+        if frame.deviceId == 0:
+            deviceId = self.deviceId
+            # Garder l'état du capteur cohérent pour les lignes de texte qui suivraient
+            for attribute, value in zip(METRIC_ATTRIBUTES, frame.values):
+                if value is not None:
+                    setattr(self.sensor, attribute, value)
+        else:
+            deviceId = f"{self.deviceId}/{frame.deviceId}"
+        self._publish(Reading(int(arrival * 1_000_000_000), deviceId, *frame.values))
+
+    # Publie un instantané du capteur (consommé par l'écriture et l'interface)
+    def _produceRecord(self, arrival=None):
+        """
+        Args:
+            arrival: Horodatage de réception en secondes (maintenant par défaut)
+        """
+        timestampNs = int(arrival * 1_000_000_000) if arrival is not None else None
+        self._publish(self.sensor.toReading(self.deviceId, timestampNs))
+
+    # Publie une lecture sur le bus
+    def _publish(self, record):
+        self.recordsProduced += 1
+        self.lastUpdate = time.time()
+        self.stats.onRecord(self.lastUpdate)
+        if self.bus is not None:
+            self.bus.publish(record)
+
+    # Écrit une commande sur le port
+    async def _write(self, command):
+        if self.serialPort is None:
+            return False
+        await self.ingestLoop.runBlocking(self.serialPort.write, command)
+        return True
+
+    # Ferme le port série
+    async def _closeAsync(self):
+        if self._closed and not self._closed.done():
+            self._closed.set_result(None)
+        serialPort = self.serialPort
+        self.serialPort = None
+        if serialPort is not None:
+            try:
+                serialPort.close()
+            except Exception as e:
+                log.error("Erreur lors de la fermeture du port %s: %s", self.portName, e)
@@ -0,0 +1,164 @@
+import logging
+import threading
+import time
+from collections import deque
+from config.settings import UI_CONFIG
+
+log = logging.getLogger(__name__)
+
+# Couleur de chaque niveau de message dans la console
+LEVEL_COLORS = {
+    'debug': '#7F8C8D',
+    'info': '#3498DB',
+    'success': '#2ECC71',
+    'warning': '#F39C12',
+    'error': '#E74C3C'
+}
+
+# Console de l'application : messages mis en file puis écrits par lots dans un widget texte
+class ConsoleSink:
+    # Initialise la console
+    def __init__(self, textWidget, capacity=None, interval=None, passthrough=None):
+        """
+        Les messages peuvent être émis depuis n'importe quel thread ; ils sont
+        écrits dans le widget par le thread Tk, par lots à intervalle fixe.
+        Le widget et la file d'attente sont bornés à capacity lignes.
+
+        Args:
+            textWidget: Un widget Text ou CTkTextbox
+            capacity: Nombre maximum de lignes conservées
+            interval: Période d'écriture dans le widget en millisecondes
+            passthrough: Flux recevant aussi ce qui est écrit avec write() (sys.stdout d'origine par exemple)
+        """
+        self.textWidget = textWidget
+        self.capacity = capacity or UI_CONFIG['console_max_lines']
+        self.interval = interval or UI_CONFIG['console_flush_interval']
+        self.passthrough = passthrough
+
+        # File circulaire : au-delà de la capacité, les plus anciens messages non affichés sont perdus
+        self.pending = deque(maxlen=self.capacity)
+        self.dropped = 0
+        self.lineCount = 0
+        self._partial = ''  # Début de ligne écrit par write() sans retour à la ligne
+        self._lock = threading.Lock()
+
+        for level, color in LEVEL_COLORS.items():
+            self._configureTag(level, color)
+
+        self._job = None
+        self._schedule()
+
+    # Ajoute un message (utilisable depuis n'importe quel thread)
+    def emit(self, message, level='info'):
+        """
+        Args:
+            message: Le message (une ou plusieurs lignes)
+            level: 'debug', 'info', 'success', 'warning' ou 'error'
+        """
+        with self._lock:
+            if len(self.pending) == self.capacity:
+                self.dropped += 1
+            self.pending.append((time.time(), level, message))
+
+    # Écrit du texte comme un flux (permet de remplacer sys.stdout)
+    def write(self, string):
+        if self.passthrough is not None:
+            self.passthrough.write(string)
+
+        # Un message par ligne complète
+        with self._lock:
+            lines = (self._partial + string).split('\n')
+            self._partial = lines.pop()
+        for line in lines:
+            if line:
+                self.emit(line)
+        return len(string)
+
+    # Vide le flux d'origine
+    def flush(self):
+        if self.passthrough is not None:
+            self.passthrough.flush()
+
+    # Efface la console et les messages en attente
+    def clear(self):
+        with self._lock:
+            self.pending.clear()
+        self._setEditable(True)
+        self.textWidget.delete("1.0", "end")
+        self._setEditable(False)
+        self.lineCount = 0
+
+    # Arrête l'écriture périodique
+    def close(self):
+        if self._job is not None:
+            try:
+                self.textWidget.after_cancel(self._job)
+            except Exception:
+                pass
+            self._job = None
+
+    # Planifie la prochaine écriture
+    def _schedule(self):
+        self._job = self.textWidget.after(self.interval, self._drain)
+
+    # Écrit les messages en attente dans le widget (thread Tk)
+    def _drain(self):
+        with self._lock:
+            records = list(self.pending)
+            self.pending.clear()
+            dropped, self.dropped = self.dropped, 0
+
+        try:
+            if records:
+                self._write(records, dropped)
+        except Exception:
+            # Un message impossible à afficher ne doit pas arrêter la console
+            if self._exists():
+                log.exception("Erreur lors de l'écriture dans la console")
+        finally:
+            try:
+                self._schedule()
+            except Exception:
+                # Widget détruit pendant la fermeture de l'application
+                self._job = None
+
+    # Écrit un lot de messages dans le widget et applique la capacité
+    def _write(self, records, dropped):
+        try:
+            self._setEditable(True)
+            if dropped:
+                self.textWidget.insert("end", f"... {dropped} messages non affichés\n", 'warning')
+                self.lineCount += 1
+            for timestamp, level, message in records:
+                prefix = time.strftime('[%H:%M:%S] ', time.localtime(timestamp))
+                self.textWidget.insert("end", f"{prefix}{message}\n", level)
+                self.lineCount += str(message).count('\n') + 1
+
+            # Supprimer les lignes les plus anciennes au-delà de la capacité
+            if self.lineCount > self.capacity:
+                excess = self.lineCount - self.capacity
+                self.textWidget.delete("1.0", f"{excess + 1}.0")
+                self.lineCount = self.capacity
+
+            self.textWidget.see("end")
+        finally:
+            self._setEditable(False)
+
+    # Indique si le widget existe encore (il est détruit à la fermeture de l'application)
+    def _exists(self):
+        try:
+            return bool(self.textWidget.winfo_exists())
+        except Exception:
+            return False
+
+    # Autorise ou interdit la saisie dans le widget
+    def _setEditable(self, editable):
+        self.textWidget.configure(state="normal" if editable else "disabled")
+
+    # Définit la couleur d'un niveau (CTkTextbox expose tag_config, Text tag_configure)
+    def _configureTag(self, tag, color):
+        configure = getattr(self.textWidget, 'tag_config', None) or self.textWidget.tag_configure
+        try:
+            configure(tag, foreground=color)
+        except Exception:
+            pass
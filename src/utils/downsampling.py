@@ -0,0 +1,49 @@
+# Sous-échantillonne une série avec l'algorithme Largest-Triangle-Three-Buckets
+def lttb(points, threshold):
+    """
+    Conserve le premier et le dernier point, puis, dans chaque intervalle,
+    le point formant le plus grand triangle avec le point retenu précédemment
+    et la moyenne de l'intervalle suivant : les pics et les creux sont préservés.
+
+    Args:
+        points: Liste de tuples (x, y) triés par x croissant (x numérique)
+        threshold: Nombre de points à conserver
+
+    Returns:
+        Une liste d'au plus threshold tuples extraits de points
+    """
+    count = len(points)
+    if threshold >= count:
+        return list(points)
+    if threshold < 3:
+        # Trop peu de points pour former un triangle : garder les extrémités
+        return [points[0], points[-1]][:max(0, threshold)]
+
+    sampled = [points[0]]
+    bucketSize = (count - 2) / (threshold - 2)
+    selected = 0
+
+    for i in range(threshold - 2):
+        # Moyenne de l'intervalle suivant
+        nextStart = int((i + 1) * bucketSize) + 1
+        nextEnd = min(int((i + 2) * bucketSize) + 1, count)
+        span = nextEnd - nextStart
+        avgX = sum(points[j][0] for j in range(nextStart, nextEnd)) / span
+        avgY = sum(points[j][1] for j in range(nextStart, nextEnd)) / span
+
+        # Point de l'intervalle courant formant le plus grand triangle
+        start = int(i * bucketSize) + 1
+        end = int((i + 1) * bucketSize) + 1
+        ax, ay = points[selected][0], points[selected][1]
+        maxArea = -1.0
+        for j in range(start, end):
+            area = abs((ax - avgX) * (points[j][1] - ay) - (ax - points[j][0]) * (avgY - ay))
+            if area > maxArea:
+                maxArea = area
+                chosen = j
+
+        sampled.append(points[chosen])
+        selected = chosen
+
+    sampled.append(points[-1])
+    return sampled
@@ -0,0 +1,112 @@
+import json
+import logging
+import os
+import sys
+from logging.handlers import RotatingFileHandler
+from config.settings import LOGGING_CONFIG
+
+# Correspondance entre les niveaux logging et les couleurs de la console de l'application
+_CONSOLE_LEVELS = {
+    logging.DEBUG: 'debug',
+    logging.INFO: 'info',
+    logging.WARNING: 'warning',
+    logging.ERROR: 'error',
+    logging.CRITICAL: 'error'
+}
+
+# Envoie les messages vers la console de l'application (ConsoleSink)
+class ConsoleSinkHandler(logging.Handler):
+    # Initialise le gestionnaire
+    def __init__(self, sink, level=logging.NOTSET):
+        """
+        Args:
+            sink: La ConsoleSink recevant les messages
+            level: Niveau minimum des messages affichés
+        """
+        super().__init__(level)
+        self.sink = sink
+
+    # Transmet un message à la console ; extra={'tag': 'success'} choisit une autre couleur
+    def emit(self, record):
+        try:
+            tag = getattr(record, 'tag', None) or _CONSOLE_LEVELS.get(record.levelno, 'info')
+            self.sink.emit(self.format(record), tag)
+        except Exception:
+            self.handleError(record)
+
+# Formate chaque message en une ligne JSON
+class JsonLinesFormatter(logging.Formatter):
+    # Formate un message
+    def format(self, record):
+        data = {
+            'time': record.created,
+            'level': record.levelname,
+            'logger': record.name,
+            'thread': record.threadName,
+            'message': record.getMessage()
+        }
+        if record.exc_info:
+            data['exception'] = self.formatException(record.exc_info)
+        return json.dumps(data, ensure_ascii=False, default=str)
+
+# Configure les niveaux et les sorties des journaux de l'application
+def configureLogging(config=None):
+    """
+    Les messages sont formatés seulement s'ils passent le niveau de leur
+    module : un message de débogage désactivé ne coûte qu'une comparaison.
+
+    Args:
+        config: Paramètres (LOGGING_CONFIG par défaut)
+    """
+    config = config or LOGGING_CONFIG
+    root = logging.getLogger()
+    root.setLevel(config['level'])
+    for name, level in config['levels'].items():
+        logging.getLogger(name).setLevel(level)
+
+    # Ne pas empiler les sorties si la configuration est refaite
+    for handler in list(root.handlers):
+        if getattr(handler, '_appHandler', False):
+            root.removeHandler(handler)
+            handler.close()
+
+    handlers = []
+    if config['stream']:
+        # Sortie d'erreur d'origine : sys.stdout peut être redirigé vers la console de l'application
+        stream = logging.StreamHandler(sys.__stderr__)
+        stream.setFormatter(logging.Formatter(config['format']))
+        handlers.append(stream)
+
+    if config['file']:
+        handlers.append(_rotatingHandler(config['file'], logging.Formatter(config['format']), config))
+
+    if config['json_file']:
+        handlers.append(_rotatingHandler(config['json_file'], JsonLinesFormatter(), config))
+
+    for handler in handlers:
+        handler._appHandler = True
+        root.addHandler(handler)
+
+# Ajoute la console de l'application comme sortie des journaux
+def attachConsole(sink, level=None):
+    """
+    Args:
+        sink: La ConsoleSink de la vue
+        level: Niveau minimum affiché (console_level par défaut)
+
+    Returns:
+        Le gestionnaire ajouté, à retirer avec logging.getLogger().removeHandler()
+    """
+    handler = ConsoleSinkHandler(sink, level or LOGGING_CONFIG['console_level'])
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    logging.getLogger().addHandler(handler)
+    return handler
+
+# Crée un fichier journal à rotation par taille
+def _rotatingHandler(path, formatter, config):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    handler = RotatingFileHandler(path, maxBytes=config['file_max_bytes'], backupCount=config['file_backups'], encoding='utf-8')
+    handler.setFormatter(formatter)
+    return handler
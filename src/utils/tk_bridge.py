@@ -0,0 +1,105 @@
+import logging
+import queue
+import threading
+from config.settings import UI_CONFIG
+
+log = logging.getLogger(__name__)
+
+# Pont thread-safe pour exécuter des mises à jour d'interface dans le thread Tk
+class TkBridge:
+    # Initialise le pont
+    def __init__(self, widget, interval=None):
+        """
+        Args:
+            widget: Un widget Tk quelconque (utilisé pour after())
+            interval: Période de vidage de la file en millisecondes
+        """
+        self.widget = widget
+        self.interval = interval or UI_CONFIG['bridge_interval']
+        self.pending = queue.SimpleQueue()
+        self._job = None
+        self._schedule()
+
+    # Poste un appel à exécuter dans le thread Tk (utilisable depuis n'importe quel thread)
+    def post(self, callback, *args):
+        self.pending.put((callback, args))
+
+    # Arrête le vidage périodique
+    def close(self):
+        if self._job is not None:
+            try:
+                self.widget.after_cancel(self._job)
+            except Exception:
+                pass
+            self._job = None
+
+    # Planifie le prochain vidage
+    def _schedule(self):
+        self._job = self.widget.after(self.interval, self._drain)
+
+    # Exécute les appels en attente dans le thread Tk
+    def _drain(self):
+        while True:
+            try:
+                callback, args = self.pending.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                callback(*args)
+            except Exception:
+                log.exception("Erreur lors de la mise à jour de l'interface")
+        self._schedule()
+
+
+# Emplacement unique pour la dernière valeur d'un flux, appliquée dans le thread Tk à cadence fixe
+class TkLatest:
+    # Initialise l'emplacement
+    def __init__(self, widget, callback, frameRate=None):
+        """
+        Chaque publication remplace la précédente non encore appliquée : le
+        coût d'affichage est borné par la cadence quel que soit le débit.
+
+        Args:
+            widget: Un widget Tk quelconque (utilisé pour after())
+            callback: Fonction appelée dans le thread Tk avec la dernière valeur
+            frameRate: Nombre maximum d'applications par seconde
+        """
+        self.widget = widget
+        self.callback = callback
+        self.interval = max(1, int(1000 / (frameRate or UI_CONFIG['frame_rate'])))
+        self._value = None
+        self._pending = False
+        self._lock = threading.Lock()
+        self._job = None
+        self._schedule()
+
+    # Publie une nouvelle valeur (utilisable depuis n'importe quel thread)
+    def post(self, value):
+        with self._lock:
+            self._value = value
+            self._pending = True
+
+    # Arrête l'application périodique
+    def close(self):
+        if self._job is not None:
+            try:
+                self.widget.after_cancel(self._job)
+            except Exception:
+                pass
+            self._job = None
+
+    # Planifie la prochaine application
+    def _schedule(self):
+        self._job = self.widget.after(self.interval, self._drain)
+
+    # Applique la dernière valeur publiée, s'il y en a une
+    def _drain(self):
+        with self._lock:
+            value, pending = self._value, self._pending
+            self._value, self._pending = None, False
+        if pending:
+            try:
+                self.callback(value)
+            except Exception:
+                log.exception("Erreur lors de la mise à jour de l'interface")
+        self._schedule()
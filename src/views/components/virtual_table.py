@@ -0,0 +1,193 @@
+import tkinter as tk
+from tkinter import ttk
+from config.settings import COLOR_PALETTE, UI_CONFIG
+
+# Tableau virtualisé : seules les lignes visibles existent dans le Treeview
+class VirtualTable:
+    # Initialise le tableau
+    def __init__(self, parent, rowHeight=25, margin=None):
+        """
+        Les lignes sont lues à la demande auprès d'une source fenêtrée
+        (fetch(début, nombre)) ; le défilement ne fait que réaffecter les
+        valeurs des éléments existants.
+
+        Args:
+            parent: Le widget parent
+            rowHeight: Hauteur d'une ligne en pixels
+            margin: Nombre de lignes créées en plus de celles visibles
+        """
+        self.parent = parent
+        self.rowHeight = rowHeight
+        self.margin = UI_CONFIG['table_margin_rows'] if margin is None else margin
+
+        # Source des données
+        self.columns = []
+        self.rowCount = 0
+        self.fetch = lambda start, count: []
+
+        # Fenêtre affichée
+        self.offset = 0
+        self.visibleRows = 1
+        self.items = []
+
+        # Largeur des colonnes recalculée une seule fois par redimensionnement
+        self._lastWidth = None
+        self._resizeJob = None
+
+        self._createWidgets()
+
+    # Crée le Treeview et ses scrollbars
+    def _createWidgets(self):
+        self.frame = tk.Frame(self.parent, bg=COLOR_PALETTE['bg_light'])
+        self.frame.columnconfigure(0, weight=1)
+        self.frame.rowconfigure(0, weight=1)
+
+        self.treeView = ttk.Treeview(self.frame, columns=(), show="headings", height=1)
+
+        # Le défilement vertical est géré par le tableau, pas par le Treeview
+        self.vsb = ttk.Scrollbar(self.frame, orient="vertical", command=self._onScrollbar)
+        hsb = ttk.Scrollbar(self.frame, orient="horizontal", command=self.treeView.xview)
+        self.treeView.configure(xscrollcommand=hsb.set)
+
+        self.treeView.grid(row=0, column=0, sticky="nsew")
+        self.vsb.grid(row=0, column=1, sticky="ns")
+        hsb.grid(row=1, column=0, sticky="ew")
+
+        # Configurer le style du TreeView
+        style = ttk.Style()
+        style.configure("Treeview",
+                        background=COLOR_PALETTE['bg_light'],
+                        foreground=COLOR_PALETTE['text_dark'],
+                        rowheight=self.rowHeight,
+                        fieldbackground=COLOR_PALETTE['bg_light'])
+        style.configure("Treeview.Heading",
+                        background=COLOR_PALETTE['primary'],
+                        foreground=COLOR_PALETTE['text_dark'],
+                        font=("Segoe UI", 10, "bold"))
+        style.map("Treeview",
+                 background=[("selected", COLOR_PALETTE['accent'])],
+                 foreground=[("selected", COLOR_PALETTE['text_light'])])
+
+        self.treeView.bind("<MouseWheel>", self._onMouseWheel)
+        self.treeView.bind("<Button-4>", self._onMouseWheel)
+        self.treeView.bind("<Button-5>", self._onMouseWheel)
+        self.treeView.bind("<Up>", lambda event: self.scrollTo(self.offset - 1) or "break")
+        self.treeView.bind("<Down>", lambda event: self.scrollTo(self.offset + 1) or "break")
+        self.treeView.bind("<Prior>", lambda event: self.scrollTo(self.offset - self.visibleRows) or "break")
+        self.treeView.bind("<Next>", lambda event: self.scrollTo(self.offset + self.visibleRows) or "break")
+        self.frame.bind("<Configure>", self._onConfigure)
+
+    # Place le tableau dans la grille du parent
+    def grid(self, **kwargs):
+        self.frame.grid(**kwargs)
+
+    # Retire le tableau de la grille du parent
+    def grid_remove(self):
+        self.frame.grid_remove()
+
+    # Affiche une liste de lignes
+    def setRows(self, columns, rows, keepPosition=False):
+        """
+        Args:
+            columns: Liste des noms de colonnes
+            rows: Séquence de lignes (indexable, non copiée)
+            keepPosition: Conserver la position de défilement
+        """
+        self.setSource(columns, len(rows), lambda start, count: rows[start:start + count], keepPosition)
+
+    # Affiche des lignes lues à la demande
+    def setSource(self, columns, rowCount, fetch, keepPosition=False):
+        """
+        Args:
+            columns: Liste des noms de colonnes
+            rowCount: Nombre total de lignes
+            fetch: Fonction fetch(début, nombre) retournant les lignes de cette fenêtre
+            keepPosition: Conserver la position de défilement
+        """
+        if list(columns) != self.columns:
+            self.columns = list(columns)
+            self.treeView.configure(columns=self.columns)
+            for col in self.columns:
+                self.treeView.heading(col, text=col)
+                self.treeView.column(col, width=100)  # Largeur par défaut
+            self._lastWidth = None
+            self._resizeColumns()
+
+        self.rowCount = rowCount
+        self.fetch = fetch
+        self.scrollTo(self.offset if keepPosition else 0)
+
+    # Fait défiler le tableau jusqu'à une ligne
+    def scrollTo(self, offset):
+        """
+        Args:
+            offset: Index de la première ligne affichée
+        """
+        self.offset = max(0, min(int(offset), self.rowCount - self.visibleRows))
+        self._render()
+
+    # Met à jour les éléments du Treeview avec la fenêtre courante
+    def _render(self):
+        rows = self.fetch(self.offset, self.visibleRows + self.margin) if self.rowCount else []
+
+        # Réutiliser les éléments existants, n'en créer ou n'en supprimer que la différence
+        for item, row in zip(self.items, rows):
+            self.treeView.item(item, values=row)
+        for row in rows[len(self.items):]:
+            self.items.append(self.treeView.insert("", "end", values=row))
+        if len(self.items) > len(rows):
+            self.treeView.delete(*self.items[len(rows):])
+            del self.items[len(rows):]
+        self.treeView.yview_moveto(0)
+
+        # Position de la scrollbar sur l'ensemble des lignes
+        if self.rowCount:
+            first = self.offset / self.rowCount
+            last = min(1.0, (self.offset + self.visibleRows) / self.rowCount)
+            self.vsb.set(first, last)
+        else:
+            self.vsb.set(0, 1)
+
+    # Gère les commandes de la scrollbar verticale
+    def _onScrollbar(self, action, value, unit=None):
+        if action == "moveto":
+            self.scrollTo(float(value) * self.rowCount)
+        elif action == "scroll":
+            step = self.visibleRows if unit == "pages" else 1
+            self.scrollTo(self.offset + int(value) * step)
+
+    # Gère la molette de la souris (Windows/macOS : delta, Linux : boutons 4 et 5)
+    def _onMouseWheel(self, event):
+        if event.num == 4 or event.delta > 0:
+            self.scrollTo(self.offset - 3)
+        else:
+            self.scrollTo(self.offset + 3)
+        # Empêcher le défilement de la page entière
+        return "break"
+
+    # Recalcule le nombre de lignes visibles et planifie l'ajustement des colonnes
+    def _onConfigure(self, event=None):
+        # En-tête et scrollbar horizontale occupent environ deux lignes
+        visibleRows = max(1, event.height // self.rowHeight - 2)
+        if visibleRows != self.visibleRows:
+            self.visibleRows = visibleRows
+            self.treeView.configure(height=visibleRows)
+            self.scrollTo(self.offset)
+
+        if event.width != self._lastWidth:
+            if self._resizeJob is not None:
+                self.frame.after_cancel(self._resizeJob)
+            self._resizeJob = self.frame.after(100, self._resizeColumns)
+
+    # Répartit la largeur disponible entre les colonnes
+    def _resizeColumns(self):
+        self._resizeJob = None
+        width = self.frame.winfo_width()
+        if not self.columns or width <= 1 or width == self._lastWidth:
+            return
+        self._lastWidth = width
+
+        # Tenir compte de la scrollbar
+        colWidth = max(50, (width - 20) // len(self.columns))
+        for col in self.columns:
+            self.treeView.column(col, width=colWidth)
@@ -1,10 +1,15 @@
 import tkinter as tk
 import customtkinter as ctk
 from config.settings import COLOR_PALETTE
+from src.models.metrics import METRICS, METRICS_BY_NAME
 from src.views.components.sensor_card import SensorCard
+from src.utils.console_sink import ConsoleSink
 
 # Vue du tableau de bord qui affiche les valeurs des capteurs et la console.
 class DashboardView:
+    # Ordre d'affichage des cartes de capteurs
+    CARD_ORDER = ('air_quality', 'distance', 'luminosity', 'uv_index', 'ir_value', 'temperature', 'humidity', 'pressure')
+
     # Initialise la vue du tableau de bord.
     def __init__(self, parent, museoFonts, onStart=None, onStop=None, onToggleDemo=None):
         """
@@ -21,15 +26,9 @@ class DashboardView:
         self.onStop = onStop
         self.onToggleDemo = onToggleDemo
         
-        # Variables pour les valeurs des capteurs
-        self.airQualityVar = ctk.StringVar(value="N/A")
-        self.distanceVar = ctk.StringVar(value="N/A")
-        self.luminosityVar = ctk.StringVar(value="N/A")
-        self.uvIndexVar = ctk.StringVar(value="N/A")
-        self.irValueVar = ctk.StringVar(value="N/A")
-        self.temperatureVar = ctk.StringVar(value="N/A")
-        self.humidityVar = ctk.StringVar(value="N/A")
-        self.pressureVar = ctk.StringVar(value="N/A")
+        # Variable affichée de chaque métrique du registre
+        self.sensorVars = {metric.name: ctk.StringVar(value="N/A") for metric in METRICS}
+        self.displayedValues = {}  # Dernier texte affiché par capteur
         
         # Variables pour l'état des boutons
         self.isReading = False
@@ -55,10 +54,11 @@ class DashboardView:
         sensorSection.grid_columnconfigure(0, weight=1);
         
         # Titre de la section capteurs
-        sensorTitle = ctk.CTkLabel(sensorSection, text="Valeurs des capteurs", 
+        self.sensorTitle = ctk.CTkLabel(sensorSection, text="Valeurs des capteurs", 
                                   font=ctk.CTkFont(family=self.museoFonts.get('black', None), size=18),
                                   text_color=COLOR_PALETTE['text_dark']);
-        sensorTitle.grid(row=0, column=0, sticky="w", padx=20, pady=(0, 15));
+        self.displayedDevice = None  # Sous-appareil affiché dans le titre
+        self.sensorTitle.grid(row=0, column=0, sticky="w", padx=20, pady=(0, 15));
         
         # Conteneur pour les cartes de capteurs
         sensorCardsContainer = ctk.CTkFrame(sensorSection, fg_color="transparent");
@@ -91,6 +91,9 @@ class DashboardView:
                                     border_width=0,
                                     text_color=COLOR_PALETTE['text_dark']);
         self.console.grid(row=0, column=0, sticky="nsew", padx=15, pady=15)
+        
+        # Les messages sont écrits dans la console par lots, en nombre de lignes borné
+        self.consoleSink = ConsoleSink(self.console)
     
     def createControlsSection(self):
         """Crée la section des contrôles avec les boutons"""
@@ -194,113 +197,47 @@ class DashboardView:
         self.sensorsContainer.grid_columnconfigure((0, 1, 2), weight=1, uniform="equal")
         self.sensorsContainer.grid_rowconfigure((0, 1, 2, 3), weight=1)
         
-        # Première ligne - Air Quality, Distance
-        self.airQualityCard = SensorCard(
-            self.sensorsContainer, 0, 0, "Air Quality", 
-            self.airQualityVar, "src/public/icons/air-quality.png", 
-            COLOR_PALETTE['primary'], self.museoFonts, "ppm"
-        )
-
-        self.distanceCard = SensorCard(
-            self.sensorsContainer, 0, 1, "Distance", 
-            self.distanceVar, "src/public/icons/ruler.png", 
-            COLOR_PALETTE['primary'], self.museoFonts, "m"
-        )
-        
-        # Deuxième ligne - Luminosité, UV, IR
-        self.luminosityCard = SensorCard(
-            self.sensorsContainer, 0, 2, "Luminosité", 
-            self.luminosityVar, "src/public/icons/sun.png", 
-            COLOR_PALETTE['primary'], self.museoFonts, "lux"
-        )
-        
-        self.uvIndexCard = SensorCard(
-            self.sensorsContainer, 1, 0, "UV Index", 
-            self.uvIndexVar, "src/public/icons/uv.png", 
-            COLOR_PALETTE['primary'], self.museoFonts
-        )
-        
-        self.irValueCard = SensorCard(
-            self.sensorsContainer, 1, 1, "Infrarouge", 
-            self.irValueVar, "src/public/icons/ir.png", 
-            COLOR_PALETTE['primary'], self.museoFonts
-        )
-        
-        # Troisième ligne - Température, Humidité, Pression
-        self.temperatureCard = SensorCard(
-            self.sensorsContainer, 1, 2, "Température", 
-            self.temperatureVar, "src/public/icons/thermometer.png", 
-            COLOR_PALETTE['primary'], self.museoFonts, "°C"
-        )
-        
-        self.humidityCard = SensorCard(
-            self.sensorsContainer, 2, 0, "Humidité", 
-            self.humidityVar, "src/public/icons/humidity.png", 
-            COLOR_PALETTE['primary'], self.museoFonts, "%"
-        )
-        
-        self.pressureCard = SensorCard(
-            self.sensorsContainer, 2, 1, "Pression", 
-            self.pressureVar, "src/public/icons/barometer.png", 
-            COLOR_PALETTE['primary'], self.museoFonts, "hPa"
-        )
+        # Trois cartes par ligne, dans l'ordre de CARD_ORDER
+        self.sensorCards = {}
+        for index, name in enumerate(self.CARD_ORDER):
+            metric = METRICS_BY_NAME[name]
+            row, col = divmod(index, 3)
+            self.sensorCards[name] = SensorCard(
+                self.sensorsContainer, row, col, metric.label,
+                self.sensorVars[name], metric.icon,
+                COLOR_PALETTE['primary'], self.museoFonts, metric.unit
+            )
     
     # Met à jour les valeurs des capteurs avec les nouvelles données
     def updateSensorValues(self, data):
         """
+        Seules les variables dont le texte affiché change sont modifiées. Le
+        titre indique le sous-appareil ("port/N") dont proviennent les valeurs.
+        
         Args:
-            data: Dictionnaire contenant les valeurs des capteurs
+            data: Une Reading ou un dictionnaire contenant les valeurs des capteurs
         """
-        # Mettre à jour les variables de données si elles existent
-        if 'air_quality' in data and data['air_quality'] is not None and data['air_quality'] != 'N/A':
-            self.airQualityVar.set(f"{data['air_quality']:.2f}")
-        else:
-            self.airQualityVar.set("N/A")
-         
-        if 'distance' in data and data['distance'] is not None and data['distance'] != 'N/A':
-            self.distanceVar.set(f"{data['distance']:.2f}")
-        else:
-            self.distanceVar.set("N/A")
-        
-        if 'luminosity' in data and data['luminosity'] is not None and data['luminosity'] != 'N/A':
-            self.luminosityVar.set(str(data['luminosity']))
-        else:
-            self.luminosityVar.set("N/A")
-        
-        if 'uv_index' in data and data['uv_index'] is not None and data['uv_index'] != 'N/A':
-            self.uvIndexVar.set(f"{data['uv_index']:.2f}")
-        else:
-            self.uvIndexVar.set("N/A")
-        
-        if 'ir_value' in data and data['ir_value'] is not None and data['ir_value'] != 'N/A':
-            self.irValueVar.set(str(data['ir_value']))
-        else:
-            self.irValueVar.set("N/A")
-        
-        if 'temperature' in data and data['temperature'] is not None and data['temperature'] != 'N/A':
-            self.temperatureVar.set(f"{data['temperature']:.1f}")
-        else:
-            self.temperatureVar.set("N/A")
-        
-        if 'humidity' in data and data['humidity'] is not None and data['humidity'] != 'N/A':
-            self.humidityVar.set(str(data['humidity']))
-        else:
-            self.humidityVar.set("N/A")
-        
-        if 'pressure' in data and data['pressure'] is not None and data['pressure'] != 'N/A':
-            self.pressureVar.set(str(data['pressure']))
-        else:
-            self.pressureVar.set("N/A")
+        deviceId = getattr(data, 'deviceId', None)
+        device = deviceId if deviceId and '/' in deviceId else None
+        if device != self.displayedDevice:
+            self.displayedDevice = device
+            self.sensorTitle.configure(text=f"Valeurs des capteurs ({device})" if device else "Valeurs des capteurs")
+        
+        for metric in METRICS:
+            text = metric.formatValue(data.get(metric.name))
+            if self.displayedValues.get(metric.name) != text:
+                self.displayedValues[metric.name] = text
+                self.sensorVars[metric.name].set(text)
     
-    # Ajoute un message à la console.
-    def logToConsole(self, message):
+    # Ajoute un message à la console (utilisable depuis n'importe quel thread).
+    def logToConsole(self, message, level='info'):
         """
         Args:
             message: Le message à ajouter
+            level: 'debug', 'info', 'success', 'warning' ou 'error'
         """
-        self.console.insert(tk.END, f"{message}\n")
-        self.console.see(tk.END)
+        self.consoleSink.emit(message, level)
     
     # Efface le contenu de la console.
     def clearConsole(self):
-        self.console.delete(1.0, tk.END) 
\ No newline at end of file
+        self.consoleSink.clear()
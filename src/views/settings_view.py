@@ -4,7 +4,7 @@ from config.settings import COLOR_PALETTE
 # Vue pour les paramètres de l'application.
 class SettingsView:
     # Initialise la vue des paramètres.
-    def __init__(self, parent, museoFonts, onConnectPort, onRefreshPorts, onConnectDb, onDisconnectDb):
+    def __init__(self, parent, museoFonts, onConnectPort, onRefreshPorts, onConnectDb, onDisconnectDb, onConnectAllPorts=None):
         """
         Args:
             parent: Le widget parent
@@ -13,6 +13,7 @@ class SettingsView:
             on_refresh_ports: Fonction à appeler pour rafraîchir la liste des ports
             on_connect_db: Fonction à appeler pour se connecter à la base de données
             on_disconnect_db: Fonction à appeler pour se déconnecter de la base de données
+            onConnectAllPorts: Fonction à appeler pour connecter/déconnecter tous les ports (multi-liaisons)
         """
         self.parent = parent
         self.museoFonts = museoFonts
@@ -20,10 +21,12 @@ class SettingsView:
         self.onRefreshPorts = onRefreshPorts
         self.onConnectDb = onConnectDb
         self.onDisconnectDb = onDisconnectDb
+        self.onConnectAllPorts = onConnectAllPorts
         
         # Variables pour les paramètres
         self.selectedPort = ctk.StringVar(value="")
         self.connectionStatus = ctk.StringVar(value="Non connecté")
+        self.linksStatus = ctk.StringVar(value="Aucune liaison")
         self.dbHost = ctk.StringVar(value="localhost")
         self.dbUser = ctk.StringVar(value="root")
         self.dbPassword = ctk.StringVar(value="root")
@@ -48,6 +51,9 @@ class SettingsView:
         
         # Section connexion base de données
         self.createDatabaseSection(mainSection)
+        
+        # Section diagnostic de réception
+        self.createStatsSection(mainSection)
 
     
     # Crée la section de connexion série.
@@ -117,6 +123,19 @@ class SettingsView:
                                          height=30)
         self.connectButton.grid(row=0, column=3, sticky="e", padx=0, pady=0)
         
+        # Bouton de connexion de tous les ports (mode multi-liaisons)
+        self.connectAllButton = ctk.CTkButton(serialControls, text="Tous les ports", 
+                                            command=self.onConnectAllPorts,
+                                            font=ctk.CTkFont(family=self.museoFonts.get('bold', None), size=14),
+                                            fg_color=COLOR_PALETTE['bg_light'],
+                                            text_color=COLOR_PALETTE['primary'],
+                                            hover_color=COLOR_PALETTE['border'],
+                                            corner_radius=4,
+                                            width=120,
+                                            height=30,
+                                            state="normal" if self.onConnectAllPorts else "disabled")
+        self.connectAllButton.grid(row=0, column=4, sticky="e", padx=(10, 0), pady=0)
+        
         # Statut de la connexion
         statusFrame = ctk.CTkFrame(serialFrame, fg_color="transparent")
         statusFrame.grid(row=2, column=0, sticky="ew", padx=20, pady=(0, 20))
@@ -133,6 +152,18 @@ class SettingsView:
                                       font=ctk.CTkFont(family=self.museoFonts.get('bold', None), size=14),
                                       text_color=COLOR_PALETTE['text_muted'])
         self.statusValue.grid(row=0, column=1, sticky="w", padx=0, pady=0)
+        
+        # Statut des liaisons multi-ports
+        linksLabel = ctk.CTkLabel(statusFrame, text="Liaisons:", 
+                                 font=ctk.CTkFont(family=self.museoFonts.get('regular', None), size=14),
+                                 text_color=COLOR_PALETTE['text_dark'])
+        linksLabel.grid(row=1, column=0, sticky="w", padx=(0, 10), pady=(5, 0))
+        
+        self.linksValue = ctk.CTkLabel(statusFrame, 
+                                     textvariable=self.linksStatus,
+                                     font=ctk.CTkFont(family=self.museoFonts.get('bold', None), size=14),
+                                     text_color=COLOR_PALETTE['text_muted'])
+        self.linksValue.grid(row=1, column=1, sticky="w", padx=0, pady=(5, 0))
 
     # Crée la section de connexion à la base de données.
     def createDatabaseSection(self, parent):
@@ -253,6 +284,78 @@ class SettingsView:
                                          text_color=COLOR_PALETTE['text_muted'])
         self.dbStatusValue.grid(row=0, column=1, sticky="w", padx=0, pady=0)
             
+    # Crée la section de diagnostic de réception (séquences, intervalles, files d'attente).
+    def createStatsSection(self, parent):
+        """
+        Args:
+            parent: Le widget parent
+        """
+        statsFrame = ctk.CTkFrame(parent, fg_color=COLOR_PALETTE['bg_card'], corner_radius=8, border_width=1, border_color=COLOR_PALETTE['border'])
+        statsFrame.grid(row=2, column=0, sticky="nsew", padx=0, pady=(0, 20))
+        statsFrame.columnconfigure(0, weight=1)
+        statsFrame.rowconfigure(1, weight=1)
+        
+        # Titre de la section
+        statsTitle = ctk.CTkLabel(statsFrame, text="Diagnostic de réception", 
+                                 font=ctk.CTkFont(family=self.museoFonts.get('bold', None), size=16),
+                                 text_color=COLOR_PALETTE['text_dark'])
+        statsTitle.grid(row=0, column=0, sticky="w", padx=20, pady=(20, 10))
+        
+        # Zone de texte en lecture seule
+        self.statsText = ctk.CTkTextbox(statsFrame, 
+                                       font=ctk.CTkFont(family="Consolas", size=12),
+                                       fg_color=COLOR_PALETTE['bg_light'],
+                                       text_color=COLOR_PALETTE['text_dark'],
+                                       height=180,
+                                       state="disabled")
+        self.statsText.grid(row=1, column=0, sticky="nsew", padx=20, pady=(0, 20))
+        self.displayedStats = None  # Dernier texte affiché
+    
+    # Met à jour le diagnostic de réception.
+    def updateStats(self, stats):
+        """
+        Args:
+            stats: Dictionnaire retourné par SensorService.getStats()
+        """
+        lines = []
+        for link in stats['links']:
+            state = "connectée" if link['connected'] else "fermée"
+            lines.append(f"{link['port']} ({state}) : {link['records']} lectures, {link['bytes']} octets, "
+                         f"{link['lines']} lignes, {link['frames']} trames, {link['bad_frames']} trames invalides, "
+                         f"{link['overflows']} débordements")
+            backlog = link['port_backlog']
+            lines.append(f"  En attente : {link['pending_bytes']} octets dans le découpeur, "
+                         f"{'?' if backlog is None else backlog} octets dans le port")
+            
+            arrivals = link['arrivals']
+            if arrivals['count']:
+                lines.append(f"  Intervalles (ms) : moyenne {arrivals['mean']:.0f}, min {arrivals['min']:.0f}, max {arrivals['max']:.0f}")
+                lines.append("    " + "  ".join(f"{label}: {count}" for label, count in arrivals['buckets']))
+            
+            for deviceId, sequence in link['sequences'].items():
+                lines.append(f"  Appareil {deviceId} : {sequence['received']} reçues, {sequence['lost']} perdues "
+                             f"({sequence['loss_rate']:.1%}), {sequence['duplicates']} doublons, "
+                             f"{sequence['out_of_order']} en désordre, {sequence['resets']} redémarrages")
+        if not stats['links']:
+            lines.append("Aucune liaison série")
+        
+        changes = stats['change_filter']
+        writer = stats['writer']
+        lines.append(f"Bus : {stats['bus']['published']} publiées, {stats['bus']['errors']} erreurs ; "
+                     f"filtre : {changes['suppressed']} inchangées écartées, {changes['heartbeats']} battements")
+        lines.append(f"Écriture : {writer['pending']} en file, {writer['spool_pending']} dans le spool, "
+                     f"{writer['flushed']} écrites, {writer['rejected']} refusées, {writer['dropped']} perdues")
+        
+        # Ne réécrire la zone de texte que si le contenu a changé
+        text = "\n".join(lines)
+        if text == self.displayedStats:
+            return
+        self.displayedStats = text
+        self.statsText.configure(state="normal")
+        self.statsText.delete("1.0", "end")
+        self.statsText.insert("1.0", text)
+        self.statsText.configure(state="disabled")
+    
     # Met à jour la liste des ports disponibles.
     def updatePortsList(self, ports):
         """
@@ -279,6 +382,22 @@ class SettingsView:
             self.statusValue.configure(text_color=COLOR_PALETTE['text_muted'])
             self.connectButton.configure(text="Connecter")
 
+    # Met à jour le statut des liaisons multi-ports.
+    def updateLinksStatus(self, links):
+        """
+        Args:
+            links: Liste des liaisons retournée par SensorService.getLinks()
+        """
+        if links:
+            ports = ", ".join(link['port'] for link in links)
+            self.linksStatus.set(f"{len(links)} liaison(s) : {ports}")
+            self.linksValue.configure(text_color=COLOR_PALETTE['primary'])
+            self.connectAllButton.configure(text="Arrêter tous")
+        else:
+            self.linksStatus.set("Aucune liaison")
+            self.linksValue.configure(text_color=COLOR_PALETTE['text_muted'])
+            self.connectAllButton.configure(text="Tous les ports")
+
     # Met à jour le statut de la connexion à la base de données.
     def updateDbStatus(self, isConnected, dbName=None):
         """
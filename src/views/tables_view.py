@@ -1,29 +1,37 @@
 import tkinter as tk
-from tkinter import ttk
 import customtkinter as ctk
 from config.settings import COLOR_PALETTE
+from src.views.components.virtual_table import VirtualTable
 
 # Vue pour l'affichage des tables de la base de données
 class TablesView:
     # Initialise la vue des tables
-    def __init__(self, parent, museoFonts, onTableSelect, onRefreshTables):
+    def __init__(self, parent, museoFonts, onTableSelect, onRefreshTables,
+                 onPreviousPage=None, onNextPage=None, onJumpToTime=None):
         """   
         Args:
             parent: Le widget parent
             museoFonts: Dictionnaire des polices Museo
             onTableSelect: Fonction à appeler lorsqu'une table est sélectionnée
             onRefreshTables: Fonction à appeler pour rafraîchir la liste des tables
+            onPreviousPage: Fonction à appeler pour afficher les lignes plus récentes
+            onNextPage: Fonction à appeler pour afficher les lignes plus anciennes
+            onJumpToTime: Fonction à appeler avec la date saisie pour s'y positionner
         """
         self.parent = parent
         self.museoFonts = museoFonts
         self.onTableSelect = onTableSelect
         self.onRefreshTables = onRefreshTables
+        self.onPreviousPage = onPreviousPage
+        self.onNextPage = onNextPage
+        self.onJumpToTime = onJumpToTime
         
         # Variables pour le tableau
         self.tableInitialized = False
         self.currentTableName = None
         self.currentColumns = []
         self.treeView = None
+        self.table = None
         self.mainFrame = None
         
         # Créer le contenu de l'onglet Tables
@@ -162,6 +170,56 @@ class TablesView:
         
         # Initialisation avec un message d'aide
         self.tableData.insert(tk.END, "Sélectionnez une table dans la liste de gauche pour afficher ses données.")
+        
+        # Barre de pagination
+        pageFrame = ctk.CTkFrame(self.rightPanel, fg_color="transparent")
+        pageFrame.grid(row=2, column=0, sticky="ew", padx=15, pady=(0, 15))
+        pageFrame.columnconfigure(2, weight=1)
+        
+        self.previousPageButton = ctk.CTkButton(pageFrame, text="◀ Plus récentes",
+                                               command=lambda: self.onPreviousPage and self.onPreviousPage(),
+                                               font=ctk.CTkFont(family=self.museoFonts.get('bold', None), size=13),
+                                               fg_color=COLOR_PALETTE['bg_light'],
+                                               text_color=COLOR_PALETTE['primary'],
+                                               hover_color=COLOR_PALETTE['border'],
+                                               corner_radius=4,
+                                               width=130,
+                                               height=30,
+                                               state="disabled")
+        self.previousPageButton.grid(row=0, column=0, sticky="w", padx=(0, 5), pady=0)
+        
+        self.nextPageButton = ctk.CTkButton(pageFrame, text="Plus anciennes ▶",
+                                           command=lambda: self.onNextPage and self.onNextPage(),
+                                           font=ctk.CTkFont(family=self.museoFonts.get('bold', None), size=13),
+                                           fg_color=COLOR_PALETTE['bg_light'],
+                                           text_color=COLOR_PALETTE['primary'],
+                                           hover_color=COLOR_PALETTE['border'],
+                                           corner_radius=4,
+                                           width=130,
+                                           height=30,
+                                           state="disabled")
+        self.nextPageButton.grid(row=0, column=1, sticky="w", padx=0, pady=0)
+        
+        self.pageStatus = ctk.CTkLabel(pageFrame, text="",
+                                      font=ctk.CTkFont(family=self.museoFonts.get('regular', None), size=12),
+                                      text_color=COLOR_PALETTE['text_muted'])
+        self.pageStatus.grid(row=0, column=2, sticky="w", padx=10, pady=0)
+        
+        # Positionnement à une date
+        self.jumpEntry = ctk.CTkEntry(pageFrame, placeholder_text="AAAA-MM-JJ HH:MM:SS", width=170, height=30)
+        self.jumpEntry.grid(row=0, column=3, sticky="e", padx=(0, 5), pady=0)
+        self.jumpEntry.bind('<Return>', self._jumpToTime)
+        
+        jumpButton = ctk.CTkButton(pageFrame, text="Aller",
+                                  command=self._jumpToTime,
+                                  font=ctk.CTkFont(family=self.museoFonts.get('bold', None), size=13),
+                                  fg_color=COLOR_PALETTE['primary'],
+                                  text_color=COLOR_PALETTE['text_light'],
+                                  hover_color=COLOR_PALETTE['accent'],
+                                  corner_radius=4,
+                                  width=60,
+                                  height=30)
+        jumpButton.grid(row=0, column=4, sticky="e", padx=0, pady=0)
     
     # Gère l'événement de sélection d'une table.
     def _onTableSelect(self, event=None):
@@ -183,6 +241,16 @@ class TablesView:
         if self.currentTableName:
             self.onTableSelect(self.currentTableName)
     
+    # Se positionne à la date saisie
+    def _jumpToTime(self, event=None):
+        """
+        Args:
+            event: L'événement de validation de la saisie
+        """
+        text = self.jumpEntry.get()
+        if text and self.onJumpToTime:
+            self.onJumpToTime(text)
+    
     # Met à jour la liste des tables
     def updateTablesList(self, tables):
         """
@@ -210,7 +278,7 @@ class TablesView:
         # Créer la vue du tableau
         self.createTableView(tableName, columns, rows)
 
-    # Crée une vue de tableau pour afficher les données
+    # Affiche des lignes dans le tableau, créé une seule fois puis réutilisé
     def createTableView(self, tableName, columns, rows):
         """
         Args:
@@ -218,87 +286,57 @@ class TablesView:
             columns: Liste des noms de colonnes
             rows: Liste des lignes de données
         """
-        # Effacer le contenu précédent
-        self.tableData.delete(1.0, tk.END)
-        
         if not columns or not rows:
-            self.tableData.insert(tk.END, "Aucune donnée disponible pour cette table.")
+            # Masquer le tableau pour laisser voir le message
+            if self.mainFrame:
+                self.mainFrame.grid_remove()
+            self.showMessage("Aucune donnée disponible pour cette table.")
             return
         
-        # Supprimer le widget TreeView existant s'il existe
-        if self.treeView:
-            self.treeView.destroy()
-        
-        if self.mainFrame:
-            self.mainFrame.destroy()
-        
-        # Créer un cadre pour le TreeView
-        self.mainFrame = ctk.CTkFrame(self.rightPanel, fg_color="transparent")
-        self.mainFrame.grid(row=1, column=0, sticky="nsew", padx=15, pady=15)
-        self.mainFrame.columnconfigure(0, weight=1)
-        self.mainFrame.rowconfigure(0, weight=1)
-        
-        # Créer un cadre pour le TreeView avec scrollbars
-        treeFrame = ctk.CTkFrame(self.mainFrame, fg_color="transparent")
-        treeFrame.grid(row=0, column=0, sticky="nsew")
-        treeFrame.columnconfigure(0, weight=1)
-        treeFrame.rowconfigure(0, weight=1)
-        
-        # Créer le TreeView
-        self.treeView = ttk.Treeview(treeFrame, columns=columns, show="headings")
-        
-        # Configurer les colonnes
-        for col in columns:
-            self.treeView.heading(col, text=col)
-            self.treeView.column(col, width=100)  # Largeur par défaut
-        
-        # Ajouter les données
-        for row in rows:
-            self.treeView.insert("", "end", values=row)
-        
-        # Ajouter les scrollbars
-        vsb = ttk.Scrollbar(treeFrame, orient="vertical", command=self.treeView.yview)
-        hsb = ttk.Scrollbar(treeFrame, orient="horizontal", command=self.treeView.xview)
-        self.treeView.configure(yscrollcommand=vsb.set, xscrollcommand=hsb.set)
-        
-        # Placer les widgets
-        self.treeView.grid(row=0, column=0, sticky="nsew")
-        vsb.grid(row=0, column=1, sticky="ns")
-        hsb.grid(row=1, column=0, sticky="ew")
-        
-        # Configurer le style du TreeView
-        style = ttk.Style()
-        style.configure("Treeview", 
-                        background=COLOR_PALETTE['bg_light'],
-                        foreground=COLOR_PALETTE['text_dark'],
-                        rowheight=25,
-                        fieldbackground=COLOR_PALETTE['bg_light'])
-        style.configure("Treeview.Heading", 
-                        background=COLOR_PALETTE['primary'],
-                        foreground=COLOR_PALETTE['text_dark'],
-                        font=("Segoe UI", 10, "bold"))
-        style.map("Treeview", 
-                 background=[("selected", COLOR_PALETTE['accent'])],
-                 foreground=[("selected", COLOR_PALETTE['text_light'])])
-        
-        # Configurer le redimensionnement du cadre
-        self.mainFrame.bind("<Configure>", self._configureFrame)
-        
-        self.tableInitialized = True
-    
-    # Ajuste la taille des colonnes du TreeView lors du redimensionnement.
-    def _configureFrame(self, event=None):
-        if self.treeView and self.currentColumns:
-            # Calculer la largeur disponible
-            availableWidth = event.width - 20  # Tenir compte de la scrollbar
-            
-            # Calculer la largeur de chaque colonne
-            colWidth = availableWidth // len(self.currentColumns)
+        if not self.mainFrame:
+            # Créer un cadre pour le tableau
+            self.mainFrame = ctk.CTkFrame(self.rightPanel, fg_color="transparent")
+            self.mainFrame.grid(row=1, column=0, sticky="nsew", padx=15, pady=15)
+            self.mainFrame.columnconfigure(0, weight=1)
+            self.mainFrame.rowconfigure(0, weight=1)
             
-            # Définir la largeur des colonnes
-            for col in self.currentColumns:
-                self.treeView.column(col, width=colWidth)
-
+            # Tableau virtualisé : seules les lignes visibles sont créées dans le TreeView
+            self.table = VirtualTable(self.mainFrame)
+            self.table.grid(row=0, column=0, sticky="nsew")
+            self.treeView = self.table.treeView
+            self.tableInitialized = True
+        self.mainFrame.grid()
+        
+        self.table.setRows(columns, rows)
+    
+    # Affiche les lignes après l'ajout de nouvelles lignes en tête
+    def prependTableRows(self, columns, rows, added):
+        """
+        Args:
+            columns: Liste des noms de colonnes
+            rows: Liste complète des lignes affichées, nouvelles lignes comprises
+            added: Nombre de lignes ajoutées en tête
+        """
+        if not self.table:
+            self.updateTableData(self.currentTableName, columns, rows)
+            return
+        
+        # En haut du tableau, montrer les nouvelles lignes ; sinon garder les mêmes lignes à l'écran
+        if self.table.offset > 0:
+            self.table.offset += added
+        self.table.setRows(columns, rows, keepPosition=True)
+    
+    # Met à jour l'état de la barre de pagination
+    def updatePageStatus(self, hasNewer, hasOlder, message=""):
+        """
+        Args:
+            hasNewer: Des lignes plus récentes que la page affichée existent
+            hasOlder: Des lignes plus anciennes que la page affichée peuvent exister
+            message: Texte affiché à côté des boutons
+        """
+        self.previousPageButton.configure(state="normal" if hasNewer else "disabled")
+        self.nextPageButton.configure(state="normal" if hasOlder else "disabled")
+        self.pageStatus.configure(text=message)
     
     # Met à jour l'affichage du statut de rafraîchissement automatique.
     def updateAutoRefreshStatus(self, isActive=False, interval=0):